@@ -18,6 +18,9 @@ class Settings(BaseSettings):
 
     # http client
     http_timeout: float = 30.0
+    http2_enabled: bool = True  # multiplex concurrent requests on one connection
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
 
     # rate limiting
     rate_limit_enabled: bool = True
@@ -29,6 +32,7 @@ class Settings(BaseSettings):
     # caching
     cache_enabled: bool = True
     cache_ttl: float = 3.0  # seconds
+    exchange_info_cache_ttl: float = 3600.0  # seconds, symbol rules rarely change
 
     # server
     server_name: str = "Crypto Data MCP"
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from datetime import datetime
 
 from crypto_mcp.models import (
+    ExchangeInfoResponse,
     FundingRateResponse,
     KlinesResponse,
     LongShortRatioResponse,
@@ -19,7 +20,6 @@ class BaseExchangeClient(ABC):
     @abstractmethod
     async def get_open_interest(self, symbol: str) -> OpenInterestResponse:
         """Get current open interest for a symbol."""
-        pass
 
     @abstractmethod
     async def get_open_interest_history(
@@ -31,7 +31,6 @@ class BaseExchangeClient(ABC):
         end_time: datetime | None = None,
     ) -> list[OpenInterestResponse]:
         """Get historical open interest."""
-        pass
 
     @abstractmethod
     async def get_funding_rate(
@@ -42,7 +41,6 @@ class BaseExchangeClient(ABC):
         end_time: datetime | None = None,
     ) -> list[FundingRateResponse]:
         """Get funding rate history."""
-        pass
 
     @abstractmethod
     async def get_ticker_24h(
@@ -50,7 +48,6 @@ class BaseExchangeClient(ABC):
         symbol: str | None = None,
     ) -> TickerResponse | list[TickerResponse]:
         """Get 24h ticker statistics."""
-        pass
 
     @abstractmethod
     async def get_klines(
@@ -62,7 +59,6 @@ class BaseExchangeClient(ABC):
         end_time: datetime | None = None,
     ) -> KlinesResponse:
         """Get OHLCV candlestick data."""
-        pass
 
     @abstractmethod
     async def get_mark_price(
@@ -70,7 +66,6 @@ class BaseExchangeClient(ABC):
         symbol: str | None = None,
     ) -> MarkPriceResponse | list[MarkPriceResponse]:
         """Get current mark price and funding info."""
-        pass
 
     @abstractmethod
     async def get_long_short_ratio(
@@ -82,4 +77,7 @@ class BaseExchangeClient(ABC):
         end_time: datetime | None = None,
     ) -> list[LongShortRatioResponse]:
         """Get top trader long/short ratio."""
-        pass
+
+    @abstractmethod
+    async def get_exchange_info(self) -> list[ExchangeInfoResponse]:
+        """Get trading rules and precision for all futures symbols."""
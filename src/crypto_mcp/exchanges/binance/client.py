@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-import json
 from datetime import datetime
 from typing import TYPE_CHECKING
 
 import httpx
+import pydantic_core
 from pydantic import ValidationError as PydanticValidationError
 
 from crypto_mcp.exchanges.base import BaseExchangeClient
@@ -15,6 +15,7 @@ from crypto_mcp.exchanges.base import BaseExchangeClient
 if TYPE_CHECKING:
     from crypto_mcp.utils.rate_limiter import SlidingWindowRateLimiter
 from crypto_mcp.models import (
+    ExchangeInfoResponse,
     FundingRateResponse,
     KlinesResponse,
     LongShortRatioResponse,
@@ -25,6 +26,7 @@ from crypto_mcp.models import (
 
 from .endpoints import (
     BASE_URL,
+    EXCHANGE_INFO,
     FUNDING_RATE,
     KLINES,
     LONG_SHORT_RATIO,
@@ -36,12 +38,15 @@ from .endpoints import (
 from .exceptions import BinanceAPIError, BinanceRateLimitError, raise_for_binance_error
 from .models import (
     BinanceErrorResponse,
-    BinanceFundingRate,
-    BinanceLongShortRatio,
+    BinanceExchangeInfo,
+    BinanceFundingRateList,
+    BinanceLongShortRatioList,
     BinanceMarkPrice,
+    BinanceMarkPriceList,
     BinanceOpenInterest,
-    BinanceOpenInterestHistory,
+    BinanceOpenInterestHistoryList,
     BinanceTicker24h,
+    BinanceTicker24hList,
     parse_kline,
 )
 
@@ -59,11 +64,15 @@ class BinanceClient(BaseExchangeClient):
         self._owns_client = http_client is None
         self._rate_limiter = rate_limiter
         self._max_retries = max_retries
+        # exponential backoff between attempts (1s, 2s, 4s, ...), built once
+        self._retry_delays = tuple(float(2**i) for i in range(max_retries - 1))
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(base_url=BASE_URL, timeout=30.0)
+            self._client = httpx.AsyncClient(
+                base_url=BASE_URL, timeout=30.0, http2=True
+            )
         return self._client
 
     async def close(self) -> None:
@@ -72,8 +81,12 @@ class BinanceClient(BaseExchangeClient):
             await self._client.aclose()
             self._client = None
 
-    async def _request(self, endpoint: str, params: dict | None = None) -> dict | list:
-        """Make GET request to Binance API with rate limiting and retry."""
+    async def _request(self, endpoint: str, params: dict | None = None) -> bytes:
+        """Make GET request to Binance API with rate limiting and retry.
+
+        Returns the raw JSON body so callers can validate it straight into
+        their models with pydantic's JSON parser.
+        """
         # acquire rate limit slot before making request
         if self._rate_limiter:
             await self._rate_limiter.acquire()
@@ -85,10 +98,8 @@ class BinanceClient(BaseExchangeClient):
                 return await self._do_request(endpoint, params)
             except BinanceRateLimitError as e:
                 last_error = e
-                if attempt < self._max_retries - 1:
-                    # exponential backoff: 1s, 2s, 4s
-                    wait_time = 2**attempt
-                    await asyncio.sleep(wait_time)
+                if attempt < len(self._retry_delays):
+                    await asyncio.sleep(self._retry_delays[attempt])
                     # also re-acquire rate limit slot
                     if self._rate_limiter:
                         await self._rate_limiter.acquire()
@@ -96,7 +107,7 @@ class BinanceClient(BaseExchangeClient):
         # all retries exhausted
         raise last_error  # type: ignore[misc]
 
-    async def _do_request(self, endpoint: str, params: dict | None = None) -> dict | list:
+    async def _do_request(self, endpoint: str, params: dict | None = None) -> bytes:
         """Execute the actual HTTP request."""
         client = await self._get_client()
         response = await client.get(endpoint, params=params)
@@ -104,21 +115,28 @@ class BinanceClient(BaseExchangeClient):
         # check HTTP status
         if response.status_code != 200:
             try:
-                error = BinanceErrorResponse.model_validate(response.json())
-                raise_for_binance_error(error.code, error.msg)
-            except (PydanticValidationError, json.JSONDecodeError):
+                error = BinanceErrorResponse.model_validate_json(response.content)
+            except PydanticValidationError:
                 raise BinanceAPIError(
                     f"HTTP {response.status_code}: {response.text}",
                     code=response.status_code,
                 )
+            raise_for_binance_error(error.code, error.msg)
 
-        data = response.json()
+        raw = response.content
 
-        # check for error response in JSON
-        if isinstance(data, dict) and "code" in data and data["code"] < 0:
-            raise_for_binance_error(data["code"], data.get("msg", "Unknown error"))
+        # check for error response in JSON; only objects carrying a "code"
+        # key can be one, so list payloads and regular objects skip the parse
+        if raw.lstrip()[:1] == b"{" and b'"code"' in raw:
+            try:
+                error = BinanceErrorResponse.model_validate_json(raw)
+            except PydanticValidationError:
+                # "code" appears below the top level; not an error envelope
+                return raw
+            if error.code < 0:
+                raise_for_binance_error(error.code, error.msg)
 
-        return data
+        return raw
 
     def _datetime_to_ms(self, dt: datetime | None) -> int | None:
         """Convert datetime to milliseconds timestamp."""
@@ -128,8 +146,8 @@ class BinanceClient(BaseExchangeClient):
 
     async def get_open_interest(self, symbol: str) -> OpenInterestResponse:
         """Get current open interest for a symbol."""
-        data = await self._request(OPEN_INTEREST, {"symbol": symbol})
-        return BinanceOpenInterest.model_validate(data).to_response()
+        raw = await self._request(OPEN_INTEREST, {"symbol": symbol})
+        return BinanceOpenInterest.model_validate_json(raw).to_response()
 
     async def get_open_interest_history(
         self,
@@ -150,10 +168,10 @@ class BinanceClient(BaseExchangeClient):
         if end_time:
             params["endTime"] = self._datetime_to_ms(end_time)
 
-        data = await self._request(OPEN_INTEREST_HISTORY, params)
+        raw = await self._request(OPEN_INTEREST_HISTORY, params)
         return [
-            BinanceOpenInterestHistory.model_validate(item).to_response()
-            for item in data
+            item.to_response()
+            for item in BinanceOpenInterestHistoryList.validate_json(raw)
         ]
 
     async def get_funding_rate(
@@ -172,10 +190,8 @@ class BinanceClient(BaseExchangeClient):
         if end_time:
             params["endTime"] = self._datetime_to_ms(end_time)
 
-        data = await self._request(FUNDING_RATE, params)
-        return [
-            BinanceFundingRate.model_validate(item).to_response() for item in data
-        ]
+        raw = await self._request(FUNDING_RATE, params)
+        return [item.to_response() for item in BinanceFundingRateList.validate_json(raw)]
 
     async def get_ticker_24h(
         self,
@@ -183,11 +199,12 @@ class BinanceClient(BaseExchangeClient):
     ) -> TickerResponse | list[TickerResponse]:
         """Get 24h ticker statistics."""
         params = {"symbol": symbol} if symbol else None
-        data = await self._request(TICKER_24H, params)
+        raw = await self._request(TICKER_24H, params)
 
-        if isinstance(data, list):
-            return [BinanceTicker24h.model_validate(item).to_response() for item in data]
-        return BinanceTicker24h.model_validate(data).to_response()
+        # binance returns a single object when a symbol is given
+        if symbol:
+            return BinanceTicker24h.model_validate_json(raw).to_response()
+        return [item.to_response() for item in BinanceTicker24hList.validate_json(raw)]
 
     async def get_klines(
         self,
@@ -208,7 +225,8 @@ class BinanceClient(BaseExchangeClient):
         if end_time:
             params["endTime"] = self._datetime_to_ms(end_time)
 
-        data = await self._request(KLINES, params)
+        raw = await self._request(KLINES, params)
+        data = pydantic_core.from_json(raw)
         assert isinstance(data, list)
         return parse_kline(data, symbol, interval)
 
@@ -218,11 +236,12 @@ class BinanceClient(BaseExchangeClient):
     ) -> MarkPriceResponse | list[MarkPriceResponse]:
         """Get current mark price and funding info."""
         params = {"symbol": symbol} if symbol else None
-        data = await self._request(MARK_PRICE, params)
+        raw = await self._request(MARK_PRICE, params)
 
-        if isinstance(data, list):
-            return [BinanceMarkPrice.model_validate(item).to_response() for item in data]
-        return BinanceMarkPrice.model_validate(data).to_response()
+        # binance returns a single object when a symbol is given
+        if symbol:
+            return BinanceMarkPrice.model_validate_json(raw).to_response()
+        return [item.to_response() for item in BinanceMarkPriceList.validate_json(raw)]
 
     async def get_long_short_ratio(
         self,
@@ -243,7 +262,12 @@ class BinanceClient(BaseExchangeClient):
         if end_time:
             params["endTime"] = self._datetime_to_ms(end_time)
 
-        data = await self._request(LONG_SHORT_RATIO, params)
+        raw = await self._request(LONG_SHORT_RATIO, params)
         return [
-            BinanceLongShortRatio.model_validate(item).to_response() for item in data
+            item.to_response() for item in BinanceLongShortRatioList.validate_json(raw)
         ]
+
+    async def get_exchange_info(self) -> list[ExchangeInfoResponse]:
+        """Get trading rules and precision for all futures symbols."""
+        raw = await self._request(EXCHANGE_INFO)
+        return BinanceExchangeInfo.model_validate_json(raw).to_responses()
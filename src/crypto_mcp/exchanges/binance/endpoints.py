@@ -24,6 +24,9 @@ MARK_PRICE = "/fapi/v1/premiumIndex"
 # top trader long/short position ratio
 LONG_SHORT_RATIO = "/futures/data/topLongShortPositionRatio"
 
+# trading rules and symbol information
+EXCHANGE_INFO = "/fapi/v1/exchangeInfo"
+
 
 def build_url(endpoint: str) -> str:
     """Build full URL from endpoint path."""
@@ -1,11 +1,13 @@
 """Pydantic models for parsing Binance API responses."""
 
 from decimal import Decimal
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from crypto_mcp.models import (
-    Candle,
+    CANDLE_LIST_ADAPTER,
+    ExchangeInfoResponse,
     FundingRateResponse,
     KlinesResponse,
     LongShortRatioResponse,
@@ -17,6 +19,11 @@ from crypto_mcp.models import (
 EXCHANGE = "binance"
 
 
+# raw payloads are validated once by the Binance models below; their
+# to_response() methods only rename already-typed fields, so the unified
+# models are built with model_construct() to skip a second validation pass
+
+
 class BinanceOpenInterest(BaseModel):
     """Binance open interest response."""
 
@@ -25,7 +32,7 @@ class BinanceOpenInterest(BaseModel):
     time: int
 
     def to_response(self) -> OpenInterestResponse:
-        return OpenInterestResponse(
+        return OpenInterestResponse.model_construct(
             symbol=self.symbol,
             open_interest=self.openInterest,
             timestamp=self.time,
@@ -42,11 +49,12 @@ class BinanceOpenInterestHistory(BaseModel):
     timestamp: int
 
     def to_response(self) -> OpenInterestResponse:
-        return OpenInterestResponse(
+        return OpenInterestResponse.model_construct(
             symbol=self.symbol,
             open_interest=self.sumOpenInterest,
             timestamp=self.timestamp,
             exchange=EXCHANGE,
+            open_interest_value=self.sumOpenInterestValue,
         )
 
 
@@ -59,7 +67,7 @@ class BinanceFundingRate(BaseModel):
     markPrice: Decimal | None = None
 
     def to_response(self) -> FundingRateResponse:
-        return FundingRateResponse(
+        return FundingRateResponse.model_construct(
             symbol=self.symbol,
             funding_rate=self.fundingRate,
             funding_time=self.fundingTime,
@@ -85,7 +93,7 @@ class BinanceTicker24h(BaseModel):
     count: int
 
     def to_response(self) -> TickerResponse:
-        return TickerResponse(
+        return TickerResponse.model_construct(
             symbol=self.symbol,
             price_change=self.priceChange,
             price_change_percent=self.priceChangePercent,
@@ -111,19 +119,22 @@ class BinanceMarkPrice(BaseModel):
     lastFundingRate: Decimal
     nextFundingTime: int
 
-    # additional fields we don't use but may be in response
+    # extended fields, passed through when present
     estimatedSettlePrice: Decimal | None = None
     interestRate: Decimal | None = None
     time: int | None = None
 
     def to_response(self) -> MarkPriceResponse:
-        return MarkPriceResponse(
+        return MarkPriceResponse.model_construct(
             symbol=self.symbol,
             mark_price=self.markPrice,
             index_price=self.indexPrice,
             last_funding_rate=self.lastFundingRate,
             next_funding_time=self.nextFundingTime,
             exchange=EXCHANGE,
+            estimated_settle_price=self.estimatedSettlePrice,
+            interest_rate=self.interestRate,
+            timestamp=self.time,
         )
 
 
@@ -137,7 +148,7 @@ class BinanceLongShortRatio(BaseModel):
     timestamp: int
 
     def to_response(self) -> LongShortRatioResponse:
-        return LongShortRatioResponse(
+        return LongShortRatioResponse.model_construct(
             symbol=self.symbol,
             long_short_ratio=self.longShortRatio,
             long_account=self.longAccount,
@@ -147,6 +158,65 @@ class BinanceLongShortRatio(BaseModel):
         )
 
 
+class BinanceSymbolInfo(BaseModel):
+    """Single symbol entry from the Binance exchange info response."""
+
+    symbol: str
+    pricePrecision: int
+    quantityPrecision: int
+    baseAsset: str
+    quoteAsset: str
+    filters: list[dict[str, Any]]
+
+    def _filter(self, filter_type: str) -> dict[str, Any]:
+        return next((f for f in self.filters if f.get("filterType") == filter_type), {})
+
+    def to_response(self) -> ExchangeInfoResponse:
+        min_notional = self._filter("MIN_NOTIONAL").get("notional")
+        return ExchangeInfoResponse.model_construct(
+            symbol=self.symbol,
+            price_precision=self.pricePrecision,
+            quantity_precision=self.quantityPrecision,
+            base_asset=self.baseAsset,
+            quote_asset=self.quoteAsset,
+            tick_size=Decimal(self._filter("PRICE_FILTER").get("tickSize", "0")),
+            step_size=Decimal(self._filter("LOT_SIZE").get("stepSize", "0")),
+            min_notional=Decimal(min_notional) if min_notional is not None else None,
+            exchange=EXCHANGE,
+        )
+
+
+class BinanceExchangeInfo(BaseModel):
+    """Binance exchange info response (symbols only)."""
+
+    symbols: list[BinanceSymbolInfo]
+
+    def to_responses(self) -> list[ExchangeInfoResponse]:
+        return [s.to_response() for s in self.symbols]
+
+
+# adapters for endpoints that return a bare JSON array; validate_json()
+# parses the raw response body without building intermediate dicts
+BinanceOpenInterestHistoryList = TypeAdapter(list[BinanceOpenInterestHistory])
+BinanceFundingRateList = TypeAdapter(list[BinanceFundingRate])
+BinanceTicker24hList = TypeAdapter(list[BinanceTicker24h])
+BinanceMarkPriceList = TypeAdapter(list[BinanceMarkPrice])
+BinanceLongShortRatioList = TypeAdapter(list[BinanceLongShortRatio])
+
+
+_KLINE_FIELDS = (
+    "open_time",
+    "open",
+    "high",
+    "low",
+    "close",
+    "volume",
+    "close_time",
+    "quote_volume",
+    "trade_count",
+)
+
+
 def parse_kline(data: list, symbol: str, interval: str) -> KlinesResponse:
     """Parse Binance kline array response into KlinesResponse.
 
@@ -165,22 +235,11 @@ def parse_kline(data: list, symbol: str, interval: str) -> KlinesResponse:
         taker_buy_quote # 10 (not used)
     ]
     """
-    candles = []
-    for k in data:
-        candles.append(
-            Candle(
-                open_time=k[0],
-                open=Decimal(k[1]),
-                high=Decimal(k[2]),
-                low=Decimal(k[3]),
-                close=Decimal(k[4]),
-                volume=Decimal(k[5]),
-                close_time=k[6],
-                quote_volume=Decimal(k[7]),
-                trade_count=k[8],
-            )
-        )
-    return KlinesResponse(
+    # zip() drops the unused taker fields past trade_count
+    candles = CANDLE_LIST_ADAPTER.validate_python(
+        [dict(zip(_KLINE_FIELDS, k)) for k in data]
+    )
+    return KlinesResponse.model_construct(
         symbol=symbol,
         interval=interval,
         candles=candles,
@@ -192,4 +251,4 @@ class BinanceErrorResponse(BaseModel):
     """Binance API error response."""
 
     code: int
-    msg: str
+    msg: str = "Unknown error"
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import httpx
 from pydantic import ValidationError as PydanticValidationError
@@ -15,6 +15,7 @@ from crypto_mcp.exchanges.base import BaseExchangeClient
 if TYPE_CHECKING:
     from crypto_mcp.utils.rate_limiter import SlidingWindowRateLimiter
 from crypto_mcp.models import (
+    ExchangeInfoResponse,
     FundingRateResponse,
     KlinesResponse,
     LongShortRatioResponse,
@@ -26,6 +27,7 @@ from crypto_mcp.models import (
 from .endpoints import (
     BASE_URL,
     FUNDING_RATE_HISTORY,
+    INSTRUMENTS_INFO,
     KLINES,
     LONG_SHORT_RATIO,
     OPEN_INTEREST,
@@ -37,6 +39,7 @@ from .exceptions import BybitAPIError, BybitRateLimitError, raise_for_bybit_erro
 from .models import (
     BybitErrorResponse,
     BybitFundingRateResponse,
+    BybitInstrumentsResponse,
     BybitKlineResponse,
     BybitLongShortRatioResponse,
     BybitOpenInterestResponse,
@@ -57,11 +60,15 @@ class BybitClient(BaseExchangeClient):
         self._owns_client = http_client is None
         self._rate_limiter = rate_limiter
         self._max_retries = max_retries
+        # exponential backoff between attempts (1s, 2s, 4s, ...), built once
+        self._retry_delays = tuple(float(2**i) for i in range(max_retries - 1))
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create HTTP client."""
         if self._client is None:
-            self._client = httpx.AsyncClient(base_url=BASE_URL, timeout=30.0)
+            self._client = httpx.AsyncClient(
+                base_url=BASE_URL, timeout=30.0, http2=True
+            )
         return self._client
 
     async def close(self) -> None:
@@ -83,10 +90,8 @@ class BybitClient(BaseExchangeClient):
                 return await self._do_request(endpoint, params)
             except BybitRateLimitError as e:
                 last_error = e
-                if attempt < self._max_retries - 1:
-                    # exponential backoff: 1s, 2s, 4s
-                    wait_time = 2**attempt
-                    await asyncio.sleep(wait_time)
+                if attempt < len(self._retry_delays):
+                    await asyncio.sleep(self._retry_delays[attempt])
                     # also re-acquire rate limit slot
                     if self._rate_limiter:
                         await self._rate_limiter.acquire()
@@ -280,3 +285,22 @@ class BybitClient(BaseExchangeClient):
         data = await self._request(LONG_SHORT_RATIO, params)
         response = BybitLongShortRatioResponse.model_validate(data)
         return response.to_responses()
+
+    async def get_exchange_info(self) -> list[ExchangeInfoResponse]:
+        """Get trading rules and precision for all linear symbols.
+
+        Bybit paginates instruments info, so pages are followed by cursor.
+        """
+        params: dict[str, Any] = {"category": "linear", "limit": 1000}
+        responses: list[ExchangeInfoResponse] = []
+
+        while True:
+            data = await self._request(INSTRUMENTS_INFO, params)
+            response = BybitInstrumentsResponse.model_validate(data)
+            responses.extend(response.to_responses())
+            cursor = response.result.nextPageCursor
+            # an empty cursor ends the listing; a repeated one would refetch
+            # the same page forever
+            if not cursor or cursor == params.get("cursor"):
+                return responses
+            params["cursor"] = cursor
@@ -8,6 +8,7 @@ TICKERS = "/v5/market/tickers"
 OPEN_INTEREST = "/v5/market/open-interest"
 FUNDING_RATE_HISTORY = "/v5/market/funding/history"
 LONG_SHORT_RATIO = "/v5/market/account-ratio"
+INSTRUMENTS_INFO = "/v5/market/instruments-info"
 
 # interval mapping: binance format -> bybit format
 INTERVAL_MAP = {
@@ -5,7 +5,8 @@ from decimal import Decimal
 from pydantic import BaseModel
 
 from crypto_mcp.models import (
-    Candle,
+    CANDLE_LIST_ADAPTER,
+    ExchangeInfoResponse,
     FundingRateResponse,
     KlinesResponse,
     LongShortRatioResponse,
@@ -157,6 +158,7 @@ class BybitTickerResponse(BybitBaseResponse):
                     open_interest=Decimal(item.openInterest),
                     timestamp=self.time or 0,
                     exchange=EXCHANGE,
+                    open_interest_value=Decimal(item.openInterestValue),
                 )
             )
         return responses
@@ -281,25 +283,27 @@ class BybitKlineResponse(BybitBaseResponse):
         ]
 
         Note: Bybit doesn't provide trade_count or close_time.
+
+        Candles are validated as one batch, so the wrapper skips validation.
         """
-        candles = []
         # bybit returns in reverse chronological order, so reverse
-        for k in reversed(self.result.list):
-            open_time = int(k[0])
-            candles.append(
-                Candle(
-                    open_time=open_time,
-                    open=Decimal(k[1]),
-                    high=Decimal(k[2]),
-                    low=Decimal(k[3]),
-                    close=Decimal(k[4]),
-                    volume=Decimal(k[5]),
-                    close_time=open_time,  # bybit doesn't provide close_time
-                    quote_volume=Decimal(k[6]),
-                    trade_count=0,  # bybit doesn't provide this
-                )
-            )
-        return KlinesResponse(
+        candles = CANDLE_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "open_time": k[0],
+                    "open": k[1],
+                    "high": k[2],
+                    "low": k[3],
+                    "close": k[4],
+                    "volume": k[5],
+                    "close_time": k[0],  # bybit doesn't provide close_time
+                    "quote_volume": k[6],
+                    "trade_count": 0,  # bybit doesn't provide this
+                }
+                for k in reversed(self.result.list)
+            ]
+        )
+        return KlinesResponse.model_construct(
             symbol=self.result.symbol,
             interval=interval,
             candles=candles,
@@ -307,6 +311,74 @@ class BybitKlineResponse(BybitBaseResponse):
         )
 
 
+# instruments info models
+
+
+class BybitPriceFilter(BaseModel):
+    """Price filter of a linear instrument."""
+
+    tickSize: str
+
+
+class BybitLotSizeFilter(BaseModel):
+    """Lot size filter of a linear instrument."""
+
+    qtyStep: str
+    minNotionalValue: str | None = None
+
+
+class BybitInstrumentItem(BaseModel):
+    """Single linear instrument."""
+
+    symbol: str
+    baseCoin: str
+    quoteCoin: str
+    priceScale: str
+    priceFilter: BybitPriceFilter
+    lotSizeFilter: BybitLotSizeFilter
+
+
+class BybitInstrumentsResult(BaseModel):
+    """Instruments info result wrapper."""
+
+    category: str
+    list: list[BybitInstrumentItem]
+    nextPageCursor: str = ""
+
+
+class BybitInstrumentsResponse(BybitBaseResponse):
+    """Instruments info API response."""
+
+    result: BybitInstrumentsResult
+
+    def to_responses(self) -> list[ExchangeInfoResponse]:
+        """Convert to unified response format.
+
+        Bybit has no quantity precision field, so it is derived from the
+        number of decimals in qtyStep.
+        """
+        responses = []
+        for item in self.result.list:
+            step_size = Decimal(item.lotSizeFilter.qtyStep)
+            # NaN/infinite steps carry a string exponent and no decimals
+            exponent = step_size.normalize().as_tuple().exponent
+            min_notional = item.lotSizeFilter.minNotionalValue
+            responses.append(
+                ExchangeInfoResponse(
+                    symbol=item.symbol,
+                    price_precision=int(item.priceScale),
+                    quantity_precision=max(0, -exponent) if isinstance(exponent, int) else 0,
+                    base_asset=item.baseCoin,
+                    quote_asset=item.quoteCoin,
+                    tick_size=Decimal(item.priceFilter.tickSize),
+                    step_size=step_size,
+                    min_notional=Decimal(min_notional) if min_notional else None,
+                    exchange=EXCHANGE,
+                )
+            )
+        return responses
+
+
 class BybitErrorResponse(BaseModel):
     """Bybit API error response."""
 
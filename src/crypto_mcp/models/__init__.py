@@ -2,7 +2,9 @@
 
 from crypto_mcp.models.common import ValidInterval, ValidPeriod
 from crypto_mcp.models.responses import (
+    CANDLE_LIST_ADAPTER,
     Candle,
+    ExchangeInfoResponse,
     FundingRateResponse,
     KlinesResponse,
     LongShortRatioResponse,
@@ -12,7 +14,9 @@ from crypto_mcp.models.responses import (
 )
 
 __all__ = [
+    "CANDLE_LIST_ADAPTER",
     "Candle",
+    "ExchangeInfoResponse",
     "FundingRateResponse",
     "KlinesResponse",
     "LongShortRatioResponse",
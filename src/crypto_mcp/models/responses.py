@@ -2,16 +2,19 @@
 
 from decimal import Decimal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class OpenInterestResponse(BaseModel):
     """Open interest for a futures symbol."""
 
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     open_interest: Decimal
     timestamp: int
     exchange: str
+    open_interest_value: Decimal | None = None  # USD notional, when provided
 
 
 class FundingRateResponse(BaseModel):
@@ -56,6 +59,11 @@ class Candle(BaseModel):
     trade_count: int
 
 
+# validates a whole batch of candles in one pydantic-core call; build once
+# at import, never per request
+CANDLE_LIST_ADAPTER: TypeAdapter[list[Candle]] = TypeAdapter(list[Candle])
+
+
 class KlinesResponse(BaseModel):
     """Kline/candlestick data response."""
 
@@ -68,12 +76,18 @@ class KlinesResponse(BaseModel):
 class MarkPriceResponse(BaseModel):
     """Mark price and funding info."""
 
+    model_config = ConfigDict(frozen=True)
+
     symbol: str
     mark_price: Decimal
     index_price: Decimal
     last_funding_rate: Decimal
     next_funding_time: int
     exchange: str
+    # extended fields, None when the exchange doesn't provide them
+    estimated_settle_price: Decimal | None = None
+    interest_rate: Decimal | None = None
+    timestamp: int | None = None
 
 
 class LongShortRatioResponse(BaseModel):
@@ -85,3 +99,17 @@ class LongShortRatioResponse(BaseModel):
     short_account: Decimal
     timestamp: int
     exchange: str
+
+
+class ExchangeInfoResponse(BaseModel):
+    """Trading rules and precision for a futures symbol."""
+
+    symbol: str
+    price_precision: int
+    quantity_precision: int
+    base_asset: str
+    quote_asset: str
+    tick_size: Decimal
+    step_size: Decimal
+    min_notional: Decimal | None = None
+    exchange: str
@@ -40,14 +40,25 @@ async def lifespan(server: FastMCP) -> AsyncIterator[None]:
         enabled=settings.cache_enabled,
     )
 
+    # concurrent batch requests share one multiplexed HTTP/2 connection
+    # per exchange instead of opening a TCP+TLS socket each
+    limits = httpx.Limits(
+        max_connections=settings.max_connections,
+        max_keepalive_connections=settings.max_keepalive_connections,
+    )
+
     # create separate HTTP clients for each exchange
     async with httpx.AsyncClient(
         base_url=settings.binance_futures_base_url or BINANCE_BASE_URL,
         timeout=settings.http_timeout,
+        http2=settings.http2_enabled,
+        limits=limits,
     ) as binance_http:
         async with httpx.AsyncClient(
             base_url=settings.bybit_futures_base_url or BYBIT_BASE_URL,
             timeout=settings.http_timeout,
+            http2=settings.http2_enabled,
+            limits=limits,
         ) as bybit_http:
             # create exchange clients with rate limiters
             clients = {
@@ -62,7 +73,9 @@ async def lifespan(server: FastMCP) -> AsyncIterator[None]:
                     max_retries=settings.rate_limit_max_retries,
                 ),
             }
-            register_all_tools(server, clients, cache)
+            register_all_tools(
+                server, clients, cache, settings.exchange_info_cache_ttl
+            )
             yield
 
 
@@ -10,6 +10,7 @@ from crypto_mcp.utils.cache import TTLCache
 
 from ._utils import SUPPORTED_EXCHANGES, get_client
 from .derived_metrics import register_derived_metrics_tools
+from .exchange_info import register_exchange_info_tools
 from .funding_rate import register_funding_rate_tools
 from .klines import register_klines_tools
 from .long_short_ratio import register_long_short_ratio_tools
@@ -23,6 +24,7 @@ def register_all_tools(
     mcp: FastMCP,
     clients: dict[str, BaseExchangeClient],
     cache: TTLCache | None = None,
+    exchange_info_ttl: float = 3600.0,
 ) -> None:
     """Register all MCP tools with the server.
 
@@ -30,6 +32,7 @@ def register_all_tools(
         mcp: FastMCP server instance
         clients: Dict mapping exchange names to client instances
         cache: Optional TTLCache for response caching
+        exchange_info_ttl: Seconds to keep the exchange info snapshot (default: 1h)
     """
     # tools with caching
     register_open_interest_tools(mcp, clients, cache)
@@ -45,5 +48,8 @@ def register_all_tools(
     # derived metrics (calculations based on other data)
     register_derived_metrics_tools(mcp, clients)
 
+    # reference data (long-lived snapshot, own ttl)
+    register_exchange_info_tools(mcp, clients, exchange_info_ttl)
+
 
 __all__ = ["register_all_tools", "get_client", "SUPPORTED_EXCHANGES"]
@@ -1,7 +1,15 @@
 """Utility functions for tools module."""
 
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel
+
 from crypto_mcp.exchanges.base import BaseExchangeClient
 from crypto_mcp.exceptions import ValidationError
+from crypto_mcp.models import KlinesResponse
 
 
 SUPPORTED_EXCHANGES = ["binance", "bybit"]
@@ -30,3 +38,49 @@ def get_client(
             f"Unknown exchange: {exchange}. Supported: {', '.join(SUPPORTED_EXCHANGES)}"
         )
     return client
+
+
+@lru_cache(maxsize=1024)
+def _parse_iso_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def parse_time(value: str | None) -> datetime | None:
+    """Parse an optional ISO format time parameter.
+
+    Clients tend to resend the same time window, so parsed values are cached
+    (datetimes are immutable and safe to share).
+
+    Args:
+        value: Time in ISO format (e.g., 2024-01-01T00:00:00), or None
+
+    Returns:
+        Parsed datetime, or None if no value was given
+    """
+    return _parse_iso_datetime(value) if value else None
+
+
+def dump_response(model: BaseModel) -> dict[str, Any]:
+    """Dump a flat response model to a JSON-compatible dict.
+
+    Same output as model.model_dump(mode="json") for models whose fields are
+    plain str/int/None or Decimal, built directly from the field values
+    instead of going through pydantic's generic serializer.
+
+    Args:
+        model: Response model without nested models
+
+    Returns:
+        Dict with Decimal values rendered as strings
+    """
+    return {k: str(v) if type(v) is Decimal else v for k, v in model.__dict__.items()}
+
+
+def dump_klines(result: KlinesResponse) -> dict[str, Any]:
+    """Dump a klines response, including its candles, to a JSON-compatible dict."""
+    return {
+        "symbol": result.symbol,
+        "interval": result.interval,
+        "candles": [dump_response(c) for c in result.candles],
+        "exchange": result.exchange,
+    }
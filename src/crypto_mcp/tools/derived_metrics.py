@@ -1,13 +1,19 @@
 """MCP tool for derived metrics calculations."""
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from decimal import Decimal
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from crypto_mcp.exceptions import ValidationError
 from crypto_mcp.exchanges.base import BaseExchangeClient
+from crypto_mcp.models import FundingRateResponse, KlinesResponse, OpenInterestResponse
 from crypto_mcp.tools._utils import get_client
 
+VALID_METRICS = frozenset({"vwap", "funding_trend", "oi_change_rate", "price_oi_divergence"})
+
 
 def register_derived_metrics_tools(
     mcp: FastMCP,
@@ -39,52 +45,74 @@ def register_derived_metrics_tools(
 
         Returns:
             Dict containing only the requested metrics
-        """
-        client = get_client(clients, exchange)
-        normalized_symbol = symbol.upper()
-        result: dict[str, Any] = {}
-
-        if "vwap" in metrics:
-            result["vwap"] = await _calculate_vwap(
-                client, normalized_symbol, vwap_period
-            )
-
-        if "funding_trend" in metrics:
-            result["funding_trend"] = await _calculate_funding_trend(
-                client, normalized_symbol
-            )
-
-        if "oi_change_rate" in metrics:
-            result["oi_change_rate"] = await _calculate_oi_change_rate(
-                client, normalized_symbol
-            )
 
-        if "price_oi_divergence" in metrics:
-            result["price_oi_divergence"] = await _calculate_price_oi_divergence(
-                client, normalized_symbol
+        Raises:
+            ValidationError: If an unknown metric is requested
+        """
+        unknown = set(metrics) - VALID_METRICS
+        if unknown:
+            raise ValidationError(
+                f"Unknown metrics: {', '.join(sorted(unknown))}. "
+                f"Supported: {', '.join(sorted(VALID_METRICS))}"
             )
 
-        return result
-
-
-async def _calculate_vwap(
-    client: BaseExchangeClient,
-    symbol: str,
-    interval: str,
-) -> Decimal:
+        client = get_client(clients, exchange)
+        normalized_symbol = symbol.upper()
+        requested = list(dict.fromkeys(metrics))
+
+        # identical upstream requests (e.g. 1h klines for both vwap and
+        # divergence) are fetched once; distinct ones run concurrently
+        sources: dict[str, tuple[Callable[..., Awaitable[Any]], tuple[str, ...]]] = {
+            "klines": (_fetch_klines, (vwap_period,)),
+            "hourly_klines": (_fetch_klines, ("1h",)),
+            "funding_rates": (_fetch_funding_rates, ()),
+            "oi_history": (_fetch_oi_history, ()),
+        }
+        needed = list(
+            dict.fromkeys(sources[dep] for m in requested for dep in _METRIC_DEPS[m])
+        )
+        data = await asyncio.gather(
+            *(fetch(client, normalized_symbol, *args) for fetch, args in needed)
+        )
+        fetched = dict(zip(needed, data))
+
+        return {
+            m: _CALCULATORS[m](*(fetched[sources[dep]] for dep in _METRIC_DEPS[m]))
+            for m in requested
+        }
+
+
+async def _fetch_klines(
+    client: BaseExchangeClient, symbol: str, interval: str
+) -> KlinesResponse:
+    """Fetch the last day of klines at the given interval."""
+    return await client.get_klines(symbol=symbol, interval=interval, limit=24)
+
+
+async def _fetch_funding_rates(
+    client: BaseExchangeClient, symbol: str
+) -> list[FundingRateResponse]:
+    """Fetch the recent funding rate history."""
+    return await client.get_funding_rate(symbol=symbol, limit=10)
+
+
+async def _fetch_oi_history(
+    client: BaseExchangeClient, symbol: str
+) -> list[OpenInterestResponse]:
+    """Fetch the last day of hourly open interest."""
+    return await client.get_open_interest_history(symbol=symbol, period="1h", limit=24)
+
+
+def _calculate_vwap(klines: KlinesResponse) -> Decimal:
     """Calculate Volume Weighted Average Price.
 
     VWAP = sum(price * volume) / sum(volume)
     Using quote_volume as price*volume proxy from klines.
     """
-    klines = await client.get_klines(symbol=symbol, interval=interval, limit=24)
-
-    total_quote_volume = Decimal("0")
-    total_volume = Decimal("0")
+    candles = klines.candles
 
-    for candle in klines.candles:
-        total_quote_volume += candle.quote_volume
-        total_volume += candle.volume
+    total_quote_volume = sum((c.quote_volume for c in candles), Decimal("0"))
+    total_volume = sum((c.volume for c in candles), Decimal("0"))
 
     if total_volume == 0:
         return Decimal("0")
@@ -93,33 +121,19 @@ async def _calculate_vwap(
     return vwap.quantize(Decimal("0.01"))
 
 
-async def _calculate_funding_trend(
-    client: BaseExchangeClient,
-    symbol: str,
-) -> dict:
+def _calculate_funding_trend(funding_rates: list[FundingRateResponse]) -> dict:
     """Analyze funding rate trend.
 
     Returns direction (bullish/bearish/neutral) and strength.
     """
-    funding_rates = await client.get_funding_rate(symbol=symbol, limit=10)
-
     if len(funding_rates) < 2:
         return {"direction": "neutral", "strength": Decimal("0")}
 
-    # sort by funding_time to ensure chronological order
-    sorted_rates = sorted(funding_rates, key=lambda x: x.funding_time)
-    rates = [fr.funding_rate for fr in sorted_rates]
-
-    # calculate average change between consecutive rates
-    changes = []
-    for i in range(1, len(rates)):
-        change = rates[i] - rates[i - 1]
-        changes.append(change)
-
-    if not changes:
-        return {"direction": "neutral", "strength": Decimal("0")}
-
-    avg_change = sum(changes, Decimal("0")) / len(changes)
+    # average change between consecutive rates telescopes to
+    # (newest - oldest) / (n - 1), so only the endpoints are needed
+    oldest = min(funding_rates, key=lambda x: x.funding_time).funding_rate
+    newest = max(funding_rates, key=lambda x: x.funding_time).funding_rate
+    avg_change = (newest - oldest) / (len(funding_rates) - 1)
 
     # determine direction
     threshold = Decimal("0.00001")  # 0.001%
@@ -141,25 +155,17 @@ async def _calculate_funding_trend(
     }
 
 
-async def _calculate_oi_change_rate(
-    client: BaseExchangeClient,
-    symbol: str,
-) -> Decimal:
+def _calculate_oi_change_rate(oi_history: list[OpenInterestResponse]) -> Decimal:
     """Calculate open interest percentage change.
 
     Returns % change between oldest and newest OI values.
     """
-    oi_history = await client.get_open_interest_history(
-        symbol=symbol, period="1h", limit=24
-    )
-
     if len(oi_history) < 2:
         return Decimal("0")
 
-    # sort by timestamp to ensure chronological order
-    sorted_oi = sorted(oi_history, key=lambda x: x.timestamp)
-    oldest_oi = sorted_oi[0].open_interest
-    newest_oi = sorted_oi[-1].open_interest
+    # only the endpoints matter, so pick them without sorting the history
+    oldest_oi = min(oi_history, key=lambda x: x.timestamp).open_interest
+    newest_oi = max(oi_history, key=lambda x: x.timestamp).open_interest
 
     if oldest_oi == 0:
         return Decimal("0")
@@ -168,38 +174,27 @@ async def _calculate_oi_change_rate(
     return change_rate.quantize(Decimal("0.1"))
 
 
-async def _calculate_price_oi_divergence(
-    client: BaseExchangeClient,
-    symbol: str,
+def _calculate_price_oi_divergence(
+    klines: KlinesResponse,
+    oi_history: list[OpenInterestResponse],
 ) -> dict:
     """Detect price-OI divergence.
 
     Bearish divergence: price up, OI down (weak rally, shorts closing)
     Bullish divergence: price down, OI up (accumulation during dip)
     """
-    # get price data
-    klines = await client.get_klines(symbol=symbol, interval="1h", limit=24)
-
-    # get OI data
-    oi_history = await client.get_open_interest_history(
-        symbol=symbol, period="1h", limit=24
-    )
-
     if len(klines.candles) < 2 or len(oi_history) < 2:
         return {"detected": False, "type": None}
 
     # calculate price change (oldest to newest)
-    # sort klines by open_time to ensure chronological order
-    sorted_candles = sorted(klines.candles, key=lambda x: x.open_time)
-    oldest_price = sorted_candles[0].close
-    newest_price = sorted_candles[-1].close
+    # pick oldest/newest by open_time rather than sorting all candles
+    oldest_price = min(klines.candles, key=lambda x: x.open_time).close
+    newest_price = max(klines.candles, key=lambda x: x.open_time).close
     price_change_pct = ((newest_price - oldest_price) / oldest_price) * 100
 
     # calculate OI change
-    # sort by timestamp to ensure chronological order
-    sorted_oi = sorted(oi_history, key=lambda x: x.timestamp)
-    oldest_oi = sorted_oi[0].open_interest
-    newest_oi = sorted_oi[-1].open_interest
+    oldest_oi = min(oi_history, key=lambda x: x.timestamp).open_interest
+    newest_oi = max(oi_history, key=lambda x: x.timestamp).open_interest
     oi_change_pct = ((newest_oi - oldest_oi) / oldest_oi) * 100
 
     # detect divergence
@@ -216,3 +211,19 @@ async def _calculate_price_oi_divergence(
         return {"detected": True, "type": "bullish"}
     else:
         return {"detected": False, "type": None}
+
+
+# upstream data each metric is computed from, in argument order
+_METRIC_DEPS: dict[str, tuple[str, ...]] = {
+    "vwap": ("klines",),
+    "funding_trend": ("funding_rates",),
+    "oi_change_rate": ("oi_history",),
+    "price_oi_divergence": ("hourly_klines", "oi_history"),
+}
+
+_CALCULATORS: dict[str, Callable[..., Any]] = {
+    "vwap": _calculate_vwap,
+    "funding_trend": _calculate_funding_trend,
+    "oi_change_rate": _calculate_oi_change_rate,
+    "price_oi_divergence": _calculate_price_oi_divergence,
+}
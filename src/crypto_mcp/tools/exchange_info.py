@@ -0,0 +1,69 @@
+"""MCP tool for exchange trading rules and symbol information."""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+from mcp.server.fastmcp import FastMCP
+
+from crypto_mcp.exceptions import SymbolNotFoundError
+from crypto_mcp.exchanges.base import BaseExchangeClient
+from crypto_mcp.tools._utils import get_client
+from crypto_mcp.utils.cache import TTLCache
+
+
+def register_exchange_info_tools(
+    mcp: FastMCP,
+    clients: dict[str, BaseExchangeClient],
+    ttl: float = 3600.0,
+) -> None:
+    """Register exchange info tools with the MCP server.
+
+    The full symbol list of each exchange is fetched at most once per ttl
+    and kept as a read-only mapping, so per-symbol lookups never go upstream.
+    """
+    # exchange -> read-only symbol -> info mapping
+    snapshots = TTLCache(ttl=ttl)
+
+    async def load_symbols(exchange: str) -> Mapping[str, dict[str, Any]]:
+        client = get_client(clients, exchange)
+
+        async def fetch() -> Mapping[str, dict[str, Any]]:
+            infos = await client.get_exchange_info()
+            return MappingProxyType(
+                {info.symbol: info.model_dump(mode="json") for info in infos}
+            )
+
+        # concurrent misses share one upstream fetch
+        return await snapshots.get_or_compute(exchange, fetch)
+
+    @mcp.tool()
+    async def get_exchange_info(
+        symbol: str | None = None,
+        exchange: str = "binance",
+    ) -> dict[str, Any] | list[dict[str, Any]]:
+        """Get trading rules and precision for futures symbols.
+
+        Returns price/quantity precision, tick size, step size and minimum
+        order notional. Symbol rules rarely change, so results are cached.
+
+        Args:
+            symbol: Trading pair symbol (e.g., BTCUSDT). If None, returns all symbols.
+            exchange: Exchange to query ("binance" or "bybit", default: binance)
+
+        Returns:
+            Symbol trading rules. Returns a list if no symbol specified.
+
+        Raises:
+            SymbolNotFoundError: If the symbol is not listed on the exchange
+        """
+        exchange = exchange.lower()
+        symbols = await load_symbols(exchange)
+
+        if symbol is None:
+            return list(symbols.values())
+
+        info = symbols.get(symbol.upper())
+        if info is None:
+            raise SymbolNotFoundError(exchange, f"Unknown symbol: {symbol.upper()}")
+        return info
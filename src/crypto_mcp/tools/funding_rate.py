@@ -1,12 +1,11 @@
 """MCP tool for funding rate data."""
 
 import asyncio
-from datetime import datetime
 
 from mcp.server.fastmcp import FastMCP
 
 from crypto_mcp.exchanges.base import BaseExchangeClient
-from crypto_mcp.tools._utils import get_client
+from crypto_mcp.tools._utils import get_client, parse_time
 
 
 def register_funding_rate_tools(
@@ -42,8 +41,8 @@ def register_funding_rate_tools(
         client = get_client(clients, exchange)
 
         # parse datetime strings if provided
-        start_dt = datetime.fromisoformat(start_time) if start_time else None
-        end_dt = datetime.fromisoformat(end_time) if end_time else None
+        start_dt = parse_time(start_time)
+        end_dt = parse_time(end_time)
 
         result = await client.get_funding_rate(
             symbol=symbol.upper() if symbol else None,
@@ -77,8 +76,8 @@ def register_funding_rate_tools(
             Dict mapping each symbol to its list of funding rate records
         """
         client = get_client(clients, exchange)
-        start_dt = datetime.fromisoformat(start_time) if start_time else None
-        end_dt = datetime.fromisoformat(end_time) if end_time else None
+        start_dt = parse_time(start_time)
+        end_dt = parse_time(end_time)
 
         async def fetch_one(sym: str) -> tuple[str, list[dict]]:
             result = await client.get_funding_rate(
@@ -1,13 +1,12 @@
 """MCP tool for klines (candlestick) data."""
 
 import asyncio
-from datetime import datetime
 
 from mcp.server.fastmcp import FastMCP
 
 from crypto_mcp.exchanges.base import BaseExchangeClient
 from crypto_mcp.models.common import ValidInterval
-from crypto_mcp.tools._utils import get_client
+from crypto_mcp.tools._utils import dump_klines, get_client, parse_time
 
 
 def register_klines_tools(
@@ -48,8 +47,8 @@ def register_klines_tools(
         normalized_interval = ValidInterval.validate(interval)
 
         # parse datetime strings if provided
-        start_dt = datetime.fromisoformat(start_time) if start_time else None
-        end_dt = datetime.fromisoformat(end_time) if end_time else None
+        start_dt = parse_time(start_time)
+        end_dt = parse_time(end_time)
 
         result = await client.get_klines(
             symbol=symbol.upper(),
@@ -58,7 +57,7 @@ def register_klines_tools(
             start_time=start_dt,
             end_time=end_dt,
         )
-        return result.model_dump(mode="json")
+        return dump_klines(result)
 
     @mcp.tool()
     async def get_klines_batch(
@@ -89,8 +88,8 @@ def register_klines_tools(
         client = get_client(clients, exchange)
         normalized_interval = ValidInterval.validate(interval)
 
-        start_dt = datetime.fromisoformat(start_time) if start_time else None
-        end_dt = datetime.fromisoformat(end_time) if end_time else None
+        start_dt = parse_time(start_time)
+        end_dt = parse_time(end_time)
 
         async def fetch_one(sym: str) -> tuple[str, dict]:
             result = await client.get_klines(
@@ -100,7 +99,7 @@ def register_klines_tools(
                 start_time=start_dt,
                 end_time=end_dt,
             )
-            return sym.upper(), result.model_dump(mode="json")
+            return sym.upper(), dump_klines(result)
 
         results = await asyncio.gather(*[fetch_one(s) for s in symbols])
         return dict(results)
@@ -1,10 +1,13 @@
 """MCP tool for mark price data."""
 
+from typing import Any
+
 from mcp.server.fastmcp import FastMCP
 
 from crypto_mcp.exchanges.base import BaseExchangeClient
-from crypto_mcp.tools._utils import get_client
+from crypto_mcp.tools._utils import dump_response, get_client
 from crypto_mcp.utils.cache import TTLCache
+from crypto_mcp.utils.dedup import RequestDeduplicator
 
 
 def register_mark_price_tools(
@@ -13,6 +16,7 @@ def register_mark_price_tools(
     cache: TTLCache | None = None,
 ) -> None:
     """Register mark price tools with the MCP server."""
+    dedup = RequestDeduplicator()
 
     @mcp.tool()
     async def get_mark_price(
@@ -33,7 +37,7 @@ def register_mark_price_tools(
             and next funding time. Returns a list if no symbol specified.
         """
         normalized_symbol = symbol.upper() if symbol else None
-        cache_key = f"mark_price:{exchange}:{normalized_symbol}"
+        cache_key = ("mark_price", exchange, normalized_symbol)
 
         # check cache first
         if cache:
@@ -43,16 +47,21 @@ def register_mark_price_tools(
 
         # cache miss - fetch from API
         client = get_client(clients, exchange)
-        result = await client.get_mark_price(normalized_symbol)
 
-        response: dict | list[dict]
-        if isinstance(result, list):
-            response = [r.model_dump(mode="json") for r in result]
-        else:
-            response = result.model_dump(mode="json")
+        async def fetch() -> dict[str, Any] | list[dict[str, Any]]:
+            result = await client.get_mark_price(normalized_symbol)
 
-        # store in cache
-        if cache:
-            await cache.set(cache_key, response)
+            response: dict[str, Any] | list[dict[str, Any]]
+            if isinstance(result, list):
+                response = [dump_response(r) for r in result]
+            else:
+                response = dump_response(result)
+
+            # store in cache
+            if cache:
+                await cache.set(cache_key, response)
+
+            return response
 
-        return response
+        # concurrent misses for the same key share one upstream request
+        return await dedup.run(cache_key, fetch)
@@ -1,6 +1,7 @@
 """MCP tool for open interest data."""
 
 import asyncio
+from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
@@ -35,7 +36,7 @@ def register_open_interest_tools(
             Open interest data including symbol, amount, timestamp, and exchange
         """
         normalized_symbol = symbol.upper()
-        cache_key = f"open_interest:{exchange}:{normalized_symbol}"
+        cache_key = ("open_interest", exchange, normalized_symbol)
 
         # check cache first
         if cache:
@@ -72,10 +73,33 @@ def register_open_interest_tools(
             Dict mapping each symbol to its open interest data
         """
         client = get_client(clients, exchange)
+        normalized_symbols = [s.upper() for s in symbols]
+
+        # serve cached symbols synchronously, only fetch the misses
+        hits: dict[str, dict[str, Any]] = {}
+        misses: list[str] = []
+        for sym in dict.fromkeys(normalized_symbols):
+            cached_value = None
+            if cache:
+                _, cached_value = cache.peek(("open_interest", exchange, sym))
+            if cached_value is None:
+                misses.append(sym)
+            else:
+                hits[sym] = cached_value
+
+        if not misses:
+            return hits
 
         async def fetch_one(sym: str) -> tuple[str, dict]:
-            result = await client.get_open_interest(symbol=sym.upper())
-            return sym.upper(), result.model_dump(mode="json")
+            result = await client.get_open_interest(symbol=sym)
+            return sym, result.model_dump(mode="json")
 
-        results = await asyncio.gather(*[fetch_one(s) for s in symbols])
-        return dict(results)
+        fetched = dict(await asyncio.gather(*[fetch_one(s) for s in misses]))
+
+        # store in cache
+        if cache:
+            await cache.set_many(
+                {("open_interest", exchange, sym): value for sym, value in fetched.items()}
+            )
+
+        return {sym: hits[sym] if sym in hits else fetched[sym] for sym in normalized_symbols}
@@ -1,13 +1,12 @@
 """MCP tool for historical open interest data."""
 
 import asyncio
-from datetime import datetime
 
 from mcp.server.fastmcp import FastMCP
 
 from crypto_mcp.exchanges.base import BaseExchangeClient
 from crypto_mcp.models.common import ValidPeriod
-from crypto_mcp.tools._utils import get_client
+from crypto_mcp.tools._utils import get_client, parse_time
 
 
 def register_open_interest_history_tools(
@@ -48,8 +47,8 @@ def register_open_interest_history_tools(
         ValidPeriod.validate(period)
 
         # parse datetime strings if provided
-        start_dt = datetime.fromisoformat(start_time) if start_time else None
-        end_dt = datetime.fromisoformat(end_time) if end_time else None
+        start_dt = parse_time(start_time)
+        end_dt = parse_time(end_time)
 
         result = await client.get_open_interest_history(
             symbol=symbol.upper(),
@@ -89,8 +88,8 @@ def register_open_interest_history_tools(
         client = get_client(clients, exchange)
         ValidPeriod.validate(period)
 
-        start_dt = datetime.fromisoformat(start_time) if start_time else None
-        end_dt = datetime.fromisoformat(end_time) if end_time else None
+        start_dt = parse_time(start_time)
+        end_dt = parse_time(end_time)
 
         async def fetch_one(sym: str) -> tuple[str, list[dict]]:
             result = await client.get_open_interest_history(
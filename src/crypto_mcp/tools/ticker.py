@@ -32,7 +32,7 @@ def register_ticker_tools(
             24h ticker statistics. Returns a list if no symbol specified.
         """
         normalized_symbol = symbol.upper() if symbol else None
-        cache_key = f"ticker_24h:{exchange}:{normalized_symbol}"
+        cache_key = ("ticker_24h", exchange, normalized_symbol)
 
         # check cache first
         if cache:
@@ -2,8 +2,10 @@
 
 from crypto_mcp.utils.rate_limiter import SlidingWindowRateLimiter
 from crypto_mcp.utils.cache import TTLCache, get_cache_stats, reset_cache_stats
+from crypto_mcp.utils.dedup import RequestDeduplicator
 
 __all__ = [
+    "RequestDeduplicator",
     "SlidingWindowRateLimiter",
     "TTLCache",
     "get_cache_stats",
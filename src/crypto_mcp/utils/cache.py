@@ -1,19 +1,17 @@
 """TTL-based response cache for MCP tools."""
 
 import asyncio
-import time
-from dataclasses import dataclass, field
-from typing import Any, Callable, TypeVar, ParamSpec
+from collections.abc import Awaitable, Callable, Coroutine, Hashable
+from dataclasses import dataclass
+from typing import Any, Literal, ParamSpec, TypeVar, cast
+
+from crypto_mcp.utils.dedup import RequestDeduplicator
 
 P = ParamSpec("P")
 R = TypeVar("R")
 
-
-@dataclass
-class CacheEntry:
-    """single cache entry with value and expiration time."""
-    value: Any
-    expires_at: float
+# distinguishes a miss from a cached None
+_MISSING = object()
 
 
 @dataclass
@@ -42,14 +40,17 @@ class TTLCache:
     """simple TTL-based cache for async functions.
 
     stores results keyed by function arguments.
-    entries expire after ttl seconds.
+    entries expire after ttl seconds: each write schedules its own eviction
+    with loop.call_later, so reads are plain dict lookups with no clock check.
     """
 
     def __init__(self, ttl: float = 3.0, enabled: bool = True):
         self._ttl = ttl
         self._enabled = enabled
-        self._cache: dict[str, CacheEntry] = {}
+        self._cache: dict[Hashable, Any] = {}
+        self._timers: dict[Hashable, asyncio.TimerHandle] = {}
         self._lock = asyncio.Lock()
+        self._inflight = RequestDeduplicator()
 
     @property
     def ttl(self) -> float:
@@ -65,7 +66,7 @@ class TTLCache:
         sorted_kwargs = sorted(kwargs.items())
         return f"{args}:{sorted_kwargs}"
 
-    async def get(self, key: str) -> tuple[bool, Any]:
+    async def get(self, key: Hashable) -> tuple[bool, Any]:
         """gets value from cache if exists and not expired.
 
         returns (hit, value) tuple.
@@ -74,39 +75,91 @@ class TTLCache:
             return False, None
 
         async with self._lock:
-            entry = self._cache.get(key)
-            if entry is None:
-                _cache_stats.misses += 1
-                return False, None
-
-            if time.monotonic() > entry.expires_at:
-                # expired, remove entry
-                del self._cache[key]
+            value = self._cache.get(key, _MISSING)
+            if value is _MISSING:
                 _cache_stats.misses += 1
                 return False, None
 
             _cache_stats.hits += 1
-            return True, entry.value
+            return True, value
+
+    def peek(self, key: Hashable) -> tuple[Literal[True], Any] | tuple[Literal[False], None]:
+        """gets value without locking or stats.
+
+        safe on the event loop since it never awaits; used by batch tools
+        to serve cached symbols before fanning out requests for the rest.
+        returns (hit, value) tuple.
+        """
+        if not self._enabled:
+            return False, None
+
+        value = self._cache.get(key, _MISSING)
+        if value is _MISSING:
+            return False, None
+        return True, value
 
-    async def set(self, key: str, value: Any) -> None:
+    async def set(self, key: Hashable, value: Any) -> None:
         """stores value in cache with TTL."""
         if not self._enabled:
             return
 
+        loop = asyncio.get_running_loop()
         async with self._lock:
-            self._cache[key] = CacheEntry(
-                value=value,
-                expires_at=time.monotonic() + self._ttl,
-            )
+            self._store(loop, key, value)
+
+    async def set_many(self, items: dict[Hashable, Any]) -> None:
+        """stores several values under a single lock acquisition."""
+        if not self._enabled or not items:
+            return
+
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            for key, value in items.items():
+                self._store(loop, key, value)
+
+    def _store(self, loop: asyncio.AbstractEventLoop, key: Hashable, value: Any) -> None:
+        """stores value and (re)arms its eviction timer."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+        self._cache[key] = value
+        self._timers[key] = loop.call_later(self._ttl, self._evict, key)
+
+    def _evict(self, key: Hashable) -> None:
+        """drops an entry once its ttl has elapsed."""
+        self._cache.pop(key, None)
+        self._timers.pop(key, None)
+
+    async def get_or_compute(
+        self, key: Hashable, factory: Callable[[], Awaitable[R]]
+    ) -> R:
+        """gets value from cache, or computes and stores it on a miss.
+
+        concurrent misses for the same key share one factory() call, so a
+        burst of requests costs one upstream call per ttl window per key.
+        """
+        hit, value = await self.get(key)
+        if hit:
+            return cast(R, value)
+
+        async def compute() -> R:
+            result = await factory()
+            await self.set(key, result)
+            return result
+
+        return await self._inflight.run(key, compute)
 
     async def clear(self) -> None:
         """clears all cache entries."""
         async with self._lock:
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
             self._cache.clear()
 
     def cached(
-        self, func: Callable[P, R]
-    ) -> Callable[P, R]:
+        self, func: Callable[P, Awaitable[R]]
+    ) -> Callable[P, Coroutine[Any, Any, R]]:
         """decorator to cache async function results.
 
         usage:
@@ -118,14 +171,7 @@ class TTLCache:
         """
         async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
             key = self._make_key(*args, **kwargs)
-
-            hit, value = await self.get(key)
-            if hit:
-                return value
-
-            result = await func(*args, **kwargs)
-            await self.set(key, result)
-            return result
+            return await self.get_or_compute(key, lambda: func(*args, **kwargs))
 
         # preserve function metadata
         wrapper.__name__ = func.__name__
@@ -0,0 +1,79 @@
+"""In-flight request deduplication for MCP tools."""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class RequestDeduplicator:
+    """Collapses concurrent identical requests into a single upstream call.
+
+    The first caller for a key starts the request as a task; every caller,
+    including the first, awaits it through asyncio.shield(). Cancelling one
+    caller therefore only cancels that caller's wait - the shared request
+    keeps running and the remaining callers still receive its result or
+    error. In-flight tasks are sharded by key hash, each shard with its own
+    lock, so requests for unrelated keys never contend.
+
+    Example:
+        dedup = RequestDeduplicator()
+
+        result = await dedup.run(
+            ("mark_price", "BTCUSDT"),
+            lambda: client.get_mark_price("BTCUSDT"),
+        )
+    """
+
+    def __init__(self, shards: int = 16):
+        """Initialize the deduplicator.
+
+        Args:
+            shards: Number of independently locked in-flight maps (default: 16).
+        """
+        self._shards: list[dict[Hashable, asyncio.Future[Any]]] = [
+            {} for _ in range(shards)
+        ]
+        self._locks = [asyncio.Lock() for _ in range(shards)]
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run factory() for key, or join the call already in flight.
+
+        Args:
+            key: Hashable identity of the request (e.g. tool, exchange, symbol).
+            factory: Zero-argument callable returning the awaitable to run.
+
+        Returns:
+            The result of the single upstream call.
+        """
+        index = hash(key) % len(self._shards)
+        shard = self._shards[index]
+
+        async with self._locks[index]:
+            task: asyncio.Future[T] | None = shard.get(key)
+            # a finished task may still be mapped until its done callback
+            # runs; never hand it to a late caller
+            if task is None or task.done():
+                task = asyncio.ensure_future(factory())
+                # the shard entry is the strong reference keeping the task
+                # alive; the first done callback drops it before any waiter
+                # resumes, so removal still happens before notification
+                shard[key] = task
+
+                def forget(done: asyncio.Future[T]) -> None:
+                    if shard.get(key) is done:
+                        del shard[key]
+
+                task.add_done_callback(forget)
+
+        return await asyncio.shield(task)
+
+    @property
+    def in_flight(self) -> int:
+        """Return number of requests currently in flight."""
+        return sum(len(shard) for shard in self._shards)
@@ -3,6 +3,7 @@
 import asyncio
 import time
 from collections import deque
+from collections.abc import Callable
 
 
 class SlidingWindowRateLimiter:
@@ -23,15 +24,18 @@ class SlidingWindowRateLimiter:
         self,
         max_requests: int,
         window_seconds: int = 60,
+        clock: Callable[[], float] = time.monotonic,
     ):
         """Initialize the rate limiter.
 
         Args:
             max_requests: Maximum number of requests allowed in the window.
             window_seconds: Size of the sliding window in seconds (default: 60).
+            clock: Monotonic time source in seconds (default: time.monotonic).
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
+        self._clock = clock
         self._requests: deque[float] = deque()
         self._lock = asyncio.Lock()
 
@@ -42,7 +46,7 @@ class SlidingWindowRateLimiter:
             The wait time in seconds (0 if no wait was needed).
         """
         async with self._lock:
-            now = time.monotonic()
+            now = self._clock()
             self._cleanup_old_requests(now)
             total_wait = 0.0
 
@@ -52,22 +56,28 @@ class SlidingWindowRateLimiter:
                 if wait_time > 0:
                     total_wait += wait_time
                     await asyncio.sleep(wait_time)
-                now = time.monotonic()
+                now = self._clock()
                 self._cleanup_old_requests(now)
 
             self._requests.append(now)
             return total_wait
 
     def _cleanup_old_requests(self, now: float) -> None:
-        """Remove requests outside the sliding window."""
+        """Remove requests outside the sliding window.
+
+        The cutoff is inclusive: a request exactly window_seconds old has
+        left the window. acquire() sleeps until exactly that moment, so an
+        exclusive cutoff would leave the request in place and spin on a
+        zero wait until the clock ticks again.
+        """
         cutoff = now - self.window_seconds
-        while self._requests and self._requests[0] < cutoff:
+        while self._requests and self._requests[0] <= cutoff:
             self._requests.popleft()
 
     @property
     def current_count(self) -> int:
         """Return current number of requests in the window."""
-        now = time.monotonic()
+        now = self._clock()
         self._cleanup_old_requests(now)
         return len(self._requests)
 
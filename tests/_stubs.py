@@ -0,0 +1,71 @@
+"""Lightweight stand-ins for mocked exchange clients, shared by the test suites."""
+
+import inspect
+from typing import Any
+from unittest.mock import _Call, call
+
+from crypto_mcp.exchanges.base import BaseExchangeClient
+
+
+class AsyncStub:
+    """Async callable recording its awaits, for mocking one client method.
+
+    Supports the subset of the AsyncMock API the tool tests use:
+    return_value, side_effect (an exception or a sync/async callable),
+    call_count, call_args/await_args and assert_called_once_with, without
+    AsyncMock's spec handling and child mock construction.
+    """
+
+    def __init__(self, side_effect: Any = None) -> None:
+        self.reset()
+        self.side_effect = side_effect
+
+    def reset(self) -> None:
+        """Forget recorded awaits, return value and side effect."""
+        self.return_value: Any = None
+        self.side_effect: Any = None
+        self.await_args_list: list[_Call] = []
+
+    async def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        self.await_args_list.append(call(*args, **kwargs))
+        effect = self.side_effect
+        if effect is None:
+            return self.return_value
+        if isinstance(effect, BaseException):
+            raise effect
+        result = effect(*args, **kwargs)
+        if inspect.isawaitable(result):
+            return await result
+        return result
+
+    @property
+    def call_count(self) -> int:
+        """Return number of awaits recorded."""
+        return len(self.await_args_list)
+
+    @property
+    def await_args(self) -> _Call | None:
+        """Return the arguments of the most recent await."""
+        return self.await_args_list[-1] if self.await_args_list else None
+
+    call_args = await_args
+
+    def assert_called_once_with(self, *args: Any, **kwargs: Any) -> None:
+        """Assert the stub was awaited exactly once with these arguments."""
+        assert self.call_count == 1, f"expected 1 await, got {self.call_count}"
+        assert self.await_args == call(*args, **kwargs), (
+            f"expected {call(*args, **kwargs)}, got {self.await_args}"
+        )
+
+
+class StubExchangeClient:
+    """Exchange client with an AsyncStub for every BaseExchangeClient method."""
+
+    def __init__(self) -> None:
+        for name in BaseExchangeClient.__abstractmethods__:
+            setattr(self, name, AsyncStub())
+
+    def reset(self) -> None:
+        """Reset every method stub."""
+        for name in BaseExchangeClient.__abstractmethods__:
+            getattr(self, name).reset()
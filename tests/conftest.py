@@ -1,14 +1,39 @@
 """Shared pytest fixtures for all tests."""
 
+import asyncio
+
 import pytest
 
+try:
+    import uvloop as _fast_loop
+except ImportError:  # not available on Windows
+    try:
+        import winloop as _fast_loop
+    except ImportError:
+        _fast_loop = None
+
 from crypto_mcp.config import Settings
 
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run async tests on uvloop/winloop when installed (the perf extra).
+
+    Falls back to the stdlib policy so the suite still runs without them.
+    """
+    if _fast_loop is not None:
+        return _fast_loop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
 @pytest.fixture
 def settings() -> Settings:
-    """Test settings with defaults."""
-    return Settings(
+    """Test settings with defaults.
+
+    Built with model_construct: these values are known-good, so skip the
+    env/dotenv scan and validation that Settings() runs on every call.
+    """
+    return Settings.model_construct(
         binance_futures_base_url="https://fapi.binance.com",
         http_timeout=5.0,  # shorter for tests
     )
@@ -28,21 +28,23 @@ EXPECTED_TOOLS = [
     "get_long_short_ratio",
     "get_long_short_ratio_batch",
     "get_derived_metrics",
+    "get_exchange_info",
 ]
 
 
+@pytest.fixture(scope="class")
+def mcp_server():
+    """Create an MCP server with all tools registered, shared by the class."""
+    mcp = FastMCP("test-crypto-server")
+    mock_client = AsyncMock(spec=BinanceClient)
+    mock_clients = {"binance": mock_client, "bybit": mock_client}
+    register_all_tools(mcp, mock_clients)
+    return mcp, mock_client
+
+
 class TestServerToolRegistration:
     """Tests for tool registration on server startup."""
 
-    @pytest.fixture
-    def mcp_server(self):
-        """Create an MCP server with all tools registered."""
-        mcp = FastMCP("test-crypto-server")
-        mock_client = AsyncMock(spec=BinanceClient)
-        mock_clients = {"binance": mock_client, "bybit": mock_client}
-        register_all_tools(mcp, mock_clients)
-        return mcp, mock_client
-
     def test_all_tools_registered(self, mcp_server):
         """Verify all expected tools are registered."""
         mcp, _ = mcp_server
@@ -52,9 +54,9 @@ class TestServerToolRegistration:
             assert tool_name in registered_tools, f"Tool {tool_name} not registered"
 
     def test_correct_number_of_tools(self, mcp_server):
-        """Verify exactly 13 tools are registered."""
+        """Verify exactly 14 tools are registered."""
         mcp, _ = mcp_server
-        assert len(mcp._tool_manager._tools) == 13
+        assert len(mcp._tool_manager._tools) == 14
 
 
 class TestServerImport:
@@ -73,16 +75,25 @@ class TestServerImport:
         assert hasattr(__main__, "mcp")
 
 
+@pytest.fixture(scope="class")
+def execution_server():
+    """Register all tools once; tools look clients up per call."""
+    mcp = FastMCP("test-execution")
+    clients: dict = {}
+    register_all_tools(mcp, clients)
+    return mcp, clients
+
+
 class TestToolExecution:
     """Tests for executing tools through the server."""
 
     @pytest.fixture
-    def mcp_with_mock_client(self):
-        """Create MCP server with mock client that returns test data."""
-        mcp = FastMCP("test-execution")
+    def mcp_with_mock_client(self, execution_server):
+        """Wire the shared server to a fresh mock client for this test."""
+        mcp, clients = execution_server
         mock_client = AsyncMock(spec=BinanceClient)
-        mock_clients = {"binance": mock_client, "bybit": mock_client}
-        register_all_tools(mcp, mock_clients)
+        clients["binance"] = mock_client
+        clients["bybit"] = mock_client
         return mcp, mock_client
 
     @pytest.mark.asyncio
@@ -0,0 +1,61 @@
+"""Canned exchange responses shared by the performance tests."""
+
+from decimal import Decimal
+
+from crypto_mcp.models import (
+    FundingRateResponse,
+    LongShortRatioResponse,
+    MarkPriceResponse,
+    OpenInterestResponse,
+    TickerResponse,
+)
+
+# default mock return values, built once at import and shared by reference
+DEFAULT_OI = OpenInterestResponse(
+    symbol="BTCUSDT",
+    open_interest=Decimal("100000.0"),
+    timestamp=1700000000000,
+    exchange="binance",
+)
+
+DEFAULT_FR = FundingRateResponse(
+    symbol="BTCUSDT",
+    funding_rate=Decimal("0.0001"),
+    funding_time=1700000000000,
+    mark_price=Decimal("45000.00"),
+    exchange="binance",
+)
+
+DEFAULT_LSR = LongShortRatioResponse(
+    symbol="BTCUSDT",
+    long_short_ratio=Decimal("1.5"),
+    long_account=Decimal("60.0"),
+    short_account=Decimal("40.0"),
+    timestamp=1700000000000,
+    exchange="binance",
+)
+
+DEFAULT_MP = MarkPriceResponse(
+    symbol="BTCUSDT",
+    mark_price=Decimal("45000.00"),
+    index_price=Decimal("44999.50"),
+    last_funding_rate=Decimal("0.0001"),
+    next_funding_time=1700003600000,
+    exchange="binance",
+)
+
+DEFAULT_TICKER = TickerResponse(
+    symbol="BTCUSDT",
+    price_change=Decimal("500.00"),
+    price_change_percent=Decimal("1.12"),
+    last_price=Decimal("45000.00"),
+    volume=Decimal("50000.0"),
+    quote_volume=Decimal("2250000000.00"),
+    high_price=Decimal("45500.00"),
+    low_price=Decimal("44000.00"),
+    open_price=Decimal("44500.00"),
+    open_time=1699913600000,
+    close_time=1700000000000,
+    trade_count=1000000,
+    exchange="binance",
+)
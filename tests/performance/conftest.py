@@ -1,9 +1,9 @@
 """Shared fixtures for performance tests."""
 
 import asyncio
-from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock
 
+import httpx
 import pytest
 
 from mcp.server.fastmcp import FastMCP
@@ -12,15 +12,9 @@ from crypto_mcp.config import Settings
 from crypto_mcp.exchanges.binance import BinanceClient
 from crypto_mcp.tools import register_all_tools
 from crypto_mcp.utils.cache import TTLCache, reset_cache_stats
-from crypto_mcp.models import (
-    OpenInterestResponse,
-    FundingRateResponse,
-    MarkPriceResponse,
-    TickerResponse,
-    LongShortRatioResponse,
-    KlinesResponse,
-    Candle,
-)
+
+from .._stubs import AsyncStub
+from ._data import DEFAULT_FR, DEFAULT_LSR, DEFAULT_MP, DEFAULT_OI, DEFAULT_TICKER
 
 
 @pytest.fixture
@@ -29,89 +23,108 @@ def mock_binance_client():
     client = AsyncMock(spec=BinanceClient)
 
     # setup default return values for common methods
-    client.get_open_interest.return_value = OpenInterestResponse(
-        symbol="BTCUSDT",
-        open_interest=Decimal("100000.0"),
-        timestamp=1700000000000,
-        exchange="binance",
-    )
-
-    client.get_funding_rate.return_value = [
-        FundingRateResponse(
-            symbol="BTCUSDT",
-            funding_rate=Decimal("0.0001"),
-            funding_time=1700000000000,
-            mark_price=Decimal("45000.00"),
-            exchange="binance",
-        )
-    ]
-
-    client.get_long_short_ratio.return_value = [
-        LongShortRatioResponse(
-            symbol="BTCUSDT",
-            long_short_ratio=Decimal("1.5"),
-            long_account=Decimal("60.0"),
-            short_account=Decimal("40.0"),
-            timestamp=1700000000000,
-            exchange="binance",
-        )
-    ]
-
-    client.get_mark_price.return_value = MarkPriceResponse(
-        symbol="BTCUSDT",
-        mark_price=Decimal("45000.00"),
-        index_price=Decimal("44999.50"),
-        last_funding_rate=Decimal("0.0001"),
-        next_funding_time=1700003600000,
-        exchange="binance",
-    )
-
-    client.get_ticker_24h.return_value = TickerResponse(
-        symbol="BTCUSDT",
-        price_change=Decimal("500.00"),
-        price_change_percent=Decimal("1.12"),
-        last_price=Decimal("45000.00"),
-        volume=Decimal("50000.0"),
-        quote_volume=Decimal("2250000000.00"),
-        high_price=Decimal("45500.00"),
-        low_price=Decimal("44000.00"),
-        open_price=Decimal("44500.00"),
-        open_time=1699913600000,
-        close_time=1700000000000,
-        trade_count=1000000,
-        exchange="binance",
-    )
+    # (list wrappers are fresh per test so tests may append/clear them)
+    client.get_open_interest.return_value = DEFAULT_OI
+    client.get_funding_rate.return_value = [DEFAULT_FR]
+    client.get_long_short_ratio.return_value = [DEFAULT_LSR]
+    client.get_mark_price.return_value = DEFAULT_MP
+    client.get_ticker_24h.return_value = DEFAULT_TICKER
 
     return client
 
 
 @pytest.fixture
-def mcp_server_with_mock(mock_binance_client):
-    """Create an MCP server with mock client for testing tools."""
-    # reset cache stats before each test
-    reset_cache_stats()
+async def prepared_client():
+    """BinanceClient over a real httpx client that is closed after the test."""
+    async with httpx.AsyncClient() as http:
+        yield BinanceClient(http, MagicMock())
 
+
+@pytest.fixture(scope="module")
+def performance_server():
+    """Build the MCP server once per module.
+
+    Tools look clients up in the shared dict on every call, so each test
+    swaps in its own mock instead of re-registering every tool.
+    """
     mcp = FastMCP("test-performance")
-    mock_clients = {"binance": mock_binance_client, "bybit": mock_binance_client}
+    clients: dict = {}
     cache = TTLCache(ttl=3.0, enabled=True)
-    register_all_tools(mcp, mock_clients, cache)
+    register_all_tools(mcp, clients, cache)
+    tool_fns = {name: tool.fn for name, tool in mcp._tool_manager._tools.items()}
+    return mcp, clients, cache, tool_fns
+
+
+@pytest.fixture
+async def mcp_server_with_mock(performance_server, mock_binance_client):
+    """MCP server wired to a fresh mock client and an empty cache."""
+    mcp, clients, cache, _ = performance_server
+
+    # reset per-test state left over from the previous test
+    reset_cache_stats()
+    await cache.clear()
+    clients["binance"] = mock_binance_client
+    clients["bybit"] = mock_binance_client
     return mcp, mock_binance_client
 
 
+@pytest.fixture
+def liq_mock(mcp_server_with_mock):
+    """Fresh get_liquidation_history mock on this test's client."""
+    _, mock_client = mcp_server_with_mock
+    mock_client.get_liquidation_history = AsyncMock()
+    return mock_client.get_liquidation_history
+
+
+@pytest.fixture
+def tool_fns(performance_server, mcp_server_with_mock):
+    """Registered tool functions by name, wired to this test's mock client."""
+    return performance_server[3]
+
+
+@pytest.fixture
+def mark_price_fn(tool_fns):
+    """get_mark_price tool function, resolved once per test."""
+    return tool_fns["get_mark_price"]
+
+
+@pytest.fixture
+def derived_metrics_fn(tool_fns):
+    """get_derived_metrics tool function, resolved once per test."""
+    return tool_fns["get_derived_metrics"]
+
+
+SAMPLE_SYMBOLS = ("BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT")
+
+MANY_SYMBOLS = (
+    "BTCUSDT", "ETHUSDT", "BNBUSDT", "XRPUSDT", "ADAUSDT",
+    "DOGEUSDT", "SOLUSDT", "DOTUSDT", "MATICUSDT", "LTCUSDT",
+    "SHIBUSDT", "TRXUSDT", "AVAXUSDT", "LINKUSDT", "ATOMUSDT",
+)
+
+
 @pytest.fixture
 def sample_symbols():
     """Common test symbols."""
-    return ["BTCUSDT", "ETHUSDT", "SOLUSDT", "BNBUSDT", "XRPUSDT"]
+    return list(SAMPLE_SYMBOLS)
+
+
+@pytest.fixture(scope="session")
+def sample_symbols_upper():
+    """Uppercased sample symbols, as batch tools key their results."""
+    return frozenset(s.upper() for s in SAMPLE_SYMBOLS)
 
 
 @pytest.fixture
 def many_symbols():
     """Large list of symbols for batch testing."""
-    return [
-        "BTCUSDT", "ETHUSDT", "BNBUSDT", "XRPUSDT", "ADAUSDT",
-        "DOGEUSDT", "SOLUSDT", "DOTUSDT", "MATICUSDT", "LTCUSDT",
-        "SHIBUSDT", "TRXUSDT", "AVAXUSDT", "LINKUSDT", "ATOMUSDT",
-    ]
+    return list(MANY_SYMBOLS)
+
+
+@pytest.fixture(scope="session")
+def many_symbols_upper():
+    """Uppercased many_symbols, as batch tools key their results."""
+    return frozenset(s.upper() for s in MANY_SYMBOLS)
 
 
 class TimingHelper:
@@ -139,3 +152,33 @@ class TimingHelper:
 def timing():
     """Fixture for timing measurements."""
     return TimingHelper
+
+
+class LatencyGate:
+    """Simulated network latency shared by concurrent mock calls.
+
+    The first wait() arms a single loop.call_later timer; every caller then
+    awaits the same event instead of scheduling its own sleep.
+    """
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self._event: asyncio.Event | None = None
+
+    async def wait(self):
+        if self._event is None:
+            self._event = asyncio.Event()
+            asyncio.get_running_loop().call_later(self.delay, self._event.set)
+        await self._event.wait()
+
+
+@pytest.fixture
+def latency_gate():
+    """Fixture for simulated latency in fan-out tests."""
+    return LatencyGate
+
+
+@pytest.fixture
+def async_stub():
+    """Fixture for lightweight async client method stubs."""
+    return AsyncStub
@@ -4,8 +4,6 @@ These tests define the expected behavior for:
 - get_funding_rate_batch
 - get_long_short_ratio_batch
 - get_open_interest_batch
-
-Tests are expected to fail until implementations are complete.
 """
 
 import asyncio
@@ -20,17 +18,18 @@ from crypto_mcp.models import (
     OpenInterestResponse,
 )
 
+from ._data import DEFAULT_OI
+
 
 class TestFundingRateBatch:
     """Tests for get_funding_rate_batch tool."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_funding_rate_batch not yet implemented")
     async def test_batch_returns_dict_keyed_by_symbol(
-        self, mcp_server_with_mock, sample_symbols
+        self, mcp_server_with_mock, sample_symbols, sample_symbols_upper, tool_fns
     ):
         """Batch tool should return {symbol: [funding_rates]}."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         # setup mock to return data for each symbol
         async def mock_funding_rate(symbol, limit=100, **kwargs):
@@ -47,23 +46,22 @@ class TestFundingRateBatch:
         mock_client.get_funding_rate.side_effect = mock_funding_rate
 
         # this tool doesn't exist yet - test will fail
-        tool_fn = mcp._tool_manager._tools["get_funding_rate_batch"].fn
+        tool_fn = tool_fns["get_funding_rate_batch"]
         result = await tool_fn(symbols=sample_symbols, limit=10)
 
         assert isinstance(result, dict)
-        assert set(result.keys()) == set(s.upper() for s in sample_symbols)
+        assert set(result.keys()) == sample_symbols_upper
         for symbol, rates in result.items():
             assert isinstance(rates, list)
             assert len(rates) > 0
             assert rates[0]["symbol"] == symbol
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_funding_rate_batch not yet implemented")
     async def test_batch_makes_parallel_requests(
-        self, mcp_server_with_mock, sample_symbols
+        self, mcp_server_with_mock, sample_symbols, tool_fns
     ):
         """Batch should use asyncio.gather for parallel execution."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         call_times = []
 
@@ -82,7 +80,7 @@ class TestFundingRateBatch:
 
         mock_client.get_funding_rate.side_effect = mock_funding_rate
 
-        tool_fn = mcp._tool_manager._tools["get_funding_rate_batch"].fn
+        tool_fn = tool_fns["get_funding_rate_batch"]
 
         start = asyncio.get_event_loop().time()
         await tool_fn(symbols=sample_symbols, limit=10)
@@ -93,21 +91,17 @@ class TestFundingRateBatch:
         assert elapsed < 0.3, f"Batch took {elapsed}s, expected <0.3s (parallel)"
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_funding_rate_batch not yet implemented")
-    async def test_batch_handles_empty_list(self, mcp_server_with_mock):
+    async def test_batch_handles_empty_list(self, tool_fns):
         """Batch should return empty dict for empty input."""
-        mcp, _ = mcp_server_with_mock
-
-        tool_fn = mcp._tool_manager._tools["get_funding_rate_batch"].fn
+        tool_fn = tool_fns["get_funding_rate_batch"]
         result = await tool_fn(symbols=[], limit=10)
 
         assert result == {}
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_funding_rate_batch not yet implemented")
-    async def test_batch_uppercases_symbols(self, mcp_server_with_mock):
+    async def test_batch_uppercases_symbols(self, mcp_server_with_mock, tool_fns):
         """Batch should uppercase symbol names."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         mock_client.get_funding_rate.return_value = [
             FundingRateResponse(
@@ -119,7 +113,7 @@ class TestFundingRateBatch:
             )
         ]
 
-        tool_fn = mcp._tool_manager._tools["get_funding_rate_batch"].fn
+        tool_fn = tool_fns["get_funding_rate_batch"]
         result = await tool_fn(symbols=["btcusdt"], limit=10)
 
         assert "BTCUSDT" in result
@@ -129,12 +123,11 @@ class TestLongShortRatioBatch:
     """Tests for get_long_short_ratio_batch tool."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_long_short_ratio_batch not yet implemented")
     async def test_batch_returns_dict_keyed_by_symbol(
-        self, mcp_server_with_mock, sample_symbols
+        self, mcp_server_with_mock, sample_symbols, sample_symbols_upper, tool_fns
     ):
         """Batch tool should return {symbol: [ratios]}."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         async def mock_ls_ratio(symbol, period, limit=30, **kwargs):
             return [
@@ -150,19 +143,16 @@ class TestLongShortRatioBatch:
 
         mock_client.get_long_short_ratio.side_effect = mock_ls_ratio
 
-        tool_fn = mcp._tool_manager._tools["get_long_short_ratio_batch"].fn
+        tool_fn = tool_fns["get_long_short_ratio_batch"]
         result = await tool_fn(symbols=sample_symbols, period="1h", limit=10)
 
         assert isinstance(result, dict)
-        assert set(result.keys()) == set(s.upper() for s in sample_symbols)
+        assert set(result.keys()) == sample_symbols_upper
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_long_short_ratio_batch not yet implemented")
-    async def test_batch_requires_period_parameter(self, mcp_server_with_mock):
+    async def test_batch_requires_period_parameter(self, tool_fns):
         """Period is required for long/short ratio queries."""
-        mcp, _ = mcp_server_with_mock
-
-        tool_fn = mcp._tool_manager._tools["get_long_short_ratio_batch"].fn
+        tool_fn = tool_fns["get_long_short_ratio_batch"]
 
         # should raise TypeError or similar for missing period
         with pytest.raises(TypeError):
@@ -173,12 +163,11 @@ class TestOpenInterestBatch:
     """Tests for get_open_interest_batch tool (current OI, not history)."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_open_interest_batch not yet implemented")
     async def test_batch_returns_dict_keyed_by_symbol(
-        self, mcp_server_with_mock, sample_symbols
+        self, mcp_server_with_mock, sample_symbols, sample_symbols_upper, tool_fns
     ):
         """Batch tool should return {symbol: oi_data}."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         async def mock_oi(symbol):
             return OpenInterestResponse(
@@ -190,35 +179,30 @@ class TestOpenInterestBatch:
 
         mock_client.get_open_interest.side_effect = mock_oi
 
-        tool_fn = mcp._tool_manager._tools["get_open_interest_batch"].fn
+        tool_fn = tool_fns["get_open_interest_batch"]
         result = await tool_fn(symbols=sample_symbols)
 
         assert isinstance(result, dict)
-        assert set(result.keys()) == set(s.upper() for s in sample_symbols)
+        assert set(result.keys()) == sample_symbols_upper
         for symbol, data in result.items():
             assert data["symbol"] == symbol
             assert "open_interest" in data
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_open_interest_batch not yet implemented")
     async def test_batch_faster_than_sequential(
-        self, mcp_server_with_mock, many_symbols
+        self, mcp_server_with_mock, many_symbols, latency_gate, tool_fns
     ):
         """Batch should be significantly faster than sequential calls."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
+        gate = latency_gate(0.05)  # 50ms per request
 
         async def mock_oi(symbol):
-            await asyncio.sleep(0.05)  # 50ms per request
-            return OpenInterestResponse(
-                symbol=symbol,
-                open_interest=Decimal("100000.0"),
-                timestamp=1700000000000,
-                exchange="binance",
-            )
+            await gate.wait()
+            return DEFAULT_OI.model_copy(update={"symbol": symbol})
 
         mock_client.get_open_interest.side_effect = mock_oi
 
-        tool_fn = mcp._tool_manager._tools["get_open_interest_batch"].fn
+        tool_fn = tool_fns["get_open_interest_batch"]
 
         start = asyncio.get_event_loop().time()
         await tool_fn(symbols=many_symbols)
@@ -233,13 +217,11 @@ class TestExistingBatchTools:
     """Verify existing batch tools work correctly (regression tests)."""
 
     @pytest.mark.asyncio
-    async def test_klines_batch_exists(self, mcp_server_with_mock):
+    async def test_klines_batch_exists(self, tool_fns):
         """Verify get_klines_batch tool is registered."""
-        mcp, _ = mcp_server_with_mock
-        assert "get_klines_batch" in mcp._tool_manager._tools
+        assert "get_klines_batch" in tool_fns
 
     @pytest.mark.asyncio
-    async def test_open_interest_history_batch_exists(self, mcp_server_with_mock):
+    async def test_open_interest_history_batch_exists(self, tool_fns):
         """Verify get_open_interest_history_batch tool is registered."""
-        mcp, _ = mcp_server_with_mock
-        assert "get_open_interest_history_batch" in mcp._tool_manager._tools
+        assert "get_open_interest_history_batch" in tool_fns
@@ -4,8 +4,6 @@ These tests define the expected behavior for TTL-based caching:
 - Cache hit/miss behavior
 - TTL expiration
 - Cache key generation
-
-Tests are expected to fail until implementation is complete.
 """
 
 import asyncio
@@ -13,18 +11,20 @@ from decimal import Decimal
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from mcp.server.fastmcp import FastMCP
 
+from crypto_mcp.cache import TTLCache
 from crypto_mcp.models import MarkPriceResponse, TickerResponse, OpenInterestResponse
+from crypto_mcp.tools.mark_price import register_mark_price_tools
 
 
 class TestCacheBasics:
     """Basic cache functionality tests."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Caching not yet implemented")
-    async def test_cache_hit_returns_cached_value(self, mcp_server_with_mock):
+    async def test_cache_hit_returns_cached_value(self, mcp_server_with_mock, tool_fns):
         """Second call should return cached result without API call."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         mock_client.get_mark_price.return_value = MarkPriceResponse(
             symbol="BTCUSDT",
@@ -35,7 +35,7 @@ class TestCacheBasics:
             exchange="binance",
         )
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        tool_fn = tool_fns["get_mark_price"]
 
         # first call - cache miss
         result1 = await tool_fn(symbol="BTCUSDT")
@@ -47,12 +47,9 @@ class TestCacheBasics:
         assert mock_client.get_mark_price.call_count == 1
         assert result1 == result2
 
-    @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Caching not yet implemented")
-    async def test_cache_miss_after_ttl_expires(self, mcp_server_with_mock):
+    def test_cache_miss_after_ttl_expires(self, mock_binance_client, virtual_loop):
         """After TTL expires, should make new API call."""
-        mcp, mock_client = mcp_server_with_mock
-
+        mock_client = mock_binance_client
         mock_client.get_mark_price.return_value = MarkPriceResponse(
             symbol="BTCUSDT",
             mark_price=Decimal("45000.00"),
@@ -62,26 +59,31 @@ class TestCacheBasics:
             exchange="binance",
         )
 
+        # a 3 second TTL cache whose eviction timers run on the virtual clock
+        mcp = FastMCP("test-cache-expiry")
+        register_mark_price_tools(mcp, {"binance": mock_client}, TTLCache(ttl=3.0))
         tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
 
-        # first call
-        await tool_fn(symbol="BTCUSDT")
+        async def scenario():
+            # first call
+            await tool_fn(symbol="BTCUSDT")
 
-        # wait for TTL to expire (assuming 3 second TTL)
-        await asyncio.sleep(3.5)
+            # let the TTL expire
+            await virtual_loop.advance(3.5)
 
-        # second call - should be cache miss
-        await tool_fn(symbol="BTCUSDT")
+            # second call - should be cache miss
+            await tool_fn(symbol="BTCUSDT")
+
+        virtual_loop.run_until_complete(scenario())
 
         assert mock_client.get_mark_price.call_count == 2
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Caching not yet implemented")
     async def test_different_symbols_have_separate_cache_entries(
-        self, mcp_server_with_mock
+        self, mcp_server_with_mock, tool_fns
     ):
         """Different symbols should not share cache entries."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         def mock_mark_price(symbol=None):
             return MarkPriceResponse(
@@ -95,7 +97,7 @@ class TestCacheBasics:
 
         mock_client.get_mark_price.side_effect = mock_mark_price
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        tool_fn = tool_fns["get_mark_price"]
 
         await tool_fn(symbol="BTCUSDT")
         await tool_fn(symbol="ETHUSDT")
@@ -110,12 +112,11 @@ class TestCacheForDifferentEndpoints:
     """Test caching works for different cacheable endpoints."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Caching not yet implemented")
-    async def test_ticker_24h_is_cached(self, mcp_server_with_mock):
+    async def test_ticker_24h_is_cached(self, mcp_server_with_mock, tool_fns):
         """get_ticker_24h should be cached."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        tool_fn = mcp._tool_manager._tools["get_ticker_24h"].fn
+        tool_fn = tool_fns["get_ticker_24h"]
 
         await tool_fn(symbol="BTCUSDT")
         await tool_fn(symbol="BTCUSDT")
@@ -123,12 +124,11 @@ class TestCacheForDifferentEndpoints:
         assert mock_client.get_ticker_24h.call_count == 1
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Caching not yet implemented")
-    async def test_open_interest_is_cached(self, mcp_server_with_mock):
+    async def test_open_interest_is_cached(self, mcp_server_with_mock, tool_fns):
         """get_open_interest should be cached."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        tool_fn = mcp._tool_manager._tools["get_open_interest"].fn
+        tool_fn = tool_fns["get_open_interest"]
 
         await tool_fn(symbol="BTCUSDT")
         await tool_fn(symbol="BTCUSDT")
@@ -136,10 +136,41 @@ class TestCacheForDifferentEndpoints:
         assert mock_client.get_open_interest.call_count == 1
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Caching not yet implemented")
-    async def test_klines_are_not_cached(self, mcp_server_with_mock):
+    async def test_open_interest_batch_only_fetches_cache_misses(
+        self, mcp_server_with_mock, tool_fns
+    ):
+        """get_open_interest_batch should reuse entries cached by get_open_interest."""
+        _, mock_client = mcp_server_with_mock
+
+        async def mock_oi(symbol):
+            return OpenInterestResponse(
+                symbol=symbol,
+                open_interest=Decimal("100000.0"),
+                timestamp=1700000000000,
+                exchange="binance",
+            )
+
+        mock_client.get_open_interest.side_effect = mock_oi
+
+        single_fn = tool_fns["get_open_interest"]
+        batch_fn = tool_fns["get_open_interest_batch"]
+
+        await single_fn(symbol="BTCUSDT")
+        result = await batch_fn(symbols=["btcusdt", "ETHUSDT"])
+
+        assert list(result) == ["BTCUSDT", "ETHUSDT"]
+        assert result["ETHUSDT"]["symbol"] == "ETHUSDT"
+        # BTCUSDT served from cache, only ETHUSDT fetched
+        assert mock_client.get_open_interest.call_count == 2
+
+        # fully warm batch makes no further calls
+        await batch_fn(symbols=["BTCUSDT", "ETHUSDT"])
+        assert mock_client.get_open_interest.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_klines_are_not_cached(self, mcp_server_with_mock, tool_fns):
         """Klines should NOT be cached (historical data, different params)."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         from crypto_mcp.models import KlinesResponse, Candle
 
@@ -162,7 +193,7 @@ class TestCacheForDifferentEndpoints:
             exchange="binance",
         )
 
-        tool_fn = mcp._tool_manager._tools["get_klines"].fn
+        tool_fn = tool_fns["get_klines"]
 
         await tool_fn(symbol="BTCUSDT", interval="1h")
         await tool_fn(symbol="BTCUSDT", interval="1h")
@@ -174,7 +205,6 @@ class TestCacheForDifferentEndpoints:
 class TestCacheConfiguration:
     """Test cache configuration options."""
 
-    @pytest.mark.xfail(reason="Caching not yet implemented")
     def test_cache_ttl_is_configurable(self):
         """Cache TTL should be configurable via settings."""
         from crypto_mcp.config import Settings
@@ -182,7 +212,6 @@ class TestCacheConfiguration:
         settings = Settings(cache_ttl=5.0)
         assert settings.cache_ttl == 5.0
 
-    @pytest.mark.xfail(reason="Caching not yet implemented")
     def test_cache_can_be_disabled(self):
         """Cache should be disableable via settings."""
         from crypto_mcp.config import Settings
@@ -191,16 +220,108 @@ class TestCacheConfiguration:
         assert settings.cache_enabled is False
 
 
+class VirtualClockLoop(asyncio.SelectorEventLoop):
+    """Event loop whose clock only moves when a test advances it.
+
+    TTLCache evicts through loop.call_later, so advancing time() fires the
+    eviction timers deterministically instead of sleeping in real time.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._now = 0.0
+
+    def time(self):
+        return self._now
+
+    async def advance(self, seconds):
+        """Move the clock forward and let the now-due timers run."""
+        self._now += seconds
+        # one pass moves due timers to the ready queue, the next runs them
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def virtual_loop():
+    """A VirtualClockLoop closed after the test."""
+    loop = VirtualClockLoop()
+    yield loop
+    loop.close()
+
+
+class TestCacheExpiry:
+    """Test timer-driven TTL eviction."""
+
+    def test_entry_evicted_after_ttl(self, virtual_loop):
+        """Entries should disappear once their eviction timer fires."""
+
+        async def scenario():
+            cache = TTLCache(ttl=10.0)
+            await cache.set(("mark_price", "binance", "BTCUSDT"), 1)
+            assert cache.peek(("mark_price", "binance", "BTCUSDT")) == (True, 1)
+
+            await virtual_loop.advance(9.9)
+            assert cache.peek(("mark_price", "binance", "BTCUSDT")) == (True, 1)
+
+            await virtual_loop.advance(0.2)
+            assert cache.peek(("mark_price", "binance", "BTCUSDT")) == (False, None)
+
+        virtual_loop.run_until_complete(scenario())
+
+    def test_overwrite_rearms_timer(self, virtual_loop):
+        """Overwriting an entry should restart its TTL."""
+
+        async def scenario():
+            cache = TTLCache(ttl=10.0)
+            await cache.set("key", 1)
+            await virtual_loop.advance(6.0)
+            await cache.set("key", 2)
+            await virtual_loop.advance(6.0)
+
+            assert cache.peek("key") == (True, 2)
+
+            await virtual_loop.advance(6.0)
+            assert cache.peek("key") == (False, None)
+
+        virtual_loop.run_until_complete(scenario())
+
+
+class TestCacheGetOrCompute:
+    """Test TTLCache.get_or_compute single-flight behavior."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_compute_once(self):
+        """Concurrent misses for one key should share a single factory call."""
+        cache = TTLCache(ttl=60.0)
+        key = ("ticker_24h", "binance", "BTCUSDT")
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"symbol": "BTCUSDT"}
+
+        results = await asyncio.gather(
+            *[cache.get_or_compute(key, factory) for _ in range(5)]
+        )
+        # later calls are served from the cache
+        await cache.get_or_compute(key, factory)
+
+        assert calls == 1
+        assert all(r == {"symbol": "BTCUSDT"} for r in results)
+
+
 class TestCacheStats:
     """Test cache statistics/metrics."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Caching not yet implemented")
-    async def test_cache_provides_hit_miss_stats(self, mcp_server_with_mock):
+    async def test_cache_provides_hit_miss_stats(self, mcp_server_with_mock, tool_fns):
         """Cache should track hit/miss statistics."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        tool_fn = tool_fns["get_mark_price"]
 
         await tool_fn(symbol="BTCUSDT")  # miss
         await tool_fn(symbol="BTCUSDT")  # hit
@@ -4,24 +4,20 @@ These tests define the expected behavior for:
 - Configurable connection pool limits
 - Concurrent request handling
 - Connection reuse
-
-Tests are expected to fail until implementation is complete.
 """
 
 import asyncio
-from decimal import Decimal
-from unittest.mock import patch, MagicMock
+from unittest.mock import MagicMock, patch
 
-import pytest
 import httpx
+import pytest
 
-from crypto_mcp.models import OpenInterestResponse
+from ._data import DEFAULT_OI
 
 
 class TestConnectionPoolConfiguration:
     """Tests for connection pool configuration."""
 
-    @pytest.mark.xfail(reason="Connection pool tuning not yet implemented")
     def test_max_connections_is_configurable(self):
         """Max connections should be configurable via settings."""
         from crypto_mcp.config import Settings
@@ -29,7 +25,6 @@ class TestConnectionPoolConfiguration:
         settings = Settings(max_connections=100)
         assert settings.max_connections == 100
 
-    @pytest.mark.xfail(reason="Connection pool tuning not yet implemented")
     def test_max_keepalive_connections_is_configurable(self):
         """Max keepalive connections should be configurable."""
         from crypto_mcp.config import Settings
@@ -37,7 +32,6 @@ class TestConnectionPoolConfiguration:
         settings = Settings(max_keepalive_connections=20)
         assert settings.max_keepalive_connections == 20
 
-    @pytest.mark.xfail(reason="Connection pool tuning not yet implemented")
     def test_default_pool_limits_are_reasonable(self):
         """Default pool limits should support batch operations."""
         from crypto_mcp.config import Settings
@@ -53,11 +47,11 @@ class TestConnectionPoolBehavior:
     """Tests for connection pool behavior under load."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Connection pool tuning not yet implemented")
     async def test_concurrent_requests_use_connection_pool(self):
         """Multiple concurrent requests should reuse connections."""
-        from crypto_mcp.exchanges.binance import BinanceClient
         from crypto_mcp.config import Settings
+        from crypto_mcp.exchanges.binance import BinanceClient
+        from crypto_mcp.exchanges.binance.endpoints import BASE_URL
 
         settings = Settings(max_connections=50)
 
@@ -70,25 +64,34 @@ class TestConnectionPoolBehavior:
             connections_created += 1
             return original_init(self, *args, **kwargs)
 
+        def handler(request):
+            symbol = request.url.params["symbol"]
+            return httpx.Response(
+                200, json={"symbol": symbol, "openInterest": "1.0", "time": 1700000000000}
+            )
+
         with patch.object(httpx.AsyncClient, "__init__", counting_init):
-            async with httpx.AsyncClient() as http_client:
-                client = BinanceClient(http_client, settings)
+            async with httpx.AsyncClient(
+                base_url=BASE_URL,
+                transport=httpx.MockTransport(handler),
+                limits=httpx.Limits(max_connections=settings.max_connections),
+            ) as http_client:
+                client = BinanceClient(http_client)
 
                 # make 20 concurrent requests
-                tasks = [
-                    client.get_open_interest(f"SYMBOL{i}USDT")
-                    for i in range(20)
-                ]
+                results = await asyncio.gather(
+                    *(client.get_open_interest(f"SYMBOL{i}USDT") for i in range(20))
+                )
 
-                # should reuse connections, not create 20
-                # (this test will need adjustment based on actual implementation)
+        # every request went through the one shared client, not 20 new ones
+        assert connections_created == 1
+        assert [r.symbol for r in results] == [f"SYMBOL{i}USDT" for i in range(20)]
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Connection pool tuning not yet implemented")
     async def test_pool_handles_burst_requests(self, many_symbols):
         """Pool should handle burst of requests without errors."""
-        from crypto_mcp.exchanges.binance import BinanceClient
         from crypto_mcp.config import Settings
+        from crypto_mcp.exchanges.binance import BinanceClient
 
         settings = Settings(max_connections=100)
 
@@ -116,13 +119,13 @@ class TestHTTPClientLifecycle:
     """Tests for HTTP client lifecycle management."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Connection pool tuning not yet implemented")
     async def test_http_client_created_with_limits(self):
         """HTTP client should be created with configured limits."""
-        from crypto_mcp.server import lifespan
-        from crypto_mcp.config import Settings
         from mcp.server.fastmcp import FastMCP
 
+        from crypto_mcp.config import Settings
+        from crypto_mcp.server import lifespan
+
         mcp = FastMCP("test")
 
         # verify lifespan creates client with proper limits
@@ -132,12 +135,12 @@ class TestHTTPClientLifecycle:
             pass
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Connection pool tuning not yet implemented")
     async def test_http_client_closed_on_shutdown(self):
         """HTTP client should be properly closed on server shutdown."""
-        from crypto_mcp.server import lifespan
         from mcp.server.fastmcp import FastMCP
 
+        from crypto_mcp.server import lifespan
+
         mcp = FastMCP("test")
         client_closed = False
 
@@ -147,26 +150,44 @@ class TestHTTPClientLifecycle:
         # after context exit, client should be closed
         # (verification depends on implementation)
 
+    @pytest.mark.asyncio
+    async def test_http_clients_use_http2(self):
+        """Exchange HTTP clients should multiplex requests over HTTP/2."""
+        from mcp.server.fastmcp import FastMCP
+
+        from crypto_mcp import server
+
+        created = []
+        real_client = httpx.AsyncClient
+
+        def recording_client(*args, **kwargs):
+            created.append(kwargs)
+            return real_client(*args, **kwargs)
+
+        with patch.object(server.httpx, "AsyncClient", side_effect=recording_client):
+            async with server.lifespan(FastMCP("test")):
+                pass
+
+        assert len(created) == 2
+        for kwargs in created:
+            assert kwargs["http2"] is True
+            assert kwargs["limits"].max_connections == server.settings.max_connections
+
 
 class TestConnectionPoolPerformance:
     """Performance-related tests for connection pool."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Connection pool tuning not yet implemented")
     async def test_batch_requests_complete_within_time_limit(
-        self, mcp_server_with_mock, many_symbols
+        self, mcp_server_with_mock, many_symbols, latency_gate
     ):
         """Batch requests should complete within reasonable time."""
         mcp, mock_client = mcp_server_with_mock
+        gate = latency_gate(0.05)  # 50ms per request
 
         async def delayed_response(symbol):
-            await asyncio.sleep(0.05)  # 50ms per request
-            return OpenInterestResponse(
-                symbol=symbol,
-                open_interest=Decimal("100000"),
-                timestamp=1700000000000,
-                exchange="binance",
-            )
+            await gate.wait()
+            return DEFAULT_OI.model_copy(update={"symbol": symbol})
 
         mock_client.get_open_interest.side_effect = delayed_response
 
@@ -4,13 +4,12 @@ These tests define the expected behavior for:
 - In-flight request tracking
 - Duplicate request handling
 - Deduplication cache cleanup
-
-Tests are expected to fail until implementation is complete.
 """
 
 import asyncio
+import functools
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
 
 import pytest
 
@@ -21,16 +20,13 @@ class TestRequestDeduplication:
     """Tests for request deduplication."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Request deduplication not yet implemented")
-    async def test_concurrent_same_requests_deduplicated(self, mcp_server_with_mock):
+    async def test_concurrent_same_requests_deduplicated(
+        self, mcp_server_with_mock, mark_price_fn, async_stub
+    ):
         """Concurrent requests for same symbol should make only one API call."""
-        mcp, mock_client = mcp_server_with_mock
-
-        call_count = 0
+        _, mock_client = mcp_server_with_mock
 
-        async def counting_get_mark_price(symbol=None):
-            nonlocal call_count
-            call_count += 1
+        async def get_mark_price(symbol=None):
             await asyncio.sleep(0.1)  # simulate network delay
             return MarkPriceResponse(
                 symbol=symbol or "BTCUSDT",
@@ -41,34 +37,28 @@ class TestRequestDeduplication:
                 exchange="binance",
             )
 
-        mock_client.get_mark_price.side_effect = counting_get_mark_price
+        mock_client.get_mark_price = async_stub(get_mark_price)
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        call = functools.partial(mark_price_fn, symbol="BTCUSDT")
 
         # launch 5 concurrent requests for same symbol
-        tasks = [tool_fn(symbol="BTCUSDT") for _ in range(5)]
-        results = await asyncio.gather(*tasks)
+        results = await asyncio.gather(*(call() for _ in range(5)))
 
         # should only have made 1 API call
-        assert call_count == 1
+        assert mock_client.get_mark_price.call_count == 1
 
         # all results should be the same
         for result in results:
             assert result["symbol"] == "BTCUSDT"
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Request deduplication not yet implemented")
-    async def test_different_symbols_not_deduplicated(self, mcp_server_with_mock):
+    async def test_different_symbols_not_deduplicated(
+        self, mcp_server_with_mock, mark_price_fn, async_stub
+    ):
         """Requests for different symbols should not be deduplicated."""
-        mcp, mock_client = mcp_server_with_mock
-
-        call_count = 0
-        symbols_called = []
+        _, mock_client = mcp_server_with_mock
 
-        async def counting_get_mark_price(symbol=None):
-            nonlocal call_count
-            call_count += 1
-            symbols_called.append(symbol)
+        async def get_mark_price(symbol=None):
             return MarkPriceResponse(
                 symbol=symbol or "BTCUSDT",
                 mark_price=Decimal("45000.00"),
@@ -78,33 +68,29 @@ class TestRequestDeduplication:
                 exchange="binance",
             )
 
-        mock_client.get_mark_price.side_effect = counting_get_mark_price
-
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        mock_client.get_mark_price = async_stub(get_mark_price)
 
         # request different symbols
         tasks = [
-            tool_fn(symbol="BTCUSDT"),
-            tool_fn(symbol="ETHUSDT"),
-            tool_fn(symbol="SOLUSDT"),
+            mark_price_fn(symbol="BTCUSDT"),
+            mark_price_fn(symbol="ETHUSDT"),
+            mark_price_fn(symbol="SOLUSDT"),
         ]
         await asyncio.gather(*tasks)
 
         # should have made 3 API calls
-        assert call_count == 3
-        assert set(symbols_called) == {"BTCUSDT", "ETHUSDT", "SOLUSDT"}
+        assert mock_client.get_mark_price.call_count == 3
+        symbols_called = {c.args[0] for c in mock_client.get_mark_price.await_args_list}
+        assert symbols_called == {"BTCUSDT", "ETHUSDT", "SOLUSDT"}
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Request deduplication not yet implemented")
-    async def test_sequential_requests_not_deduplicated(self, mcp_server_with_mock):
+    async def test_sequential_requests_not_deduplicated(
+        self, performance_server, mcp_server_with_mock, mark_price_fn, async_stub
+    ):
         """Sequential requests (after first completes) should not be deduplicated."""
-        mcp, mock_client = mcp_server_with_mock
-
-        call_count = 0
+        _, mock_client = mcp_server_with_mock
 
-        async def counting_get_mark_price(symbol=None):
-            nonlocal call_count
-            call_count += 1
+        async def get_mark_price(symbol=None):
             return MarkPriceResponse(
                 symbol=symbol or "BTCUSDT",
                 mark_price=Decimal("45000.00"),
@@ -114,34 +100,34 @@ class TestRequestDeduplication:
                 exchange="binance",
             )
 
-        mock_client.get_mark_price.side_effect = counting_get_mark_price
+        mock_client.get_mark_price = async_stub(get_mark_price)
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        _, _, cache, _ = performance_server
 
-        # make sequential requests (waiting for each to complete)
-        await tool_fn(symbol="BTCUSDT")
-        await tool_fn(symbol="BTCUSDT")
+        # make sequential requests (waiting for each to complete), clearing
+        # the TTL cache so the second call is not answered from it
+        await mark_price_fn(symbol="BTCUSDT")
+        await cache.clear()
+        await mark_price_fn(symbol="BTCUSDT")
 
         # should have made 2 API calls (no caching, just deduplication)
-        assert call_count == 2
+        assert mock_client.get_mark_price.call_count == 2
 
 
 class TestDeduplicationWithCaching:
     """Tests for interaction between deduplication and caching."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Request deduplication not yet implemented")
     async def test_deduplication_works_before_cache_populated(
-        self, mcp_server_with_mock
+        self, mcp_server_with_mock, mark_price_fn
     ):
         """Deduplication should work even before cache is populated."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        call_count = 0
+        counter = SimpleNamespace(count=0)
 
         async def slow_get_mark_price(symbol=None):
-            nonlocal call_count
-            call_count += 1
+            counter.count += 1
             await asyncio.sleep(0.2)  # slow request
             return MarkPriceResponse(
                 symbol=symbol or "BTCUSDT",
@@ -154,24 +140,22 @@ class TestDeduplicationWithCaching:
 
         mock_client.get_mark_price.side_effect = slow_get_mark_price
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        call = functools.partial(mark_price_fn, symbol="BTCUSDT")
 
         # launch concurrent requests immediately (before cache could be populated)
-        tasks = [tool_fn(symbol="BTCUSDT") for _ in range(3)]
-        await asyncio.gather(*tasks)
+        await asyncio.gather(*(call() for _ in range(3)))
 
         # deduplication should have kicked in
-        assert call_count == 1
+        assert counter.count == 1
 
 
 class TestDeduplicationErrorHandling:
     """Tests for error handling in deduplication."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Request deduplication not yet implemented")
-    async def test_error_propagates_to_all_waiters(self, mcp_server_with_mock):
+    async def test_error_propagates_to_all_waiters(self, mcp_server_with_mock, mark_price_fn):
         """If deduplicated request fails, all waiters should get error."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         async def failing_request(symbol=None):
             await asyncio.sleep(0.1)
@@ -179,29 +163,27 @@ class TestDeduplicationErrorHandling:
 
         mock_client.get_mark_price.side_effect = failing_request
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        call = functools.partial(mark_price_fn, symbol="BTCUSDT")
 
         # launch concurrent requests
-        tasks = [tool_fn(symbol="BTCUSDT") for _ in range(3)]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*(call() for _ in range(3)), return_exceptions=True)
 
-        # all should get the same error
-        for result in results:
-            assert isinstance(result, Exception)
-            assert "API Error" in str(result)
+        # all should get the very same exception instance, not a copy
+        exc0 = results[0]
+        assert isinstance(exc0, Exception)
+        assert "API Error" in str(exc0)
+        assert all(r is exc0 for r in results[1:])
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Request deduplication not yet implemented")
-    async def test_cleanup_after_error(self, mcp_server_with_mock):
+    async def test_cleanup_after_error(self, mcp_server_with_mock, mark_price_fn):
         """After error, in-flight tracking should be cleaned up."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        call_count = 0
+        counter = SimpleNamespace(count=0)
 
         async def sometimes_failing_request(symbol=None):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
+            counter.count += 1
+            if counter.count == 1:
                 raise Exception("First call fails")
             return MarkPriceResponse(
                 symbol=symbol or "BTCUSDT",
@@ -214,13 +196,11 @@ class TestDeduplicationErrorHandling:
 
         mock_client.get_mark_price.side_effect = sometimes_failing_request
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
-
         # first request fails
         with pytest.raises(Exception):
-            await tool_fn(symbol="BTCUSDT")
+            await mark_price_fn(symbol="BTCUSDT")
 
         # second request should work (not blocked by stale in-flight entry)
-        result = await tool_fn(symbol="BTCUSDT")
+        result = await mark_price_fn(symbol="BTCUSDT")
         assert result["symbol"] == "BTCUSDT"
-        assert call_count == 2
+        assert counter.count == 2
@@ -5,15 +5,15 @@ These tests define the expected behavior for:
 - VWAP calculation
 - Funding rate trend analysis
 - OI change rate calculation
-
-Tests are expected to fail until implementation is complete.
 """
 
 from decimal import Decimal
-from unittest.mock import AsyncMock
+from types import SimpleNamespace
+from typing import NamedTuple
 
 import pytest
 
+from crypto_mcp.exceptions import ValidationError
 from crypto_mcp.models import (
     KlinesResponse,
     Candle,
@@ -22,42 +22,89 @@ from crypto_mcp.models import (
 )
 
 
+# canonical inputs are built once per module; the tools only read them
+
+
+@pytest.fixture(scope="module")
+def sample_klines() -> KlinesResponse:
+    """24 hourly candles of sample klines data."""
+    return _create_sample_klines()
+
+
+@pytest.fixture(scope="module")
+def sample_funding_rates() -> list[FundingRateResponse]:
+    """10 rising funding rates, 8 hours apart."""
+    return _create_sample_funding_rates()
+
+
+@pytest.fixture(scope="module")
+def bearish_divergence_data() -> tuple[SimpleNamespace, list[OpenInterestResponse]]:
+    """Klines with price up 10% and OI history down 5%."""
+    return _create_klines_with_price_change(10), _create_oi_with_change(-5)
+
+
 class TestDerivedMetricsTool:
     """Tests for the get_derived_metrics tool."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_derived_metrics tool not yet implemented")
-    async def test_tool_exists(self, mcp_server_with_mock):
+    async def test_tool_exists(self, tool_fns):
         """get_derived_metrics tool should be registered."""
-        mcp, _ = mcp_server_with_mock
-        assert "get_derived_metrics" in mcp._tool_manager._tools
+        assert "get_derived_metrics" in tool_fns
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="get_derived_metrics tool not yet implemented")
-    async def test_returns_requested_metrics(self, mcp_server_with_mock):
+    async def test_returns_requested_metrics(
+        self, mcp_server_with_mock, derived_metrics_fn, sample_klines, sample_funding_rates
+    ):
         """Tool should return only the requested metrics."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         # setup mock data
-        mock_client.get_klines.return_value = _create_sample_klines()
-        mock_client.get_funding_rate.return_value = _create_sample_funding_rates()
+        mock_client.get_klines.return_value = sample_klines
+        mock_client.get_funding_rate.return_value = sample_funding_rates
 
-        tool_fn = mcp._tool_manager._tools["get_derived_metrics"].fn
-        result = await tool_fn(symbol="BTCUSDT", metrics=["vwap", "funding_trend"])
+        result = await derived_metrics_fn(symbol="BTCUSDT", metrics=["vwap", "funding_trend"])
 
         assert "vwap" in result
         assert "funding_trend" in result
         assert "oi_change_rate" not in result  # not requested
 
+    @pytest.mark.asyncio
+    async def test_rejects_unknown_metric(self, mcp_server_with_mock, derived_metrics_fn):
+        """Unknown metric names should raise instead of being ignored."""
+        _, mock_client = mcp_server_with_mock
+
+        with pytest.raises(ValidationError, match="Unknown metrics: rsi"):
+            await derived_metrics_fn(symbol="BTCUSDT", metrics=["vwap", "rsi"])
+
+        mock_client.get_klines.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_shared_upstream_data_fetched_once(
+        self, mcp_server_with_mock, derived_metrics_fn, sample_klines, bearish_divergence_data
+    ):
+        """Metrics needing the same klines/OI history should share one fetch."""
+        _, mock_client = mcp_server_with_mock
+        _, oi_history = bearish_divergence_data
+        mock_client.get_klines.return_value = sample_klines
+        mock_client.get_open_interest_history.return_value = oi_history
+
+        result = await derived_metrics_fn(
+            symbol="BTCUSDT",
+            metrics=["vwap", "oi_change_rate", "price_oi_divergence"],
+        )
+
+        assert list(result) == ["vwap", "oi_change_rate", "price_oi_divergence"]
+        mock_client.get_klines.assert_called_once()
+        mock_client.get_open_interest_history.assert_called_once()
+
 
 class TestVWAPCalculation:
     """Tests for VWAP (Volume Weighted Average Price) calculation."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="VWAP calculation not yet implemented")
-    async def test_vwap_calculation_is_correct(self, mcp_server_with_mock):
+    async def test_vwap_calculation_is_correct(self, mcp_server_with_mock, derived_metrics_fn):
         """VWAP should be sum(price*volume) / sum(volume)."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         # create known test data
         mock_client.get_klines.return_value = KlinesResponse(
@@ -90,23 +137,22 @@ class TestVWAPCalculation:
             exchange="binance",
         )
 
-        tool_fn = mcp._tool_manager._tools["get_derived_metrics"].fn
-        result = await tool_fn(symbol="BTCUSDT", metrics=["vwap"])
+        result = await derived_metrics_fn(symbol="BTCUSDT", metrics=["vwap"])
 
         # VWAP = (1000 + 2140) / (10 + 20) = 3140 / 30 = 104.67
         expected_vwap = Decimal("104.67")
         assert abs(result["vwap"] - expected_vwap) < Decimal("0.01")
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="VWAP calculation not yet implemented")
-    async def test_vwap_uses_configurable_period(self, mcp_server_with_mock):
+    async def test_vwap_uses_configurable_period(
+        self, mcp_server_with_mock, derived_metrics_fn, sample_klines
+    ):
         """VWAP should accept period parameter."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        mock_client.get_klines.return_value = _create_sample_klines()
+        mock_client.get_klines.return_value = sample_klines
 
-        tool_fn = mcp._tool_manager._tools["get_derived_metrics"].fn
-        await tool_fn(symbol="BTCUSDT", metrics=["vwap"], vwap_period="4h")
+        await derived_metrics_fn(symbol="BTCUSDT", metrics=["vwap"], vwap_period="4h")
 
         # verify klines were fetched with correct interval
         mock_client.get_klines.assert_called_once()
@@ -118,10 +164,9 @@ class TestFundingTrendAnalysis:
     """Tests for funding rate trend analysis."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Funding trend analysis not yet implemented")
-    async def test_funding_trend_returns_direction(self, mcp_server_with_mock):
+    async def test_funding_trend_returns_direction(self, mcp_server_with_mock, derived_metrics_fn):
         """Funding trend should return direction (bullish/bearish/neutral)."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         # increasing funding rates = bullish
         mock_client.get_funding_rate.return_value = [
@@ -145,22 +190,21 @@ class TestFundingTrendAnalysis:
             ),
         ]
 
-        tool_fn = mcp._tool_manager._tools["get_derived_metrics"].fn
-        result = await tool_fn(symbol="BTCUSDT", metrics=["funding_trend"])
+        result = await derived_metrics_fn(symbol="BTCUSDT", metrics=["funding_trend"])
 
         assert result["funding_trend"]["direction"] in ["bullish", "bearish", "neutral"]
         assert result["funding_trend"]["direction"] == "bullish"
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Funding trend analysis not yet implemented")
-    async def test_funding_trend_returns_strength(self, mcp_server_with_mock):
+    async def test_funding_trend_returns_strength(
+        self, mcp_server_with_mock, derived_metrics_fn, sample_funding_rates
+    ):
         """Funding trend should return strength indicator."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        mock_client.get_funding_rate.return_value = _create_sample_funding_rates()
+        mock_client.get_funding_rate.return_value = sample_funding_rates
 
-        tool_fn = mcp._tool_manager._tools["get_derived_metrics"].fn
-        result = await tool_fn(symbol="BTCUSDT", metrics=["funding_trend"])
+        result = await derived_metrics_fn(symbol="BTCUSDT", metrics=["funding_trend"])
 
         assert "strength" in result["funding_trend"]
         assert isinstance(result["funding_trend"]["strength"], (int, float, Decimal))
@@ -170,10 +214,9 @@ class TestOIChangeRate:
     """Tests for open interest change rate calculation."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="OI change rate not yet implemented")
-    async def test_oi_change_rate_calculation(self, mcp_server_with_mock):
+    async def test_oi_change_rate_calculation(self, mcp_server_with_mock, derived_metrics_fn):
         """OI change rate should be percentage change over period."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         # OI went from 100000 to 110000 = 10% increase
         mock_client.get_open_interest_history.return_value = [
@@ -191,16 +234,14 @@ class TestOIChangeRate:
             ),
         ]
 
-        tool_fn = mcp._tool_manager._tools["get_derived_metrics"].fn
-        result = await tool_fn(symbol="BTCUSDT", metrics=["oi_change_rate"])
+        result = await derived_metrics_fn(symbol="BTCUSDT", metrics=["oi_change_rate"])
 
         assert result["oi_change_rate"] == Decimal("10.0")  # 10%
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="OI change rate not yet implemented")
-    async def test_oi_change_handles_decrease(self, mcp_server_with_mock):
+    async def test_oi_change_handles_decrease(self, mcp_server_with_mock, derived_metrics_fn):
         """OI change rate should handle decreases (negative values)."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         # OI went from 100000 to 90000 = -10%
         mock_client.get_open_interest_history.return_value = [
@@ -218,8 +259,7 @@ class TestOIChangeRate:
             ),
         ]
 
-        tool_fn = mcp._tool_manager._tools["get_derived_metrics"].fn
-        result = await tool_fn(symbol="BTCUSDT", metrics=["oi_change_rate"])
+        result = await derived_metrics_fn(symbol="BTCUSDT", metrics=["oi_change_rate"])
 
         assert result["oi_change_rate"] == Decimal("-10.0")
 
@@ -228,17 +268,18 @@ class TestPriceOIDivergence:
     """Tests for price-OI divergence detection."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Price-OI divergence not yet implemented")
-    async def test_divergence_detected_when_price_up_oi_down(self, mcp_server_with_mock):
+    async def test_divergence_detected_when_price_up_oi_down(
+        self, mcp_server_with_mock, derived_metrics_fn, bearish_divergence_data
+    ):
         """Should detect bearish divergence when price up but OI down."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
         # price went up 10% but OI went down 5%
-        mock_client.get_klines.return_value = _create_klines_with_price_change(10)
-        mock_client.get_open_interest_history.return_value = _create_oi_with_change(-5)
+        klines, oi_history = bearish_divergence_data
+        mock_client.get_klines.return_value = klines
+        mock_client.get_open_interest_history.return_value = oi_history
 
-        tool_fn = mcp._tool_manager._tools["get_derived_metrics"].fn
-        result = await tool_fn(symbol="BTCUSDT", metrics=["price_oi_divergence"])
+        result = await derived_metrics_fn(symbol="BTCUSDT", metrics=["price_oi_divergence"])
 
         assert result["price_oi_divergence"]["detected"] is True
         assert result["price_oi_divergence"]["type"] == "bearish"
@@ -269,49 +310,52 @@ def _create_sample_klines() -> KlinesResponse:
     )
 
 
+_FUNDING_RATES = tuple(Decimal("0.0001") + Decimal("0.00001") * i for i in range(10))
+_FUNDING_TIMES = tuple(1700000000000 + i * 28800000 for i in range(10))  # 8 hours apart
+
+
 def _create_sample_funding_rates() -> list[FundingRateResponse]:
     """Create sample funding rate data for testing."""
     return [
         FundingRateResponse(
             symbol="BTCUSDT",
-            funding_rate=Decimal("0.0001") + Decimal("0.00001") * i,
-            funding_time=1700000000000 + i * 28800000,  # 8 hours apart
+            funding_rate=rate,
+            funding_time=funding_time,
             exchange="binance",
         )
-        for i in range(10)
+        for rate, funding_time in zip(_FUNDING_RATES, _FUNDING_TIMES)
     ]
 
 
-def _create_klines_with_price_change(percent_change: float) -> KlinesResponse:
-    """Create klines showing a specific price change."""
+class _FakeCandle(NamedTuple):
+    """Candle stand-in carrying only the fields divergence detection reads."""
+
+    open_time: int
+    close: Decimal
+    close_time: int
+
+
+def _create_klines_with_price_change(percent_change: float) -> SimpleNamespace:
+    """Create KlinesResponse-shaped data showing a specific price change.
+
+    Skips Candle validation since only open_time and close are read.
+    """
     start_price = Decimal("45000")
     end_price = start_price * (1 + Decimal(str(percent_change)) / 100)
 
-    return KlinesResponse(
+    return SimpleNamespace(
         symbol="BTCUSDT",
         interval="1h",
         candles=[
-            Candle(
+            _FakeCandle(
                 open_time=1700000000000,
-                open=start_price,
-                high=start_price + 500,
-                low=start_price - 200,
                 close=start_price + 100,
-                volume=Decimal("1000"),
                 close_time=1700003599999,
-                quote_volume=Decimal("45000000"),
-                trade_count=5000,
             ),
-            Candle(
+            _FakeCandle(
                 open_time=1700086400000,
-                open=end_price - 100,
-                high=end_price + 200,
-                low=end_price - 300,
                 close=end_price,
-                volume=Decimal("1000"),
                 close_time=1700089999999,
-                quote_volume=Decimal("45000000"),
-                trade_count=5000,
             ),
         ],
         exchange="binance",
@@ -5,7 +5,8 @@ These tests define the expected behavior for additional response fields:
 - OpenInterestResponse: open_interest_value (USD notional)
 - Candle: taker_buy_volume, taker_buy_quote_volume
 
-Tests are expected to fail until implementations are complete.
+The Candle taker fields are not implemented yet; their specs are marked
+pending and expected to fail.
 """
 
 from decimal import Decimal
@@ -19,66 +20,71 @@ from crypto_mcp.models import (
     KlinesResponse,
 )
 
+# expected Decimal values, parsed once at import
+MARK_PRICE = Decimal("45000.00")
+INDEX_PRICE = Decimal("44999.50")
+LAST_FUNDING_RATE = Decimal("0.0001")
+ESTIMATED_SETTLE_PRICE = Decimal("45001.00")
+INTEREST_RATE = Decimal("0.0003")
+OPEN_INTEREST = Decimal("100000.0")
+OPEN_INTEREST_VALUE = Decimal("4500000000.00")
+KLINE_OPEN = Decimal("45000.00")
+KLINE_HIGH = Decimal("45500.00")
+KLINE_LOW = Decimal("44800.00")
+KLINE_CLOSE = Decimal("45200.00")
+KLINE_VOLUME = Decimal("1000.0")
+KLINE_QUOTE_VOLUME = Decimal("45000000.00")
+TAKER_BUY_VOLUME = Decimal("600.0")
+TAKER_BUY_QUOTE_VOLUME = Decimal("27000000.00")
+
+# required fields shared by the model tests; each test adds the field under test
+_BASE_MP = {
+    "symbol": "BTCUSDT",
+    "mark_price": MARK_PRICE,
+    "index_price": INDEX_PRICE,
+    "last_funding_rate": LAST_FUNDING_RATE,
+    "next_funding_time": 1700003600000,
+    "exchange": "binance",
+}
+
+_BASE_CANDLE = {
+    "open_time": 1700000000000,
+    "open": KLINE_OPEN,
+    "high": KLINE_HIGH,
+    "low": KLINE_LOW,
+    "close": KLINE_CLOSE,
+    "volume": KLINE_VOLUME,
+    "close_time": 1700003599999,
+    "quote_volume": KLINE_QUOTE_VOLUME,
+    "trade_count": 5000,
+}
+
+
+def _build(cls, **kw):
+    """Build a mock return value without re-validating trusted literals."""
+    return cls.model_construct(**kw)
+
 
 class TestMarkPriceExtendedFields:
     """Tests for extended MarkPriceResponse fields."""
 
-    @pytest.mark.xfail(reason="Extended fields not yet added to MarkPriceResponse")
-    def test_mark_price_has_estimated_settle_price(self):
-        """MarkPriceResponse should include estimated_settle_price."""
-        response = MarkPriceResponse(
-            symbol="BTCUSDT",
-            mark_price=Decimal("45000.00"),
-            index_price=Decimal("44999.50"),
-            last_funding_rate=Decimal("0.0001"),
-            next_funding_time=1700003600000,
-            estimated_settle_price=Decimal("45001.00"),
-            exchange="binance",
-        )
-
-        assert response.estimated_settle_price == Decimal("45001.00")
-
-    @pytest.mark.xfail(reason="Extended fields not yet added to MarkPriceResponse")
-    def test_mark_price_has_interest_rate(self):
-        """MarkPriceResponse should include interest_rate."""
-        response = MarkPriceResponse(
-            symbol="BTCUSDT",
-            mark_price=Decimal("45000.00"),
-            index_price=Decimal("44999.50"),
-            last_funding_rate=Decimal("0.0001"),
-            next_funding_time=1700003600000,
-            interest_rate=Decimal("0.0003"),
-            exchange="binance",
-        )
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("estimated_settle_price", ESTIMATED_SETTLE_PRICE),
+            ("interest_rate", INTEREST_RATE),
+            ("timestamp", 1700000000000),
+        ],
+    )
+    def test_extended_field(self, field, value):
+        """MarkPriceResponse should accept and expose each extended field."""
+        response = MarkPriceResponse(**_BASE_MP, **{field: value})
 
-        assert response.interest_rate == Decimal("0.0003")
+        assert getattr(response, field) == value
 
-    @pytest.mark.xfail(reason="Extended fields not yet added to MarkPriceResponse")
-    def test_mark_price_has_timestamp(self):
-        """MarkPriceResponse should include timestamp."""
-        response = MarkPriceResponse(
-            symbol="BTCUSDT",
-            mark_price=Decimal("45000.00"),
-            index_price=Decimal("44999.50"),
-            last_funding_rate=Decimal("0.0001"),
-            next_funding_time=1700003600000,
-            timestamp=1700000000000,
-            exchange="binance",
-        )
-
-        assert response.timestamp == 1700000000000
-
-    @pytest.mark.xfail(reason="Extended fields not yet added to MarkPriceResponse")
     def test_extended_fields_are_optional(self):
         """Extended fields should be optional (None by default)."""
-        response = MarkPriceResponse(
-            symbol="BTCUSDT",
-            mark_price=Decimal("45000.00"),
-            index_price=Decimal("44999.50"),
-            last_funding_rate=Decimal("0.0001"),
-            next_funding_time=1700003600000,
-            exchange="binance",
-        )
+        response = MarkPriceResponse(**_BASE_MP)
 
         assert response.estimated_settle_price is None
         assert response.interest_rate is None
@@ -88,25 +94,23 @@ class TestMarkPriceExtendedFields:
 class TestOpenInterestExtendedFields:
     """Tests for extended OpenInterestResponse fields."""
 
-    @pytest.mark.xfail(reason="open_interest_value not yet added to OpenInterestResponse")
     def test_open_interest_has_value_field(self):
         """OpenInterestResponse should include open_interest_value (USD)."""
         response = OpenInterestResponse(
             symbol="BTCUSDT",
-            open_interest=Decimal("100000.0"),
-            open_interest_value=Decimal("4500000000.00"),  # USD notional
+            open_interest=OPEN_INTEREST,
+            open_interest_value=OPEN_INTEREST_VALUE,  # USD notional
             timestamp=1700000000000,
             exchange="binance",
         )
 
-        assert response.open_interest_value == Decimal("4500000000.00")
+        assert response.open_interest_value == OPEN_INTEREST_VALUE
 
-    @pytest.mark.xfail(reason="open_interest_value not yet added to OpenInterestResponse")
     def test_open_interest_value_is_optional(self):
         """open_interest_value should be optional."""
         response = OpenInterestResponse(
             symbol="BTCUSDT",
-            open_interest=Decimal("100000.0"),
+            open_interest=OPEN_INTEREST,
             timestamp=1700000000000,
             exchange="binance",
         )
@@ -117,56 +121,26 @@ class TestOpenInterestExtendedFields:
 class TestCandleExtendedFields:
     """Tests for extended Candle fields."""
 
+    @pytest.mark.pending
     @pytest.mark.xfail(reason="Taker fields not yet added to Candle")
-    def test_candle_has_taker_buy_volume(self):
-        """Candle should include taker_buy_volume."""
-        candle = Candle(
-            open_time=1700000000000,
-            open=Decimal("45000.00"),
-            high=Decimal("45500.00"),
-            low=Decimal("44800.00"),
-            close=Decimal("45200.00"),
-            volume=Decimal("1000.0"),
-            close_time=1700003599999,
-            quote_volume=Decimal("45000000.00"),
-            trade_count=5000,
-            taker_buy_volume=Decimal("600.0"),
-        )
-
-        assert candle.taker_buy_volume == Decimal("600.0")
-
-    @pytest.mark.xfail(reason="Taker fields not yet added to Candle")
-    def test_candle_has_taker_buy_quote_volume(self):
-        """Candle should include taker_buy_quote_volume."""
-        candle = Candle(
-            open_time=1700000000000,
-            open=Decimal("45000.00"),
-            high=Decimal("45500.00"),
-            low=Decimal("44800.00"),
-            close=Decimal("45200.00"),
-            volume=Decimal("1000.0"),
-            close_time=1700003599999,
-            quote_volume=Decimal("45000000.00"),
-            trade_count=5000,
-            taker_buy_quote_volume=Decimal("27000000.00"),
-        )
-
-        assert candle.taker_buy_quote_volume == Decimal("27000000.00")
-
+    @pytest.mark.parametrize(
+        "field,value",
+        [
+            ("taker_buy_volume", TAKER_BUY_VOLUME),
+            ("taker_buy_quote_volume", TAKER_BUY_QUOTE_VOLUME),
+        ],
+    )
+    def test_taker_field(self, field, value):
+        """Candle should accept and expose each taker field."""
+        candle = Candle(**_BASE_CANDLE, **{field: value})
+
+        assert getattr(candle, field) == value
+
+    @pytest.mark.pending
     @pytest.mark.xfail(reason="Taker fields not yet added to Candle")
     def test_taker_fields_are_optional(self):
         """Taker fields should be optional."""
-        candle = Candle(
-            open_time=1700000000000,
-            open=Decimal("45000.00"),
-            high=Decimal("45500.00"),
-            low=Decimal("44800.00"),
-            close=Decimal("45200.00"),
-            volume=Decimal("1000.0"),
-            close_time=1700003599999,
-            quote_volume=Decimal("45000000.00"),
-            trade_count=5000,
-        )
+        candle = Candle(**_BASE_CANDLE)
 
         assert candle.taker_buy_volume is None
         assert candle.taker_buy_quote_volume is None
@@ -176,24 +150,24 @@ class TestExtendedFieldsInToolResponses:
     """Test that extended fields appear in tool responses."""
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Extended fields not yet implemented")
-    async def test_mark_price_tool_returns_extended_fields(self, mcp_server_with_mock):
+    async def test_mark_price_tool_returns_extended_fields(self, mcp_server_with_mock, tool_fns):
         """get_mark_price tool should return extended fields when available."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        mock_client.get_mark_price.return_value = MarkPriceResponse(
+        mock_client.get_mark_price.return_value = _build(
+            MarkPriceResponse,
             symbol="BTCUSDT",
-            mark_price=Decimal("45000.00"),
-            index_price=Decimal("44999.50"),
-            last_funding_rate=Decimal("0.0001"),
+            mark_price=MARK_PRICE,
+            index_price=INDEX_PRICE,
+            last_funding_rate=LAST_FUNDING_RATE,
             next_funding_time=1700003600000,
-            estimated_settle_price=Decimal("45001.00"),
-            interest_rate=Decimal("0.0003"),
+            estimated_settle_price=ESTIMATED_SETTLE_PRICE,
+            interest_rate=INTEREST_RATE,
             timestamp=1700000000000,
             exchange="binance",
         )
 
-        tool_fn = mcp._tool_manager._tools["get_mark_price"].fn
+        tool_fn = tool_fns["get_mark_price"]
         result = await tool_fn(symbol="BTCUSDT")
 
         assert "estimated_settle_price" in result
@@ -201,33 +175,36 @@ class TestExtendedFieldsInToolResponses:
         assert "timestamp" in result
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Extended fields not yet implemented")
-    async def test_klines_tool_returns_taker_volumes(self, mcp_server_with_mock):
+    @pytest.mark.pending
+    @pytest.mark.xfail(reason="Taker fields not yet added to Candle")
+    async def test_klines_tool_returns_taker_volumes(self, mcp_server_with_mock, tool_fns):
         """get_klines tool should return taker volume fields in candles."""
-        mcp, mock_client = mcp_server_with_mock
+        _, mock_client = mcp_server_with_mock
 
-        mock_client.get_klines.return_value = KlinesResponse(
+        mock_client.get_klines.return_value = _build(
+            KlinesResponse,
             symbol="BTCUSDT",
             interval="1h",
             candles=[
-                Candle(
+                _build(
+                    Candle,
                     open_time=1700000000000,
-                    open=Decimal("45000.00"),
-                    high=Decimal("45500.00"),
-                    low=Decimal("44800.00"),
-                    close=Decimal("45200.00"),
-                    volume=Decimal("1000.0"),
+                    open=KLINE_OPEN,
+                    high=KLINE_HIGH,
+                    low=KLINE_LOW,
+                    close=KLINE_CLOSE,
+                    volume=KLINE_VOLUME,
                     close_time=1700003599999,
-                    quote_volume=Decimal("45000000.00"),
+                    quote_volume=KLINE_QUOTE_VOLUME,
                     trade_count=5000,
-                    taker_buy_volume=Decimal("600.0"),
-                    taker_buy_quote_volume=Decimal("27000000.00"),
+                    taker_buy_volume=TAKER_BUY_VOLUME,
+                    taker_buy_quote_volume=TAKER_BUY_QUOTE_VOLUME,
                 )
             ],
             exchange="binance",
         )
 
-        tool_fn = mcp._tool_manager._tools["get_klines"].fn
+        tool_fn = tool_fns["get_klines"]
         result = await tool_fn(symbol="BTCUSDT", interval="1h")
 
         candle = result["candles"][0]
@@ -9,160 +9,143 @@ Tests are expected to fail until implementation is complete.
 """
 
 import asyncio
-from decimal import Decimal
-from unittest.mock import AsyncMock, patch, MagicMock
+import logging
+from unittest.mock import patch
 
-import pytest
 import httpx
+import pytest
 
+from crypto_mcp.config import Settings
+from crypto_mcp.exchanges.binance import BinanceClient
 from crypto_mcp.exchanges.binance.exceptions import (
-    BinanceRateLimitError,
     BinanceAPIError,
+    BinanceRateLimitError,
 )
 from crypto_mcp.models import OpenInterestResponse
 
+# raw open interest body returned by mocked BinanceClient._request
+_OI_PAYLOAD = b'{"symbol":"BTCUSDT","openInterest":"100000","time":1700000000000}'
+
+
+def _rate_limited() -> BinanceRateLimitError:
+    return BinanceRateLimitError("Rate limit exceeded")
+
 
 class TestRetryOnRateLimit:
     """Test retry behavior for rate limit errors."""
 
     @pytest.mark.asyncio
+    @pytest.mark.pending
     @pytest.mark.xfail(reason="Retry logic not yet implemented")
-    async def test_retries_on_rate_limit_error(self, mock_binance_client):
+    async def test_retries_on_rate_limit_error(self, prepared_client):
         """Should retry when rate limit error occurs."""
-        from crypto_mcp.exchanges.binance import BinanceClient
-
         # setup: fail twice with rate limit, succeed on third try
-        call_count = 0
+        outcomes = [_rate_limited(), _rate_limited(), _OI_PAYLOAD]
 
-        async def mock_request(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count < 3:
-                raise BinanceRateLimitError("Rate limit exceeded")
-            return {"symbol": "BTCUSDT", "openInterest": "100000", "time": 1700000000000}
+        with patch.object(BinanceClient, "_request", side_effect=outcomes) as mock_request:
+            result = await prepared_client.get_open_interest("BTCUSDT")
 
-        with patch.object(BinanceClient, "_request", side_effect=mock_request):
-            client = BinanceClient(httpx.AsyncClient(), MagicMock())
-            result = await client.get_open_interest("BTCUSDT")
-
-        assert call_count == 3
+        assert mock_request.call_count == 3
         assert result.symbol == "BTCUSDT"
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Retry logic not yet implemented")
-    async def test_gives_up_after_max_retries(self, mock_binance_client):
+    async def test_gives_up_after_max_retries(self, prepared_client):
         """Should raise error after max retries exceeded."""
-        from crypto_mcp.exchanges.binance import BinanceClient
-
         async def always_rate_limit(*args, **kwargs):
             raise BinanceRateLimitError("Rate limit exceeded")
 
-        with patch.object(BinanceClient, "_request", side_effect=always_rate_limit):
-            client = BinanceClient(httpx.AsyncClient(), MagicMock())
-
-            with pytest.raises(BinanceRateLimitError):
-                await client.get_open_interest("BTCUSDT")
+        with (
+            patch.object(BinanceClient, "_request", side_effect=always_rate_limit),
+            pytest.raises(BinanceRateLimitError),
+        ):
+            await prepared_client.get_open_interest("BTCUSDT")
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Retry logic not yet implemented")
-    async def test_does_not_retry_on_other_errors(self, mock_binance_client):
+    async def test_does_not_retry_on_other_errors(self, prepared_client):
         """Should not retry on non-rate-limit errors."""
-        from crypto_mcp.exchanges.binance import BinanceClient
-
-        call_count = 0
+        error = BinanceAPIError(-1000, "Unknown error")
 
-        async def mock_request(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            raise BinanceAPIError(-1000, "Unknown error")
-
-        with patch.object(BinanceClient, "_request", side_effect=mock_request):
-            client = BinanceClient(httpx.AsyncClient(), MagicMock())
-
-            with pytest.raises(BinanceAPIError):
-                await client.get_open_interest("BTCUSDT")
+        with (
+            patch.object(BinanceClient, "_request", side_effect=error) as mock_request,
+            pytest.raises(BinanceAPIError),
+        ):
+            await prepared_client.get_open_interest("BTCUSDT")
 
         # should only try once, no retries
-        assert call_count == 1
+        assert mock_request.call_count == 1
 
 
 class TestExponentialBackoff:
     """Test exponential backoff timing."""
 
     @pytest.mark.asyncio
+    @pytest.mark.pending
     @pytest.mark.xfail(reason="Retry logic not yet implemented")
-    async def test_backoff_delays_increase_exponentially(self):
+    async def test_backoff_delays_increase_exponentially(self, prepared_client):
         """Delays should be 1s, 2s, 4s (exponential)."""
-        from crypto_mcp.exchanges.binance import BinanceClient
-
         delays = []
 
         async def mock_sleep(seconds):
             delays.append(seconds)
 
-        call_count = 0
+        outcomes = [_rate_limited(), _rate_limited(), _rate_limited(), _OI_PAYLOAD]
 
-        async def mock_request(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count < 4:
-                raise BinanceRateLimitError("Rate limit exceeded")
-            return {"symbol": "BTCUSDT", "openInterest": "100000", "time": 1700000000000}
-
-        with patch("asyncio.sleep", side_effect=mock_sleep):
-            with patch.object(BinanceClient, "_request", side_effect=mock_request):
-                client = BinanceClient(httpx.AsyncClient(), MagicMock())
-                await client.get_open_interest("BTCUSDT")
+        with (
+            patch("asyncio.sleep", side_effect=mock_sleep),
+            patch.object(BinanceClient, "_request", side_effect=outcomes),
+        ):
+            await prepared_client.get_open_interest("BTCUSDT")
 
         assert delays == [1.0, 2.0, 4.0]
 
     @pytest.mark.asyncio
-    @pytest.mark.xfail(reason="Retry logic not yet implemented")
-    async def test_total_retry_time_is_bounded(self):
-        """Total retry time should not exceed reasonable limit."""
-        from crypto_mcp.exchanges.binance import BinanceClient
+    async def test_total_retry_time_is_bounded(self, monkeypatch):
+        """Total retry backoff should not exceed reasonable limit."""
+        slept = []
+
+        async def fake_sleep(seconds):
+            # advance a virtual clock instead of waiting
+            slept.append(seconds)
 
-        start = asyncio.get_event_loop().time()
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
 
         async def always_rate_limit(*args, **kwargs):
             raise BinanceRateLimitError("Rate limit exceeded")
 
-        with patch.object(BinanceClient, "_request", side_effect=always_rate_limit):
-            client = BinanceClient(httpx.AsyncClient(), MagicMock())
+        async with httpx.AsyncClient() as http:
+            client = BinanceClient(http, max_retries=4)
 
-            with pytest.raises(BinanceRateLimitError):
+            with (
+                patch.object(BinanceClient, "_do_request", side_effect=always_rate_limit),
+                pytest.raises(BinanceRateLimitError),
+            ):
                 await client.get_open_interest("BTCUSDT")
 
-        elapsed = asyncio.get_event_loop().time() - start
-
-        # with 3 retries (1s + 2s + 4s = 7s) plus overhead
-        assert elapsed < 10.0
+        # 3 retries back off 1s + 2s + 4s = 7s of virtual time
+        assert sum(slept) == 7.0
 
 
 class TestRetryConfiguration:
     """Test retry configuration options."""
 
+    @pytest.mark.pending
     @pytest.mark.xfail(reason="Retry logic not yet implemented")
     def test_max_retries_is_configurable(self):
         """Max retries should be configurable via settings."""
-        from crypto_mcp.config import Settings
-
         settings = Settings(max_retries=5)
         assert settings.max_retries == 5
 
+    @pytest.mark.pending
     @pytest.mark.xfail(reason="Retry logic not yet implemented")
     def test_base_delay_is_configurable(self):
         """Base delay should be configurable via settings."""
-        from crypto_mcp.config import Settings
-
         settings = Settings(retry_base_delay=2.0)
         assert settings.retry_base_delay == 2.0
 
+    @pytest.mark.pending
     @pytest.mark.xfail(reason="Retry logic not yet implemented")
     def test_retry_can_be_disabled(self):
         """Retry should be disableable via settings."""
-        from crypto_mcp.config import Settings
-
         settings = Settings(retry_enabled=False)
         assert settings.retry_enabled is False
 
@@ -171,24 +154,16 @@ class TestRetryLogging:
     """Test retry logging behavior."""
 
     @pytest.mark.asyncio
+    @pytest.mark.pending
     @pytest.mark.xfail(reason="Retry logic not yet implemented")
-    async def test_retries_are_logged(self, caplog):
+    async def test_retries_are_logged(self, prepared_client, caplog):
         """Retry attempts should be logged."""
-        from crypto_mcp.exchanges.binance import BinanceClient
-        import logging
+        outcomes = [_rate_limited(), _OI_PAYLOAD]
 
-        call_count = 0
-
-        async def mock_request(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count < 2:
-                raise BinanceRateLimitError("Rate limit exceeded")
-            return {"symbol": "BTCUSDT", "openInterest": "100000", "time": 1700000000000}
-
-        with caplog.at_level(logging.WARNING):
-            with patch.object(BinanceClient, "_request", side_effect=mock_request):
-                client = BinanceClient(httpx.AsyncClient(), MagicMock())
-                await client.get_open_interest("BTCUSDT")
+        with (
+            caplog.at_level(logging.WARNING),
+            patch.object(BinanceClient, "_request", side_effect=outcomes),
+        ):
+            await prepared_client.get_open_interest("BTCUSDT")
 
         assert "retry" in caplog.text.lower() or "rate limit" in caplog.text.lower()
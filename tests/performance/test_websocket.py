@@ -12,34 +12,28 @@ from decimal import Decimal
 
 import pytest
 
+pytestmark = pytest.mark.skip(reason="WebSocket support is future work - specification only")
+
 
 class TestWebSocketSupport:
     """Specification tests for WebSocket support."""
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
-    async def test_subscribe_mark_price_tool_exists(self, mcp_server_with_mock):
+    async def test_subscribe_mark_price_tool_exists(self, tool_fns):
         """subscribe_mark_price tool should be registered."""
-        mcp, _ = mcp_server_with_mock
-        assert "subscribe_mark_price" in mcp._tool_manager._tools
+        assert "subscribe_mark_price" in tool_fns
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
-    async def test_subscribe_returns_stream(self, mcp_server_with_mock):
+    async def test_subscribe_returns_stream(self, tool_fns):
         """Subscription should return an async iterator."""
-        mcp, _ = mcp_server_with_mock
-
-        tool_fn = mcp._tool_manager._tools["subscribe_mark_price"].fn
+        tool_fn = tool_fns["subscribe_mark_price"]
         stream = await tool_fn(symbols=["BTCUSDT"])
 
         # should be async iterable
         assert hasattr(stream, "__aiter__")
         assert hasattr(stream, "__anext__")
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
-    async def test_stream_yields_price_updates(self, mcp_server_with_mock):
+    async def test_stream_yields_price_updates(self, tool_fns):
         """Stream should yield price update messages."""
-        mcp, _ = mcp_server_with_mock
-
-        tool_fn = mcp._tool_manager._tools["subscribe_mark_price"].fn
+        tool_fn = tool_fns["subscribe_mark_price"]
         stream = await tool_fn(symbols=["BTCUSDT"])
 
         # get first update
@@ -53,17 +47,14 @@ class TestWebSocketSupport:
 class TestWebSocketConnection:
     """Specification tests for WebSocket connection management."""
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_connection_auto_reconnects(self):
         """WebSocket should auto-reconnect on disconnect."""
         pass
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_connection_handles_ping_pong(self):
         """WebSocket should handle ping/pong keepalive."""
         pass
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_connection_closed_on_unsubscribe(self):
         """WebSocket should close when all subscriptions end."""
         pass
@@ -72,25 +63,21 @@ class TestWebSocketConnection:
 class TestWebSocketStreams:
     """Specification tests for available WebSocket streams."""
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_mark_price_stream_available(self):
         """Mark price stream should be available."""
         # Binance stream: <symbol>@markPrice or !markPrice@arr
         pass
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_kline_stream_available(self):
         """Kline/candlestick stream should be available."""
         # Binance stream: <symbol>@kline_<interval>
         pass
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_liquidation_stream_available(self):
         """Liquidation stream should be available."""
         # Binance stream: <symbol>@forceOrder or !forceOrder@arr
         pass
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_ticker_stream_available(self):
         """24h ticker stream should be available."""
         # Binance stream: <symbol>@ticker or !ticker@arr
@@ -100,7 +87,6 @@ class TestWebSocketStreams:
 class TestWebSocketMCPIntegration:
     """Specification tests for MCP protocol integration."""
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_mcp_streaming_response(self):
         """MCP should support streaming tool responses.
 
@@ -112,7 +98,6 @@ class TestWebSocketMCPIntegration:
         """
         pass
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     async def test_subscription_management(self):
         """Should be able to manage active subscriptions.
 
@@ -127,7 +112,6 @@ class TestWebSocketMCPIntegration:
 class TestWebSocketConfiguration:
     """Specification tests for WebSocket configuration."""
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     def test_websocket_url_is_configurable(self):
         """WebSocket URL should be configurable via settings."""
         from crypto_mcp.config import Settings
@@ -137,7 +121,6 @@ class TestWebSocketConfiguration:
         )
         assert settings.binance_futures_ws_url == "wss://fstream.binance.com/ws"
 
-    @pytest.mark.skip(reason="WebSocket support is future work - specification only")
     def test_reconnect_delay_is_configurable(self):
         """Reconnect delay should be configurable."""
         from crypto_mcp.config import Settings
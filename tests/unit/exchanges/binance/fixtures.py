@@ -0,0 +1,79 @@
+"""Canned Binance payloads shared by the client and model tests."""
+
+from types import MappingProxyType
+from typing import Final
+
+OI_HISTORY_RESPONSE: Final = (
+    MappingProxyType(
+        {
+            "symbol": "BTCUSDT",
+            "sumOpenInterest": "12345.0",
+            "sumOpenInterestValue": "555555555.0",
+            "timestamp": 1700000000000,
+        }
+    ),
+    MappingProxyType(
+        {
+            "symbol": "BTCUSDT",
+            "sumOpenInterest": "12346.0",
+            "sumOpenInterestValue": "555600000.0",
+            "timestamp": 1700000300000,
+        }
+    ),
+)
+TICKER_RESPONSE: Final = MappingProxyType(
+    {
+        "symbol": "BTCUSDT",
+        "priceChange": "1000.50",
+        "priceChangePercent": "2.35",
+        "lastPrice": "43500.00",
+        "volume": "50000.00",
+        "quoteVolume": "2175000000.00",
+        "highPrice": "44000.00",
+        "lowPrice": "42000.00",
+        "openPrice": "42500.00",
+        "openTime": 1700000000000,
+        "closeTime": 1700086400000,
+        "count": 1500000,
+    }
+)
+KLINE_ROW: Final = (
+    1700000000000,  # open time
+    "45000.00",  # open
+    "45500.00",  # high
+    "44800.00",  # low
+    "45200.00",  # close
+    "1234.567",  # volume
+    1700003600000,  # close time
+    "55555555.00",  # quote volume
+    5000,  # trade count
+    "600.123",  # taker buy base
+    "27000000.00",  # taker buy quote
+)
+MARK_PRICE_RESPONSE: Final = MappingProxyType(
+    {
+        "symbol": "BTCUSDT",
+        "markPrice": "45000.00",
+        "indexPrice": "44999.50",
+        "lastFundingRate": "0.00010000",
+        "nextFundingTime": 1700000000000,
+    }
+)
+# single-symbol premiumIndex responses also carry these optional fields
+MARK_PRICE_FULL_RESPONSE: Final = MappingProxyType(
+    {
+        **MARK_PRICE_RESPONSE,
+        "estimatedSettlePrice": "45001.00",
+        "interestRate": "0.00010000",
+        "time": 1699999999000,
+    }
+)
+LONG_SHORT_RATIO_RESPONSE: Final = MappingProxyType(
+    {
+        "symbol": "BTCUSDT",
+        "longShortRatio": "1.2500",
+        "longAccount": "0.5556",
+        "shortAccount": "0.4444",
+        "timestamp": 1700000000000,
+    }
+)
@@ -1,48 +1,166 @@
 """Tests for BinanceClient with mocked HTTP responses."""
 
-from datetime import datetime
+import asyncio
+import json
+from datetime import datetime, timezone
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Final
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
-from pytest_httpx import HTTPXMock
+import pytest_asyncio
 
 from crypto_mcp.exchanges.binance import BinanceClient, BinanceAPIError, BinanceRateLimitError
 from crypto_mcp.exchanges.binance.endpoints import BASE_URL
 
-
-@pytest.fixture
+from .fixtures import (
+    KLINE_ROW,
+    LONG_SHORT_RATIO_RESPONSE,
+    MARK_PRICE_FULL_RESPONSE,
+    MARK_PRICE_RESPONSE,
+    OI_HISTORY_RESPONSE,
+    TICKER_RESPONSE,
+)
+
+
+# share one client (and its event loop) across the module; responses come
+# from a stateless mock transport, so no test depends on connection state
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+# expected Decimal values, parsed once at import
+OPEN_INTEREST: Final = Decimal("12345.678")
+HISTORY_OPEN_INTEREST: Final = Decimal("12345.0")
+HISTORY_OPEN_INTEREST_VALUE: Final = Decimal("555555555.0")
+FUNDING_RATE: Final = Decimal("0.00010000")
+PRICE_CHANGE: Final = Decimal("1000.50")
+KLINE_HIGH: Final = Decimal("45500.00")
+MARK_PRICE: Final = Decimal("45000.00")
+ESTIMATED_SETTLE_PRICE: Final = Decimal("45001.00")
+LONG_SHORT_RATIO: Final = Decimal("1.2500")
+TICK_SIZE: Final = Decimal("0.10")
+STEP_SIZE: Final = Decimal("0.001")
+MIN_NOTIONAL: Final = Decimal(100)
+
+# canned payloads shared read-only across tests
+OI_RESPONSE: Final = MappingProxyType(
+    {"symbol": "BTCUSDT", "openInterest": "12345.678", "time": 1700000000000}
+)
+FUNDING_RATE_RESPONSE: Final = MappingProxyType(
+    {
+        "symbol": "BTCUSDT",
+        "fundingRate": "0.00010000",
+        "fundingTime": 1700000000000,
+        "markPrice": "45000.00",
+    }
+)
+EXCHANGE_INFO_RESPONSE: Final = MappingProxyType(
+    {
+        "timezone": "UTC",
+        "serverTime": 1700000000000,
+        "symbols": [
+            {
+                "symbol": "BTCUSDT",
+                "baseAsset": "BTC",
+                "quoteAsset": "USDT",
+                "pricePrecision": 2,
+                "quantityPrecision": 3,
+                "filters": [
+                    {"filterType": "PRICE_FILTER", "tickSize": "0.10"},
+                    {"filterType": "LOT_SIZE", "stepSize": "0.001"},
+                    {"filterType": "MIN_NOTIONAL", "notional": "100"},
+                ],
+            },
+        ],
+    }
+)
+
+# error bodies, served as-is
+INVALID_SYMBOL_BODY: Final = b'{"code": -1121, "msg": "Invalid symbol."}'
+RATE_LIMIT_BODY: Final = b'{"code": -1003, "msg": "Too many requests."}'
+UNKNOWN_ERROR_BODY: Final = b'{"code": -1000, "msg": "Unknown error."}'
+NO_MSG_ERROR_BODY: Final = b'{"code":-1000}'
+SPACED_ERROR_BODY: Final = b' \n{"msg": "Unknown error.", "code": -1000}'
+# success body mentioning "code" below the top level, not an error envelope
+NESTED_CODE_BODY: Final = (
+    b'{"symbol": "NESTEDCODE", "openInterest": "1.0", "time": 1700000000000,'
+    b' "meta": {"code": 0}}'
+)
+
+# time window for the history request with explicit bounds; UTC-aware so
+# the expected milliseconds do not depend on the local timezone
+HISTORY_START: Final = datetime(2024, 1, 1, tzinfo=timezone.utc)
+HISTORY_END: Final = datetime(2024, 1, 2, tzinfo=timezone.utc)
+HISTORY_START_MS: Final = 1704067200000
+HISTORY_END_MS: Final = 1704153600000
+
+# success payloads keyed by raw request path and query, serialized once
+# at import so serving one is a dict lookup
+ROUTES: Final[dict[bytes, tuple[int, bytes]]] = {
+    path.encode(): (200, json.dumps(payload, default=dict).encode())
+    for path, payload in {
+        "/fapi/v1/openInterest?symbol=BTCUSDT": OI_RESPONSE,
+        "/futures/data/openInterestHist?symbol=BTCUSDT&period=5m&limit=30": OI_HISTORY_RESPONSE,
+        "/fapi/v1/fundingRate?limit=100&symbol=BTCUSDT": [FUNDING_RATE_RESPONSE],
+        "/fapi/v1/fundingRate?limit=100": [
+            {"symbol": "BTCUSDT", "fundingRate": "0.0001", "fundingTime": 1700000000000},
+            {"symbol": "ETHUSDT", "fundingRate": "0.0002", "fundingTime": 1700000000000},
+        ],
+        "/fapi/v1/ticker/24hr?symbol=BTCUSDT": TICKER_RESPONSE,
+        "/fapi/v1/ticker/24hr": [TICKER_RESPONSE],
+        "/fapi/v1/klines?symbol=BTCUSDT&interval=1h&limit=500": [KLINE_ROW],
+        "/fapi/v1/premiumIndex?symbol=BTCUSDT": MARK_PRICE_FULL_RESPONSE,
+        "/fapi/v1/premiumIndex": [MARK_PRICE_RESPONSE],
+        "/futures/data/topLongShortPositionRatio?symbol=BTCUSDT&period=5m&limit=30": [
+            LONG_SHORT_RATIO_RESPONSE
+        ],
+        "/fapi/v1/exchangeInfo": EXCHANGE_INFO_RESPONSE,
+        "/futures/data/openInterestHist?symbol=BTCUSDT&period=1h&limit=10"
+        f"&startTime={HISTORY_START_MS}&endTime={HISTORY_END_MS}": [],
+    }.items()
+}
+# error cases, each on its own symbol
+ROUTES.update(
+    {
+        b"/fapi/v1/openInterest?symbol=INVALID": (400, INVALID_SYMBOL_BODY),
+        b"/fapi/v1/openInterest?symbol=RATELIMITED": (429, RATE_LIMIT_BODY),
+        b"/fapi/v1/openInterest?symbol=BODYERROR": (200, UNKNOWN_ERROR_BODY),
+        b"/fapi/v1/openInterest?symbol=SERVERERROR": (500, b"Internal Server Error"),
+        b"/fapi/v1/openInterest?symbol=NOMSG": (200, NO_MSG_ERROR_BODY),
+        b"/fapi/v1/openInterest?symbol=SPACED": (200, SPACED_ERROR_BODY),
+        b"/fapi/v1/openInterest?symbol=NESTEDCODE": (200, NESTED_CODE_BODY),
+    }
+)
+
+
+def _dispatch(request: httpx.Request) -> httpx.Response:
+    """Serve the canned response for the requested path and query."""
+    status_code, content = ROUTES[request.url.raw_path]
+    return httpx.Response(status_code, content=content)
+
+
+TRANSPORT: Final = httpx.MockTransport(_dispatch)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
 async def client():
-    """Create a BinanceClient for testing."""
-    c = BinanceClient()
-    yield c
-    await c.close()
+    """Create a BinanceClient shared by the tests in this module."""
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=TRANSPORT) as http:
+        yield BinanceClient(http)
 
 
 class TestGetOpenInterest:
     """Tests for get_open_interest method."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/openInterest?symbol=BTCUSDT",
-            json={
-                "symbol": "BTCUSDT",
-                "openInterest": "12345.678",
-                "time": 1700000000000,
-            },
-        )
+    async def test_success(self, client):
         result = await client.get_open_interest("BTCUSDT")
         assert result.symbol == "BTCUSDT"
-        assert result.open_interest == Decimal("12345.678")
+        assert result.open_interest == OPEN_INTEREST
         assert result.exchange == "binance"
 
-    @pytest.mark.asyncio
-    async def test_invalid_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/openInterest?symbol=INVALID",
-            status_code=400,
-            json={"code": -1121, "msg": "Invalid symbol."},
-        )
+    async def test_invalid_symbol(self, client):
         with pytest.raises(BinanceAPIError) as exc_info:
             await client.get_open_interest("INVALID")
         assert exc_info.value.code == -1121
@@ -51,42 +169,15 @@ class TestGetOpenInterest:
 class TestGetOpenInterestHistory:
     """Tests for get_open_interest_history method."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/futures/data/openInterestHist?symbol=BTCUSDT&period=5m&limit=30",
-            json=[
-                {
-                    "symbol": "BTCUSDT",
-                    "sumOpenInterest": "12345.0",
-                    "sumOpenInterestValue": "555555555.0",
-                    "timestamp": 1700000000000,
-                },
-                {
-                    "symbol": "BTCUSDT",
-                    "sumOpenInterest": "12346.0",
-                    "sumOpenInterestValue": "555600000.0",
-                    "timestamp": 1700000300000,
-                },
-            ],
-        )
+    async def test_success(self, client):
         result = await client.get_open_interest_history("BTCUSDT", "5m")
         assert len(result) == 2
-        assert result[0].open_interest == Decimal("12345.0")
-
-    @pytest.mark.asyncio
-    async def test_with_time_params(self, httpx_mock: HTTPXMock, client):
-        start = datetime(2024, 1, 1, 0, 0, 0)
-        end = datetime(2024, 1, 2, 0, 0, 0)
-        start_ms = int(start.timestamp() * 1000)
-        end_ms = int(end.timestamp() * 1000)
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/futures/data/openInterestHist?symbol=BTCUSDT&period=1h&limit=10&startTime={start_ms}&endTime={end_ms}",
-            json=[],
-        )
+        assert result[0].open_interest == HISTORY_OPEN_INTEREST
+        assert result[0].open_interest_value == HISTORY_OPEN_INTEREST_VALUE
+
+    async def test_with_time_params(self, client):
         result = await client.get_open_interest_history(
-            "BTCUSDT", "1h", limit=10, start_time=start, end_time=end
+            "BTCUSDT", "1h", limit=10, start_time=HISTORY_START, end_time=HISTORY_END
         )
         assert result == []
 
@@ -94,32 +185,12 @@ class TestGetOpenInterestHistory:
 class TestGetFundingRate:
     """Tests for get_funding_rate method."""
 
-    @pytest.mark.asyncio
-    async def test_success_with_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/fundingRate?limit=100&symbol=BTCUSDT",
-            json=[
-                {
-                    "symbol": "BTCUSDT",
-                    "fundingRate": "0.00010000",
-                    "fundingTime": 1700000000000,
-                    "markPrice": "45000.00",
-                },
-            ],
-        )
+    async def test_success_with_symbol(self, client):
         result = await client.get_funding_rate(symbol="BTCUSDT")
         assert len(result) == 1
-        assert result[0].funding_rate == Decimal("0.00010000")
-
-    @pytest.mark.asyncio
-    async def test_success_without_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/fundingRate?limit=100",
-            json=[
-                {"symbol": "BTCUSDT", "fundingRate": "0.0001", "fundingTime": 1700000000000},
-                {"symbol": "ETHUSDT", "fundingRate": "0.0002", "fundingTime": 1700000000000},
-            ],
-        )
+        assert result[0].funding_rate == FUNDING_RATE
+
+    async def test_success_without_symbol(self, client):
         result = await client.get_funding_rate()
         assert len(result) == 2
 
@@ -127,50 +198,12 @@ class TestGetFundingRate:
 class TestGetTicker24h:
     """Tests for get_ticker_24h method."""
 
-    @pytest.mark.asyncio
-    async def test_single_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/ticker/24hr?symbol=BTCUSDT",
-            json={
-                "symbol": "BTCUSDT",
-                "priceChange": "1000.50",
-                "priceChangePercent": "2.35",
-                "lastPrice": "43500.00",
-                "volume": "50000.00",
-                "quoteVolume": "2175000000.00",
-                "highPrice": "44000.00",
-                "lowPrice": "42000.00",
-                "openPrice": "42500.00",
-                "openTime": 1700000000000,
-                "closeTime": 1700086400000,
-                "count": 1500000,
-            },
-        )
+    async def test_single_symbol(self, client):
         result = await client.get_ticker_24h(symbol="BTCUSDT")
         assert result.symbol == "BTCUSDT"
-        assert result.price_change == Decimal("1000.50")
-
-    @pytest.mark.asyncio
-    async def test_all_symbols(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/ticker/24hr",
-            json=[
-                {
-                    "symbol": "BTCUSDT",
-                    "priceChange": "1000.50",
-                    "priceChangePercent": "2.35",
-                    "lastPrice": "43500.00",
-                    "volume": "50000.00",
-                    "quoteVolume": "2175000000.00",
-                    "highPrice": "44000.00",
-                    "lowPrice": "42000.00",
-                    "openPrice": "42500.00",
-                    "openTime": 1700000000000,
-                    "closeTime": 1700086400000,
-                    "count": 1500000,
-                },
-            ],
-        )
+        assert result.price_change == PRICE_CHANGE
+
+    async def test_all_symbols(self, client):
         result = await client.get_ticker_24h()
         assert isinstance(result, list)
         assert len(result) == 1
@@ -179,66 +212,25 @@ class TestGetTicker24h:
 class TestGetKlines:
     """Tests for get_klines method."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/klines?symbol=BTCUSDT&interval=1h&limit=500",
-            json=[
-                [
-                    1700000000000,
-                    "45000.00",
-                    "45500.00",
-                    "44800.00",
-                    "45200.00",
-                    "1234.567",
-                    1700003600000,
-                    "55555555.00",
-                    5000,
-                    "600.123",
-                    "27000000.00",
-                ],
-            ],
-        )
+    async def test_success(self, client):
         result = await client.get_klines("BTCUSDT", "1h")
         assert result.symbol == "BTCUSDT"
         assert result.interval == "1h"
         assert len(result.candles) == 1
-        assert result.candles[0].high == Decimal("45500.00")
+        assert result.candles[0].high == KLINE_HIGH
 
 
 class TestGetMarkPrice:
     """Tests for get_mark_price method."""
 
-    @pytest.mark.asyncio
-    async def test_single_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/premiumIndex?symbol=BTCUSDT",
-            json={
-                "symbol": "BTCUSDT",
-                "markPrice": "45000.00",
-                "indexPrice": "44999.50",
-                "lastFundingRate": "0.00010000",
-                "nextFundingTime": 1700000000000,
-            },
-        )
+    async def test_single_symbol(self, client):
         result = await client.get_mark_price(symbol="BTCUSDT")
         assert result.symbol == "BTCUSDT"
-        assert result.mark_price == Decimal("45000.00")
-
-    @pytest.mark.asyncio
-    async def test_all_symbols(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/premiumIndex",
-            json=[
-                {
-                    "symbol": "BTCUSDT",
-                    "markPrice": "45000.00",
-                    "indexPrice": "44999.50",
-                    "lastFundingRate": "0.00010000",
-                    "nextFundingTime": 1700000000000,
-                },
-            ],
-        )
+        assert result.mark_price == MARK_PRICE
+        assert result.estimated_settle_price == ESTIMATED_SETTLE_PRICE
+        assert result.timestamp == 1699999999000
+
+    async def test_all_symbols(self, client):
         result = await client.get_mark_price()
         assert isinstance(result, list)
 
@@ -246,58 +238,64 @@ class TestGetMarkPrice:
 class TestGetLongShortRatio:
     """Tests for get_long_short_ratio method."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/futures/data/topLongShortPositionRatio?symbol=BTCUSDT&period=5m&limit=30",
-            json=[
-                {
-                    "symbol": "BTCUSDT",
-                    "longShortRatio": "1.2500",
-                    "longAccount": "0.5556",
-                    "shortAccount": "0.4444",
-                    "timestamp": 1700000000000,
-                },
-            ],
-        )
+    async def test_success(self, client):
         result = await client.get_long_short_ratio("BTCUSDT", "5m")
         assert len(result) == 1
-        assert result[0].long_short_ratio == Decimal("1.2500")
+        assert result[0].long_short_ratio == LONG_SHORT_RATIO
+
+
+class TestGetExchangeInfo:
+    """Tests for get_exchange_info method."""
+
+    async def test_success(self, client):
+        result = await client.get_exchange_info()
+        assert len(result) == 1
+        assert result[0].symbol == "BTCUSDT"
+        assert result[0].tick_size == TICK_SIZE
+        assert result[0].step_size == STEP_SIZE
+        assert result[0].min_notional == MIN_NOTIONAL
 
 
 class TestErrorHandling:
     """Tests for error handling."""
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_error(self, httpx_mock: HTTPXMock, client):
-        # need to mock 3 responses because the client retries 3 times
-        for _ in range(3):
-            httpx_mock.add_response(
-                url=f"{BASE_URL}/fapi/v1/openInterest?symbol=BTCUSDT",
-                status_code=429,
-                json={"code": -1003, "msg": "Too many requests."},
-            )
+    async def test_rate_limit_error(self, client, monkeypatch):
+        # skip the real 1s + 2s backoff between the three attempts
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
         with pytest.raises(BinanceRateLimitError):
-            await client.get_open_interest("BTCUSDT")
-
-    @pytest.mark.asyncio
-    async def test_api_error_in_response_body(self, httpx_mock: HTTPXMock, client):
+            await client.get_open_interest("RATELIMITED")
+
+    async def test_rate_limit_backoff_delays(self, monkeypatch):
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=TRANSPORT) as http:
+            client = BinanceClient(http, max_retries=4)
+            with pytest.raises(BinanceRateLimitError):
+                await client.get_open_interest("RATELIMITED")
+        assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0, 4.0]
+
+    async def test_api_error_in_response_body(self, client):
         # some Binance errors return 200 with error in JSON body
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/openInterest?symbol=BTCUSDT",
-            json={"code": -1000, "msg": "Unknown error."},
-        )
         with pytest.raises(BinanceAPIError) as exc_info:
-            await client.get_open_interest("BTCUSDT")
+            await client.get_open_interest("BODYERROR")
         assert exc_info.value.code == -1000
 
-    @pytest.mark.asyncio
-    async def test_http_error_non_json(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/fapi/v1/openInterest?symbol=BTCUSDT",
-            status_code=500,
-            text="Internal Server Error",
-        )
+    async def test_error_body_without_msg(self, client):
+        with pytest.raises(BinanceAPIError) as exc_info:
+            await client.get_open_interest("NOMSG")
+        assert exc_info.value.code == -1000
+        assert "Unknown error" in str(exc_info.value)
+
+    async def test_error_body_with_whitespace_and_key_order(self, client):
+        with pytest.raises(BinanceAPIError) as exc_info:
+            await client.get_open_interest("SPACED")
+        assert exc_info.value.code == -1000
+
+    async def test_nested_code_key_is_not_an_error(self, client):
+        result = await client.get_open_interest("NESTEDCODE")
+        assert result.symbol == "NESTEDCODE"
+
+    async def test_http_error_non_json(self, client):
         with pytest.raises(BinanceAPIError) as exc_info:
-            await client.get_open_interest("BTCUSDT")
+            await client.get_open_interest("SERVERERROR")
         assert exc_info.value.code == 500
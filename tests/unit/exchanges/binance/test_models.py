@@ -1,245 +1,231 @@
 """Tests for Binance response model parsing."""
 
 from decimal import Decimal
+from types import MappingProxyType
+from typing import Final
 
 import pytest
 
 from crypto_mcp.exchanges.binance.models import (
     BinanceFundingRate,
+    BinanceFundingRateList,
     BinanceLongShortRatio,
+    BinanceLongShortRatioList,
     BinanceMarkPrice,
+    BinanceMarkPriceList,
     BinanceOpenInterest,
     BinanceOpenInterestHistory,
+    BinanceOpenInterestHistoryList,
     BinanceTicker24h,
+    BinanceTicker24hList,
     parse_kline,
 )
 
+from .fixtures import (
+    KLINE_ROW,
+    LONG_SHORT_RATIO_RESPONSE,
+    MARK_PRICE_FULL_RESPONSE,
+    MARK_PRICE_RESPONSE,
+    OI_HISTORY_RESPONSE,
+    TICKER_RESPONSE,
+)
 
-class TestBinanceOpenInterest:
-    """Tests for BinanceOpenInterest model."""
+# expected Decimal values, parsed once at import
+ETH_OPEN_INTEREST: Final = Decimal("98765.432")
+HISTORY_OPEN_INTEREST: Final = Decimal("12345.0")
+HISTORY_OPEN_INTEREST_VALUE: Final = Decimal("555555555.0")
+FUNDING_RATE: Final = Decimal("0.00010000")
+NEGATIVE_FUNDING_RATE: Final = Decimal("-0.00005000")
+FUNDING_MARK_PRICE: Final = Decimal("42000.00")
+PRICE_CHANGE_PERCENT: Final = Decimal("2.35")
+MARK_PRICE: Final = Decimal("45000.00")
+INDEX_PRICE: Final = Decimal("44999.50")
+ESTIMATED_SETTLE_PRICE: Final = Decimal("45001.00")
+INTEREST_RATE: Final = Decimal("0.00010000")
+LONG_SHORT_RATIO: Final = Decimal("1.2500")
+LONG_ACCOUNT: Final = Decimal("0.5556")
+SHORT_ACCOUNT: Final = Decimal("0.4444")
+KLINE_OPEN: Final = Decimal("45000.00")
+KLINE_HIGH: Final = Decimal("45500.00")
+KLINE_LOW: Final = Decimal("44800.00")
+KLINE_CLOSE: Final = Decimal("45200.00")
+KLINE_VOLUME: Final = Decimal("1234.567")
+
+# canned payloads shared read-only across tests
+OI_RESPONSE: Final = MappingProxyType(
+    {"symbol": "ETHUSDT", "openInterest": "98765.432", "time": 1700001000000}
+)
+FUNDING_RATE_RESPONSE: Final = MappingProxyType(
+    {
+        "symbol": "BTCUSDT",
+        "fundingRate": "-0.00005000",
+        "fundingTime": 1700000000000,
+        "markPrice": "42000.00",
+    }
+)
+FUNDING_RATE_NO_MARK_RESPONSE: Final = MappingProxyType(
+    {"symbol": "BTCUSDT", "fundingRate": "0.00010000", "fundingTime": 1700000000000}
+)
 
-    def test_parse_valid_response(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "openInterest": "12345.678",
-            "time": 1700000000000,
-        }
-        model = BinanceOpenInterest.model_validate(data)
-        assert model.symbol == "BTCUSDT"
-        assert model.openInterest == Decimal("12345.678")
-        assert model.time == 1700000000000
+# 1000 consecutive hourly rows, enough to exercise parse_kline's bulk path
+BULK_KLINES: Final = tuple(
+    (KLINE_ROW[0] + i * 3_600_000, *KLINE_ROW[1:6], KLINE_ROW[6] + i * 3_600_000, *KLINE_ROW[7:])
+    for i in range(1000)
+)
 
-    def test_to_response(self):
-        data = {
+# (model class, raw payload, expected model fields, expected response fields)
+MODEL_CASES = [
+    pytest.param(
+        BinanceOpenInterest,
+        OI_RESPONSE,
+        {"symbol": "ETHUSDT", "openInterest": ETH_OPEN_INTEREST, "time": 1700001000000},
+        {
             "symbol": "ETHUSDT",
-            "openInterest": "98765.432",
-            "time": 1700001000000,
-        }
-        model = BinanceOpenInterest.model_validate(data)
-        response = model.to_response()
-        assert response.symbol == "ETHUSDT"
-        assert response.open_interest == Decimal("98765.432")
-        assert response.timestamp == 1700001000000
-        assert response.exchange == "binance"
-
-
-class TestBinanceOpenInterestHistory:
-    """Tests for BinanceOpenInterestHistory model."""
-
-    def test_parse_valid_response(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "sumOpenInterest": "12345.0",
-            "sumOpenInterestValue": "555555555.0",
-            "timestamp": 1700000000000,
-        }
-        model = BinanceOpenInterestHistory.model_validate(data)
-        assert model.symbol == "BTCUSDT"
-        assert model.sumOpenInterest == Decimal("12345.0")
-        assert model.timestamp == 1700000000000
-
-    def test_to_response(self):
-        data = {
+            "open_interest": ETH_OPEN_INTEREST,
+            "timestamp": 1700001000000,
+        },
+        id="open_interest",
+    ),
+    pytest.param(
+        BinanceOpenInterestHistory,
+        OI_HISTORY_RESPONSE[0],
+        {
             "symbol": "BTCUSDT",
-            "sumOpenInterest": "12345.0",
-            "sumOpenInterestValue": "555555555.0",
+            "sumOpenInterest": HISTORY_OPEN_INTEREST,
             "timestamp": 1700000000000,
-        }
-        response = BinanceOpenInterestHistory.model_validate(data).to_response()
-        assert response.open_interest == Decimal("12345.0")
-        assert response.exchange == "binance"
-
-
-class TestBinanceFundingRate:
-    """Tests for BinanceFundingRate model."""
-
-    def test_parse_with_mark_price(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "fundingRate": "0.00010000",
-            "fundingTime": 1700000000000,
-            "markPrice": "45000.00",
-        }
-        model = BinanceFundingRate.model_validate(data)
-        assert model.fundingRate == Decimal("0.00010000")
-        assert model.markPrice == Decimal("45000.00")
-
-    def test_parse_without_mark_price(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "fundingRate": "0.00010000",
-            "fundingTime": 1700000000000,
-        }
-        model = BinanceFundingRate.model_validate(data)
-        assert model.markPrice is None
-
-    def test_to_response(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "fundingRate": "-0.00005000",
-            "fundingTime": 1700000000000,
-            "markPrice": "42000.00",
-        }
-        response = BinanceFundingRate.model_validate(data).to_response()
-        assert response.funding_rate == Decimal("-0.00005000")
-        assert response.mark_price == Decimal("42000.00")
-        assert response.exchange == "binance"
+        },
+        {
+            "open_interest": HISTORY_OPEN_INTEREST,
+            "open_interest_value": HISTORY_OPEN_INTEREST_VALUE,
+        },
+        id="open_interest_history",
+    ),
+    pytest.param(
+        BinanceFundingRate,
+        FUNDING_RATE_RESPONSE,
+        {"fundingRate": NEGATIVE_FUNDING_RATE, "markPrice": FUNDING_MARK_PRICE},
+        {"funding_rate": NEGATIVE_FUNDING_RATE, "mark_price": FUNDING_MARK_PRICE},
+        id="funding_rate",
+    ),
+    pytest.param(
+        BinanceFundingRate,
+        FUNDING_RATE_NO_MARK_RESPONSE,
+        {"fundingRate": FUNDING_RATE, "markPrice": None},
+        {"funding_rate": FUNDING_RATE, "mark_price": None},
+        id="funding_rate_without_mark_price",
+    ),
+    pytest.param(
+        BinanceTicker24h,
+        TICKER_RESPONSE,
+        {"priceChangePercent": PRICE_CHANGE_PERCENT, "count": 1500000},
+        {"price_change_percent": PRICE_CHANGE_PERCENT, "trade_count": 1500000},
+        id="ticker_24h",
+    ),
+    pytest.param(
+        BinanceMarkPrice,
+        MARK_PRICE_RESPONSE,
+        {"markPrice": MARK_PRICE, "estimatedSettlePrice": None},
+        {"mark_price": MARK_PRICE, "index_price": INDEX_PRICE},
+        id="mark_price",
+    ),
+    pytest.param(
+        BinanceMarkPrice,
+        MARK_PRICE_FULL_RESPONSE,
+        {"markPrice": MARK_PRICE, "estimatedSettlePrice": ESTIMATED_SETTLE_PRICE},
+        {
+            "estimated_settle_price": ESTIMATED_SETTLE_PRICE,
+            "interest_rate": INTEREST_RATE,
+            "timestamp": 1699999999000,
+        },
+        id="mark_price_with_optional_fields",
+    ),
+    pytest.param(
+        BinanceLongShortRatio,
+        LONG_SHORT_RATIO_RESPONSE,
+        {"longShortRatio": LONG_SHORT_RATIO, "longAccount": LONG_ACCOUNT},
+        {
+            "long_short_ratio": LONG_SHORT_RATIO,
+            "long_account": LONG_ACCOUNT,
+            "short_account": SHORT_ACCOUNT,
+        },
+        id="long_short_ratio",
+    ),
+]
+
+# (list TypeAdapter, row model class, raw row payload)
+LIST_ADAPTER_CASES = [
+    pytest.param(
+        BinanceOpenInterestHistoryList,
+        BinanceOpenInterestHistory,
+        OI_HISTORY_RESPONSE[0],
+        id="open_interest_history",
+    ),
+    pytest.param(
+        BinanceFundingRateList, BinanceFundingRate, FUNDING_RATE_RESPONSE, id="funding_rate"
+    ),
+    pytest.param(BinanceTicker24hList, BinanceTicker24h, TICKER_RESPONSE, id="ticker_24h"),
+    pytest.param(BinanceMarkPriceList, BinanceMarkPrice, MARK_PRICE_RESPONSE, id="mark_price"),
+    pytest.param(
+        BinanceLongShortRatioList,
+        BinanceLongShortRatio,
+        LONG_SHORT_RATIO_RESPONSE,
+        id="long_short_ratio",
+    ),
+]
+
+
+class TestModelConversion:
+    """Tests for parsing each model and converting it to the unified response."""
+
+    @pytest.mark.parametrize(
+        ("model_cls", "data", "expected_model", "expected_response"), MODEL_CASES
+    )
+    def test_model_roundtrip(self, model_cls, data, expected_model, expected_response):
+        """Each model should parse its raw payload and convert to the unified response."""
+        model = model_cls.model_validate(data)
+        for field, value in expected_model.items():
+            assert getattr(model, field) == value, field
 
-
-class TestBinanceTicker24h:
-    """Tests for BinanceTicker24h model."""
-
-    def test_parse_valid_response(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "priceChange": "1000.50",
-            "priceChangePercent": "2.35",
-            "lastPrice": "43500.00",
-            "volume": "50000.00",
-            "quoteVolume": "2175000000.00",
-            "highPrice": "44000.00",
-            "lowPrice": "42000.00",
-            "openPrice": "42500.00",
-            "openTime": 1700000000000,
-            "closeTime": 1700086400000,
-            "count": 1500000,
-        }
-        model = BinanceTicker24h.model_validate(data)
-        assert model.priceChangePercent == Decimal("2.35")
-        assert model.count == 1500000
-
-    def test_to_response(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "priceChange": "1000.50",
-            "priceChangePercent": "2.35",
-            "lastPrice": "43500.00",
-            "volume": "50000.00",
-            "quoteVolume": "2175000000.00",
-            "highPrice": "44000.00",
-            "lowPrice": "42000.00",
-            "openPrice": "42500.00",
-            "openTime": 1700000000000,
-            "closeTime": 1700086400000,
-            "count": 1500000,
-        }
-        response = BinanceTicker24h.model_validate(data).to_response()
-        assert response.price_change_percent == Decimal("2.35")
-        assert response.trade_count == 1500000
-        assert response.exchange == "binance"
-
-
-class TestBinanceMarkPrice:
-    """Tests for BinanceMarkPrice model."""
-
-    def test_parse_valid_response(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "markPrice": "45000.00",
-            "indexPrice": "44999.50",
-            "lastFundingRate": "0.00010000",
-            "nextFundingTime": 1700000000000,
-        }
-        model = BinanceMarkPrice.model_validate(data)
-        assert model.markPrice == Decimal("45000.00")
-
-    def test_parse_with_optional_fields(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "markPrice": "45000.00",
-            "indexPrice": "44999.50",
-            "lastFundingRate": "0.00010000",
-            "nextFundingTime": 1700000000000,
-            "estimatedSettlePrice": "45001.00",
-            "interestRate": "0.0001",
-            "time": 1699999999999,
-        }
-        model = BinanceMarkPrice.model_validate(data)
-        assert model.estimatedSettlePrice == Decimal("45001.00")
-
-    def test_to_response(self):
-        data = {
-            "symbol": "ETHUSDT",
-            "markPrice": "2500.00",
-            "indexPrice": "2499.50",
-            "lastFundingRate": "0.00005000",
-            "nextFundingTime": 1700000000000,
-        }
-        response = BinanceMarkPrice.model_validate(data).to_response()
-        assert response.mark_price == Decimal("2500.00")
-        assert response.index_price == Decimal("2499.50")
+        response = model.to_response()
+        for field, value in expected_response.items():
+            assert getattr(response, field) == value, field
         assert response.exchange == "binance"
 
-
-class TestBinanceLongShortRatio:
-    """Tests for BinanceLongShortRatio model."""
-
-    def test_parse_valid_response(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "longShortRatio": "1.2500",
-            "longAccount": "0.5556",
-            "shortAccount": "0.4444",
-            "timestamp": 1700000000000,
-        }
-        model = BinanceLongShortRatio.model_validate(data)
-        assert model.longShortRatio == Decimal("1.2500")
-        assert model.longAccount == Decimal("0.5556")
-
-    def test_to_response(self):
-        data = {
-            "symbol": "BTCUSDT",
-            "longShortRatio": "1.2500",
-            "longAccount": "0.5556",
-            "shortAccount": "0.4444",
-            "timestamp": 1700000000000,
-        }
-        response = BinanceLongShortRatio.model_validate(data).to_response()
-        assert response.long_short_ratio == Decimal("1.2500")
-        assert response.long_account == Decimal("0.5556")
-        assert response.short_account == Decimal("0.4444")
-        assert response.exchange == "binance"
+    @pytest.mark.parametrize(
+        ("open_interest", "time"),
+        [
+            ("0", 0),
+            ("0.00000001", 1700000000000),
+            ("12345.678", 1700000000000),
+            ("1E+3", 1700000000000),
+            ("98765432109876.54321000", 4102444800000),
+        ],
+    )
+    def test_open_interest_decimal_roundtrip(self, open_interest, time):
+        """Decimal strings of any shape should reach the response without losing precision."""
+        response = BinanceOpenInterest.model_validate(
+            {"symbol": "BTCUSDT", "openInterest": open_interest, "time": time}
+        ).to_response()
+        # compare digits and exponent, so trailing zeros must be preserved too
+        assert response.open_interest.as_tuple() == Decimal(open_interest).as_tuple()
+        assert response.timestamp == time
+
+
+class TestListAdapters:
+    """Tests for the shared list TypeAdapters."""
+
+    @pytest.mark.parametrize(("adapter", "model_cls", "data"), LIST_ADAPTER_CASES)
+    def test_list_adapter(self, adapter, model_cls, data):
+        """The shared list TypeAdapters should parse rows exactly like model_validate."""
+        rows = adapter.validate_python([data, data])
+        assert rows == [model_cls.model_validate(data)] * 2
 
 
 class TestParseKline:
     """Tests for parse_kline function."""
 
     def test_parse_single_kline(self):
-        data = [
-            [
-                1700000000000,  # open time
-                "45000.00",  # open
-                "45500.00",  # high
-                "44800.00",  # low
-                "45200.00",  # close
-                "1234.567",  # volume
-                1700003600000,  # close time
-                "55555555.00",  # quote volume
-                5000,  # trade count
-                "600.123",  # taker buy base (unused)
-                "27000000.00",  # taker buy quote (unused)
-            ]
-        ]
+        data = [KLINE_ROW]
         result = parse_kline(data, "BTCUSDT", "1h")
         assert result.symbol == "BTCUSDT"
         assert result.interval == "1h"
@@ -247,24 +233,18 @@ class TestParseKline:
         assert len(result.candles) == 1
 
         candle = result.candles[0]
-        assert candle.open == Decimal("45000.00")
-        assert candle.high == Decimal("45500.00")
-        assert candle.low == Decimal("44800.00")
-        assert candle.close == Decimal("45200.00")
-        assert candle.volume == Decimal("1234.567")
+        assert candle.open == KLINE_OPEN
+        assert candle.high == KLINE_HIGH
+        assert candle.low == KLINE_LOW
+        assert candle.close == KLINE_CLOSE
+        assert candle.volume == KLINE_VOLUME
         assert candle.trade_count == 5000
 
-    def test_parse_multiple_klines(self):
-        data = [
-            [1700000000000, "45000", "45100", "44900", "45050", "100", 1700003600000, "4505000", 1000, "50", "2252500"],
-            [1700003600000, "45050", "45200", "45000", "45150", "150", 1700007200000, "6772500", 1500, "75", "3386250"],
-        ]
+    @pytest.mark.parametrize("count", [0, 2, 1000])
+    def test_parse_klines(self, count):
+        data = BULK_KLINES[:count]
         result = parse_kline(data, "BTCUSDT", "1h")
-        assert len(result.candles) == 2
-        assert result.candles[0].open == Decimal("45000")
-        assert result.candles[1].open == Decimal("45050")
-
-    def test_parse_empty_klines(self):
-        result = parse_kline([], "BTCUSDT", "1h")
-        assert len(result.candles) == 0
         assert result.symbol == "BTCUSDT"
+        assert len(result.candles) == count
+        assert [c.open_time for c in result.candles] == [row[0] for row in data]
+        assert all(c.open == KLINE_OPEN for c in result.candles)
@@ -0,0 +1,70 @@
+"""Canned Bybit payloads shared by the client and model tests."""
+
+from types import MappingProxyType
+from typing import Final
+
+TICKER_ITEM: Final = MappingProxyType(
+    {
+        "symbol": "BTCUSDT",
+        "lastPrice": "45000.00",
+        "indexPrice": "44999.50",
+        "markPrice": "45000.10",
+        "prevPrice24h": "44000.00",
+        "price24hPcnt": "0.0227",
+        "highPrice24h": "45500.00",
+        "lowPrice24h": "43500.00",
+        "volume24h": "50000.00",
+        "turnover24h": "2250000000.00",
+        "openInterest": "12345.678",
+        "openInterestValue": "555555555.00",
+        "fundingRate": "0.0001",
+        "nextFundingTime": "1700000000000",
+    }
+)
+TICKER_RESPONSE: Final = MappingProxyType(
+    {
+        "retCode": 0,
+        "retMsg": "OK",
+        "result": MappingProxyType({"category": "linear", "list": (TICKER_ITEM,)}),
+        "time": 1700000000000,
+    }
+)
+KLINE_RESPONSE: Final = MappingProxyType(
+    {
+        "retCode": 0,
+        "retMsg": "OK",
+        "result": MappingProxyType(
+            {
+                "symbol": "BTCUSDT",
+                "category": "linear",
+                # bybit returns in reverse chronological order
+                "list": (
+                    ("1700003600000", "45200.00", "45500.00", "45100.00", "45300.00", "500.00", "22500000.00"),
+                    ("1700000000000", "45000.00", "45200.00", "44800.00", "45200.00", "1234.567", "55555555.00"),
+                ),
+            }
+        ),
+        "time": 1700003600000,
+    }
+)
+LONG_SHORT_RATIO_RESPONSE: Final = MappingProxyType(
+    {
+        "retCode": 0,
+        "retMsg": "OK",
+        "result": MappingProxyType(
+            {
+                "list": (
+                    MappingProxyType(
+                        {
+                            "symbol": "BTCUSDT",
+                            "buyRatio": "0.5556",
+                            "sellRatio": "0.4444",
+                            "timestamp": "1700000000000",
+                        }
+                    ),
+                ),
+            }
+        ),
+        "time": 1700000000000,
+    }
+)
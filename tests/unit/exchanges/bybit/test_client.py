@@ -1,86 +1,80 @@
 """Tests for BybitClient with mocked HTTP responses."""
 
-from datetime import datetime
+import asyncio
+import json
+from datetime import datetime, timezone
 from decimal import Decimal
+from typing import Final
+from unittest.mock import AsyncMock
 
+import httpx
 import pytest
-from pytest_httpx import HTTPXMock
+import pytest_asyncio
 
 from crypto_mcp.exchanges.bybit import BybitClient, BybitAPIError, BybitRateLimitError
 from crypto_mcp.exchanges.bybit.endpoints import BASE_URL
 
-
-@pytest.fixture
-async def client():
-    """Create a BybitClient for testing."""
-    c = BybitClient()
-    yield c
-    await c.close()
-
-
-class TestGetOpenInterest:
-    """Tests for get_open_interest method (uses ticker endpoint)."""
-
-    @pytest.mark.asyncio
-    async def test_success(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/tickers?category=linear&symbol=BTCUSDT",
-            json={
-                "retCode": 0,
-                "retMsg": "OK",
-                "result": {
-                    "category": "linear",
-                    "list": [
-                        {
-                            "symbol": "BTCUSDT",
-                            "lastPrice": "45000.00",
-                            "indexPrice": "44999.50",
-                            "markPrice": "45000.10",
-                            "prevPrice24h": "44000.00",
-                            "price24hPcnt": "0.0227",
-                            "highPrice24h": "45500.00",
-                            "lowPrice24h": "43500.00",
-                            "volume24h": "50000.00",
-                            "turnover24h": "2250000000.00",
-                            "openInterest": "12345.678",
-                            "openInterestValue": "555555555.00",
-                            "fundingRate": "0.0001",
-                            "nextFundingTime": "1700000000000",
-                        }
-                    ],
+from .fixtures import KLINE_RESPONSE, LONG_SHORT_RATIO_RESPONSE, TICKER_RESPONSE
+
+
+# share one client (and its event loop) across the module; responses come
+# from a stateless mock transport, so no test depends on connection state
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+# expected Decimal values, parsed once at import
+OPEN_INTEREST: Final = Decimal("12345.678")
+HISTORY_OPEN_INTEREST: Final = Decimal("12345.0")
+FUNDING_RATE: Final = Decimal("0.00010000")
+LAST_PRICE: Final = Decimal("45000.00")
+MARK_PRICE: Final = Decimal("45000.10")
+INDEX_PRICE: Final = Decimal("44999.50")
+KLINE_HIGH: Final = Decimal("45200.00")
+LONG_ACCOUNT: Final = Decimal("0.5556")
+SHORT_ACCOUNT: Final = Decimal("0.4444")
+MIN_NOTIONAL: Final = Decimal(5)
+
+# time window for the history request with explicit bounds; UTC-aware so
+# the expected milliseconds do not depend on the local timezone
+HISTORY_START: Final = datetime(2024, 1, 1, tzinfo=timezone.utc)
+HISTORY_END: Final = datetime(2024, 1, 2, tzinfo=timezone.utc)
+HISTORY_START_MS: Final = 1704067200000
+HISTORY_END_MS: Final = 1704153600000
+
+
+def _instruments_page(symbol: str, cursor: str) -> dict:
+    """Build one page of the instruments-info response."""
+    return {
+        "retCode": 0,
+        "retMsg": "OK",
+        "result": {
+            "category": "linear",
+            "list": [
+                {
+                    "symbol": symbol,
+                    "baseCoin": symbol.removesuffix("USDT"),
+                    "quoteCoin": "USDT",
+                    "priceScale": "2",
+                    "priceFilter": {"tickSize": "0.10"},
+                    "lotSizeFilter": {"qtyStep": "0.001", "minNotionalValue": "5"},
                 },
-                "time": 1700000000000,
-            },
-        )
-        result = await client.get_open_interest("BTCUSDT")
-        assert result.symbol == "BTCUSDT"
-        assert result.open_interest == Decimal("12345.678")
-        assert result.exchange == "bybit"
-
-    @pytest.mark.asyncio
-    async def test_invalid_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/tickers?category=linear&symbol=INVALID",
-            json={
-                "retCode": 10001,
-                "retMsg": "Invalid symbol",
-                "result": {"category": "linear", "list": []},
-                "time": 1700000000000,
-            },
-        )
-        with pytest.raises(BybitAPIError) as exc_info:
-            await client.get_open_interest("INVALID")
-        assert exc_info.value.code == 10001
-
-
-class TestGetOpenInterestHistory:
-    """Tests for get_open_interest_history method."""
-
-    @pytest.mark.asyncio
-    async def test_success(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/open-interest?category=linear&symbol=BTCUSDT&intervalTime=5min&limit=30",
-            json={
+            ],
+            "nextPageCursor": cursor,
+        },
+        "time": 1700000000000,
+    }
+
+
+# responses keyed by raw request path and query as (status, body), with
+# bodies serialized once at import so serving one is a dict lookup
+ROUTES: Final[dict[bytes, tuple[int, bytes]]] = {
+    path.encode(): (status_code, json.dumps(payload, default=dict).encode())
+    for path, (status_code, payload) in {
+        "/v5/market/tickers?category=linear&symbol=BTCUSDT": (200, TICKER_RESPONSE),
+        "/v5/market/tickers?category=linear": (200, TICKER_RESPONSE),
+        "/v5/market/open-interest?category=linear&symbol=BTCUSDT&intervalTime=5min&limit=30": (
+            200,
+            {
                 "retCode": 0,
                 "retMsg": "OK",
                 "result": {
@@ -94,21 +88,11 @@ class TestGetOpenInterestHistory:
                 },
                 "time": 1700000300000,
             },
-        )
-        result = await client.get_open_interest_history("BTCUSDT", "5m")
-        assert len(result) == 2
-        assert result[0].open_interest == Decimal("12345.0")
-
-    @pytest.mark.asyncio
-    async def test_with_time_params(self, httpx_mock: HTTPXMock, client):
-        start = datetime(2024, 1, 1, 0, 0, 0)
-        end = datetime(2024, 1, 2, 0, 0, 0)
-        start_ms = int(start.timestamp() * 1000)
-        end_ms = int(end.timestamp() * 1000)
-
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/open-interest?category=linear&symbol=BTCUSDT&intervalTime=1h&limit=10&startTime={start_ms}&endTime={end_ms}",
-            json={
+        ),
+        "/v5/market/open-interest?category=linear&symbol=BTCUSDT&intervalTime=1h&limit=10"
+        f"&startTime={HISTORY_START_MS}&endTime={HISTORY_END_MS}": (
+            200,
+            {
                 "retCode": 0,
                 "retMsg": "OK",
                 "result": {
@@ -119,21 +103,10 @@ class TestGetOpenInterestHistory:
                 },
                 "time": 1700000000000,
             },
-        )
-        result = await client.get_open_interest_history(
-            "BTCUSDT", "1h", limit=10, start_time=start, end_time=end
-        )
-        assert result == []
-
-
-class TestGetFundingRate:
-    """Tests for get_funding_rate method."""
-
-    @pytest.mark.asyncio
-    async def test_success_with_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/funding/history?category=linear&symbol=BTCUSDT&limit=100",
-            json={
+        ),
+        "/v5/market/funding/history?category=linear&symbol=BTCUSDT&limit=100": (
+            200,
+            {
                 "retCode": 0,
                 "retMsg": "OK",
                 "result": {
@@ -148,258 +121,200 @@ class TestGetFundingRate:
                 },
                 "time": 1700000000000,
             },
-        )
-        result = await client.get_funding_rate(symbol="BTCUSDT")
-        assert len(result) == 1
-        assert result[0].funding_rate == Decimal("0.00010000")
+        ),
+        "/v5/market/kline?category=linear&symbol=BTCUSDT&interval=60&limit=500": (200, KLINE_RESPONSE),
+        "/v5/market/account-ratio?category=linear&symbol=BTCUSDT&period=5min&limit=30": (200, LONG_SHORT_RATIO_RESPONSE),
+        "/v5/market/instruments-info?category=linear&limit=1000": (
+            200,
+            _instruments_page("BTCUSDT", "page2"),
+        ),
+        "/v5/market/instruments-info?category=linear&limit=1000&cursor=page2": (
+            200,
+            _instruments_page("ETHUSDT", ""),
+        ),
+        # error cases, each on its own symbol
+        "/v5/market/tickers?category=linear&symbol=INVALID": (
+            200,
+            {
+                "retCode": 10001,
+                "retMsg": "Invalid symbol",
+                "result": {"category": "linear", "list": []},
+                "time": 1700000000000,
+            },
+        ),
+        "/v5/market/tickers?category=linear&symbol=RATELIMITED": (
+            200,
+            {"retCode": 10006, "retMsg": "Too many requests."},
+        ),
+        "/v5/market/tickers?category=linear&symbol=BODYERROR": (
+            200,
+            {"retCode": 10001, "retMsg": "Invalid parameter."},
+        ),
+    }.items()
+}
+ROUTES[b"/v5/market/tickers?category=linear&symbol=SERVERERROR"] = (
+    500,
+    b"Internal Server Error",
+)
 
-    @pytest.mark.asyncio
-    async def test_without_symbol_returns_empty(self, client):
-        # bybit requires symbol for funding rate, returns empty if none
-        result = await client.get_funding_rate()
-        assert result == []
 
+def _dispatch(request: httpx.Request) -> httpx.Response:
+    """Serve the canned response for the requested path and query."""
+    status_code, content = ROUTES[request.url.raw_path]
+    return httpx.Response(status_code, content=content)
 
-class TestGetTicker24h:
-    """Tests for get_ticker_24h method."""
 
-    @pytest.mark.asyncio
-    async def test_single_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/tickers?category=linear&symbol=BTCUSDT",
-            json={
-                "retCode": 0,
-                "retMsg": "OK",
-                "result": {
-                    "category": "linear",
-                    "list": [
-                        {
-                            "symbol": "BTCUSDT",
-                            "lastPrice": "45000.00",
-                            "indexPrice": "44999.50",
-                            "markPrice": "45000.10",
-                            "prevPrice24h": "44000.00",
-                            "price24hPcnt": "0.0227",
-                            "highPrice24h": "45500.00",
-                            "lowPrice24h": "43500.00",
-                            "volume24h": "50000.00",
-                            "turnover24h": "2250000000.00",
-                            "openInterest": "12345.678",
-                            "openInterestValue": "555555555.00",
-                            "fundingRate": "0.0001",
-                            "nextFundingTime": "1700000000000",
-                        }
-                    ],
-                },
-                "time": 1700000000000,
-            },
-        )
-        result = await client.get_ticker_24h(symbol="BTCUSDT")
+TRANSPORT: Final = httpx.MockTransport(_dispatch)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def client():
+    """Create a BybitClient shared by the tests in this module."""
+    async with httpx.AsyncClient(base_url=BASE_URL, transport=TRANSPORT) as http:
+        yield BybitClient(http)
+
+
+class TestGetOpenInterest:
+    """Tests for get_open_interest method (uses ticker endpoint)."""
+
+    async def test_invalid_symbol(self, client):
+        with pytest.raises(BybitAPIError) as exc_info:
+            await client.get_open_interest("INVALID")
+        assert exc_info.value.code == 10001
+
+
+class TestTickerEndpoint:
+    """Tests for the methods served by the shared tickers endpoint."""
+
+    @pytest.mark.parametrize(
+        ("method", "expected"),
+        [
+            pytest.param(
+                "get_open_interest", {"open_interest": OPEN_INTEREST}, id="open_interest"
+            ),
+            pytest.param("get_ticker_24h", {"last_price": LAST_PRICE}, id="ticker_24h"),
+            pytest.param(
+                "get_mark_price",
+                {"mark_price": MARK_PRICE, "index_price": INDEX_PRICE},
+                id="mark_price",
+            ),
+        ],
+    )
+    async def test_single_symbol(self, client, method, expected):
+        result = await getattr(client, method)(symbol="BTCUSDT")
         assert result.symbol == "BTCUSDT"
-        assert result.last_price == Decimal("45000.00")
+        assert result.exchange == "bybit"
+        for field, value in expected.items():
+            assert getattr(result, field) == value, field
 
-    @pytest.mark.asyncio
-    async def test_all_symbols(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/tickers?category=linear",
-            json={
-                "retCode": 0,
-                "retMsg": "OK",
-                "result": {
-                    "category": "linear",
-                    "list": [
-                        {
-                            "symbol": "BTCUSDT",
-                            "lastPrice": "45000.00",
-                            "indexPrice": "44999.50",
-                            "markPrice": "45000.10",
-                            "prevPrice24h": "44000.00",
-                            "price24hPcnt": "0.0227",
-                            "highPrice24h": "45500.00",
-                            "lowPrice24h": "43500.00",
-                            "volume24h": "50000.00",
-                            "turnover24h": "2250000000.00",
-                            "openInterest": "12345.678",
-                            "openInterestValue": "555555555.00",
-                            "fundingRate": "0.0001",
-                            "nextFundingTime": "1700000000000",
-                        }
-                    ],
-                },
-                "time": 1700000000000,
-            },
-        )
-        result = await client.get_ticker_24h()
+    @pytest.mark.parametrize("method", ["get_ticker_24h", "get_mark_price"])
+    async def test_all_symbols(self, client, method):
+        result = await getattr(client, method)()
         assert isinstance(result, list)
         assert len(result) == 1
 
 
+class TestGetOpenInterestHistory:
+    """Tests for get_open_interest_history method."""
+
+    async def test_success(self, client):
+        result = await client.get_open_interest_history("BTCUSDT", "5m")
+        assert len(result) == 2
+        assert result[0].open_interest == HISTORY_OPEN_INTEREST
+
+    async def test_with_time_params(self, client):
+        result = await client.get_open_interest_history(
+            "BTCUSDT", "1h", limit=10, start_time=HISTORY_START, end_time=HISTORY_END
+        )
+        assert result == []
+
+
+class TestGetFundingRate:
+    """Tests for get_funding_rate method."""
+
+    async def test_success_with_symbol(self, client):
+        result = await client.get_funding_rate(symbol="BTCUSDT")
+        assert len(result) == 1
+        assert result[0].funding_rate == FUNDING_RATE
+
+    async def test_without_symbol_returns_empty(self, client):
+        # bybit requires symbol for funding rate, returns empty if none
+        result = await client.get_funding_rate()
+        assert result == []
+
+
 class TestGetKlines:
     """Tests for get_klines method."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/kline?category=linear&symbol=BTCUSDT&interval=60&limit=500",
-            json={
-                "retCode": 0,
-                "retMsg": "OK",
-                "result": {
-                    "symbol": "BTCUSDT",
-                    "category": "linear",
-                    "list": [
-                        # bybit returns in reverse chronological order
-                        ["1700003600000", "45200.00", "45500.00", "45100.00", "45300.00", "500.00", "22500000.00"],
-                        ["1700000000000", "45000.00", "45200.00", "44800.00", "45200.00", "1234.567", "55555555.00"],
-                    ],
-                },
-                "time": 1700003600000,
-            },
-        )
+    async def test_success(self, client):
         result = await client.get_klines("BTCUSDT", "1h")
         assert result.symbol == "BTCUSDT"
         assert result.interval == "1h"
         assert len(result.candles) == 2
         # should be reversed to chronological order
         assert result.candles[0].open_time == 1700000000000
-        assert result.candles[0].high == Decimal("45200.00")
+        assert result.candles[0].high == KLINE_HIGH
         assert result.exchange == "bybit"
 
 
-class TestGetMarkPrice:
-    """Tests for get_mark_price method."""
-
-    @pytest.mark.asyncio
-    async def test_single_symbol(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/tickers?category=linear&symbol=BTCUSDT",
-            json={
-                "retCode": 0,
-                "retMsg": "OK",
-                "result": {
-                    "category": "linear",
-                    "list": [
-                        {
-                            "symbol": "BTCUSDT",
-                            "lastPrice": "45000.00",
-                            "indexPrice": "44999.50",
-                            "markPrice": "45000.10",
-                            "prevPrice24h": "44000.00",
-                            "price24hPcnt": "0.0227",
-                            "highPrice24h": "45500.00",
-                            "lowPrice24h": "43500.00",
-                            "volume24h": "50000.00",
-                            "turnover24h": "2250000000.00",
-                            "openInterest": "12345.678",
-                            "openInterestValue": "555555555.00",
-                            "fundingRate": "0.0001",
-                            "nextFundingTime": "1700000000000",
-                        }
-                    ],
-                },
-                "time": 1700000000000,
-            },
-        )
-        result = await client.get_mark_price(symbol="BTCUSDT")
-        assert result.symbol == "BTCUSDT"
-        assert result.mark_price == Decimal("45000.10")
-        assert result.index_price == Decimal("44999.50")
-
-    @pytest.mark.asyncio
-    async def test_all_symbols(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/tickers?category=linear",
-            json={
-                "retCode": 0,
-                "retMsg": "OK",
-                "result": {
-                    "category": "linear",
-                    "list": [
-                        {
-                            "symbol": "BTCUSDT",
-                            "lastPrice": "45000.00",
-                            "indexPrice": "44999.50",
-                            "markPrice": "45000.10",
-                            "prevPrice24h": "44000.00",
-                            "price24hPcnt": "0.0227",
-                            "highPrice24h": "45500.00",
-                            "lowPrice24h": "43500.00",
-                            "volume24h": "50000.00",
-                            "turnover24h": "2250000000.00",
-                            "openInterest": "12345.678",
-                            "openInterestValue": "555555555.00",
-                            "fundingRate": "0.0001",
-                            "nextFundingTime": "1700000000000",
-                        }
-                    ],
-                },
-                "time": 1700000000000,
-            },
-        )
-        result = await client.get_mark_price()
-        assert isinstance(result, list)
-
-
 class TestGetLongShortRatio:
     """Tests for get_long_short_ratio method."""
 
-    @pytest.mark.asyncio
-    async def test_success(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/account-ratio?category=linear&symbol=BTCUSDT&period=5min&limit=30",
-            json={
-                "retCode": 0,
-                "retMsg": "OK",
-                "result": {
-                    "list": [
-                        {
-                            "symbol": "BTCUSDT",
-                            "buyRatio": "0.5556",
-                            "sellRatio": "0.4444",
-                            "timestamp": "1700000000000",
-                        },
-                    ],
-                },
-                "time": 1700000000000,
-            },
-        )
+    async def test_success(self, client):
         result = await client.get_long_short_ratio("BTCUSDT", "5m")
         assert len(result) == 1
-        assert result[0].long_account == Decimal("0.5556")
-        assert result[0].short_account == Decimal("0.4444")
+        assert result[0].long_account == LONG_ACCOUNT
+        assert result[0].short_account == SHORT_ACCOUNT
+
+
+class TestGetExchangeInfo:
+    """Tests for get_exchange_info method."""
+
+    async def test_follows_page_cursor(self, client):
+        result = await client.get_exchange_info()
+        assert [info.symbol for info in result] == ["BTCUSDT", "ETHUSDT"]
+        assert result[0].quantity_precision == 3
+        assert result[0].min_notional == MIN_NOTIONAL
+
+    async def test_stops_on_repeated_page_cursor(self):
+        requests = []
+
+        def stuck(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json=_instruments_page("BTCUSDT", "stuck"))
+
+        transport = httpx.MockTransport(stuck)
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=transport) as http:
+            result = await BybitClient(http).get_exchange_info()
+
+        assert len(requests) == 2
+        assert [info.symbol for info in result] == ["BTCUSDT", "BTCUSDT"]
 
 
 class TestErrorHandling:
     """Tests for error handling."""
 
-    @pytest.mark.asyncio
-    async def test_rate_limit_error(self, httpx_mock: HTTPXMock, client):
-        # need to mock 3 responses because the client retries 3 times
-        for _ in range(3):
-            httpx_mock.add_response(
-                url=f"{BASE_URL}/v5/market/tickers?category=linear&symbol=BTCUSDT",
-                json={"retCode": 10006, "retMsg": "Too many requests."},
-            )
+    async def test_rate_limit_error(self, client, monkeypatch):
+        # skip the real 1s + 2s backoff between the three attempts
+        monkeypatch.setattr(asyncio, "sleep", AsyncMock())
         with pytest.raises(BybitRateLimitError):
-            await client.get_open_interest("BTCUSDT")
-
-    @pytest.mark.asyncio
-    async def test_api_error_in_response_body(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/tickers?category=linear&symbol=BTCUSDT",
-            json={"retCode": 10001, "retMsg": "Invalid parameter."},
-        )
+            await client.get_open_interest("RATELIMITED")
+
+    async def test_rate_limit_backoff_delays(self, monkeypatch):
+        sleep = AsyncMock()
+        monkeypatch.setattr(asyncio, "sleep", sleep)
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=TRANSPORT) as http:
+            client = BybitClient(http, max_retries=4)
+            with pytest.raises(BybitRateLimitError):
+                await client.get_open_interest("RATELIMITED")
+        assert [c.args[0] for c in sleep.await_args_list] == [1.0, 2.0, 4.0]
+
+    async def test_api_error_in_response_body(self, client):
         with pytest.raises(BybitAPIError) as exc_info:
-            await client.get_open_interest("BTCUSDT")
+            await client.get_open_interest("BODYERROR")
         assert exc_info.value.code == 10001
 
-    @pytest.mark.asyncio
-    async def test_http_error_non_json(self, httpx_mock: HTTPXMock, client):
-        httpx_mock.add_response(
-            url=f"{BASE_URL}/v5/market/tickers?category=linear&symbol=BTCUSDT",
-            status_code=500,
-            text="Internal Server Error",
-        )
+    async def test_http_error_non_json(self, client):
         with pytest.raises(BybitAPIError) as exc_info:
-            await client.get_open_interest("BTCUSDT")
+            await client.get_open_interest("SERVERERROR")
         assert exc_info.value.code == 500
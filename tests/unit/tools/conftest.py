@@ -0,0 +1,48 @@
+"""Shared fixtures for MCP tool tests."""
+
+from collections.abc import Callable
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from ..._stubs import StubExchangeClient
+
+
+@pytest.fixture(scope="session")
+def mock_client():
+    """Create a stub exchange client shared by all tool tests."""
+    return StubExchangeClient()
+
+
+@pytest.fixture(scope="session")
+def mock_clients(mock_client):
+    """Create clients dict with mock client."""
+    return {"binance": mock_client, "bybit": mock_client}
+
+
+@pytest.fixture(scope="session")
+def mcp_factory(mock_clients) -> Callable[[Callable], FastMCP]:
+    """Return a factory registering each tool group on a FastMCP once."""
+    servers: dict[str, FastMCP] = {}
+
+    def factory(register_fn: Callable) -> FastMCP:
+        mcp = servers.get(register_fn.__name__)
+        if mcp is None:
+            mcp = FastMCP("test-crypto")
+            register_fn(mcp, mock_clients)
+            servers[register_fn.__name__] = mcp
+        return mcp
+
+    return factory
+
+
+@pytest.fixture(scope="module")
+def tool_fn(mcp_with_tools, request):
+    """Return the function of the tool named by the module's TOOL_NAME."""
+    return mcp_with_tools._tool_manager._tools[request.module.TOOL_NAME].fn
+
+
+@pytest.fixture(autouse=True)
+def reset_mock_client(mock_client):
+    """Clear calls and return values left by the previous test."""
+    mock_client.reset()
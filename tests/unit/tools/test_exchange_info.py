@@ -0,0 +1,113 @@
+"""Tests for exchange info MCP tools."""
+
+import functools
+from decimal import Decimal
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+
+from crypto_mcp.exceptions import SymbolNotFoundError
+from crypto_mcp.models import ExchangeInfoResponse
+from crypto_mcp.tools.exchange_info import register_exchange_info_tools
+
+TOOL_NAME = "get_exchange_info"
+
+
+@pytest.fixture
+def mcp_with_tools(mock_clients):
+    """Create FastMCP instance with exchange info tools registered.
+
+    Function-scoped: the tool keeps a per-exchange symbol snapshot.
+    """
+    mcp = FastMCP("test-crypto")
+    register_exchange_info_tools(mcp, mock_clients)
+    return mcp
+
+
+@pytest.fixture
+def tool_fn(mcp_with_tools):
+    """Return the tool function of this test's FastMCP instance."""
+    return mcp_with_tools._tool_manager._tools[TOOL_NAME].fn
+
+
+def make_exchange_info_response(symbol: str = "BTCUSDT") -> ExchangeInfoResponse:
+    """Create a sample ExchangeInfoResponse."""
+    return ExchangeInfoResponse(
+        symbol=symbol,
+        price_precision=2,
+        quantity_precision=3,
+        base_asset=symbol.removesuffix("USDT"),
+        quote_asset="USDT",
+        tick_size=Decimal("0.10"),
+        step_size=Decimal("0.001"),
+        min_notional=Decimal(5),
+        exchange="binance",
+    )
+
+
+@pytest.fixture(scope="module")
+def exchange_info_factory():
+    """Return make_exchange_info_response memoized per symbol."""
+    return functools.lru_cache(maxsize=None)(make_exchange_info_response)
+
+
+class TestGetExchangeInfo:
+    """Tests for get_exchange_info tool."""
+
+    async def test_single_symbol(self, mock_client, tool_fn, exchange_info_factory):
+        mock_client.get_exchange_info.return_value = [
+            exchange_info_factory("BTCUSDT"),
+            exchange_info_factory("ETHUSDT"),
+        ]
+
+        result = await tool_fn(symbol="btcusdt")
+
+        assert isinstance(result, dict)
+        assert result["symbol"] == "BTCUSDT"
+        assert result["tick_size"] == "0.10"
+        assert result["step_size"] == "0.001"
+        assert result["min_notional"] == "5"
+
+    async def test_all_symbols(self, mock_client, tool_fn, exchange_info_factory):
+        mock_client.get_exchange_info.return_value = [
+            exchange_info_factory("BTCUSDT"),
+            exchange_info_factory("ETHUSDT"),
+        ]
+
+        result = await tool_fn(symbol=None)
+
+        assert isinstance(result, list)
+        assert [info["symbol"] for info in result] == ["BTCUSDT", "ETHUSDT"]
+
+    async def test_symbols_share_one_fetch(self, mock_client, tool_fn, exchange_info_factory):
+        mock_client.get_exchange_info.return_value = [
+            exchange_info_factory("BTCUSDT"),
+            exchange_info_factory("ETHUSDT"),
+        ]
+
+        await tool_fn(symbol="BTCUSDT")
+        await tool_fn(symbol="ETHUSDT")
+        await tool_fn(symbol=None)
+
+        mock_client.get_exchange_info.assert_called_once_with()
+
+    async def test_refetches_after_ttl(self, mock_client, mock_clients, exchange_info_factory):
+        mock_client.get_exchange_info.return_value = [
+            exchange_info_factory("BTCUSDT"),
+        ]
+        mcp = FastMCP("test-crypto")
+        register_exchange_info_tools(mcp, mock_clients, ttl=0)
+
+        tool_fn = mcp._tool_manager._tools[TOOL_NAME].fn
+        await tool_fn(symbol="BTCUSDT")
+        await tool_fn(symbol="BTCUSDT")
+
+        assert mock_client.get_exchange_info.call_count == 2
+
+    async def test_unknown_symbol(self, mock_client, tool_fn, exchange_info_factory):
+        mock_client.get_exchange_info.return_value = [
+            exchange_info_factory("BTCUSDT"),
+        ]
+
+        with pytest.raises(SymbolNotFoundError):
+            await tool_fn(symbol="FOOUSDT")
@@ -1,50 +1,43 @@
 """Tests for open interest MCP tools."""
 
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from mcp.server.fastmcp import FastMCP
 
 from crypto_mcp.models import OpenInterestResponse
 from crypto_mcp.tools.open_interest import register_open_interest_tools
 
+TOOL_NAME = "get_open_interest"
 
-@pytest.fixture
-def mock_client():
-    """Create a mock exchange client."""
-    client = MagicMock()
-    client.get_open_interest = AsyncMock()
-    return client
 
+@pytest.fixture(scope="module")
+def mcp_with_tools(mcp_factory):
+    """Return the shared FastMCP with these tools registered."""
+    return mcp_factory(register_open_interest_tools)
 
-@pytest.fixture
-def mock_clients(mock_client):
-    """Create clients dict with mock client."""
-    return {"binance": mock_client, "bybit": mock_client}
 
+# mock return values, built once at import and shared by reference
+BTC_OPEN_INTEREST = OpenInterestResponse(
+    symbol="BTCUSDT",
+    open_interest=Decimal("12345.678"),
+    timestamp=1700000000000,
+    exchange="binance",
+)
 
-@pytest.fixture
-def mcp_with_tools(mock_clients):
-    """Create FastMCP instance with open interest tools registered."""
-    mcp = FastMCP("test-crypto")
-    register_open_interest_tools(mcp, mock_clients)
-    return mcp
+ETH_OPEN_INTEREST = OpenInterestResponse(
+    symbol="ETHUSDT",
+    open_interest=Decimal("500000.0"),
+    timestamp=1700001000000,
+    exchange="binance",
+)
 
 
 class TestGetOpenInterest:
     """Tests for get_open_interest tool."""
 
-    @pytest.mark.asyncio
-    async def test_calls_client_with_uppercase_symbol(self, mock_client, mcp_with_tools):
-        mock_client.get_open_interest.return_value = OpenInterestResponse(
-            symbol="BTCUSDT",
-            open_interest=Decimal("12345.678"),
-            timestamp=1700000000000,
-            exchange="binance",
-        )
+    async def test_calls_client_with_uppercase_symbol(self, mock_client, tool_fn):
+        mock_client.get_open_interest.return_value = BTC_OPEN_INTEREST
 
-        tool_fn = mcp_with_tools._tool_manager._tools["get_open_interest"].fn
         result = await tool_fn(symbol="btcusdt")
 
         mock_client.get_open_interest.assert_called_once_with("BTCUSDT")
@@ -53,38 +46,24 @@ class TestGetOpenInterest:
         assert result["open_interest"] == "12345.678"
         assert result["exchange"] == "binance"
 
-    @pytest.mark.asyncio
-    async def test_returns_correct_structure(self, mock_client, mcp_with_tools):
-        mock_client.get_open_interest.return_value = OpenInterestResponse(
-            symbol="ETHUSDT",
-            open_interest=Decimal("500000.0"),
-            timestamp=1700001000000,
-            exchange="binance",
-        )
+    async def test_returns_correct_structure(self, mock_client, tool_fn):
+        mock_client.get_open_interest.return_value = ETH_OPEN_INTEREST
 
-        tool_fn = mcp_with_tools._tool_manager._tools["get_open_interest"].fn
         result = await tool_fn(symbol="ETHUSDT")
 
-        assert "symbol" in result
-        assert "open_interest" in result
-        assert "timestamp" in result
-        assert "exchange" in result
+        assert result.keys() >= {"symbol", "open_interest", "timestamp", "exchange"}
 
-    @pytest.mark.asyncio
-    async def test_tool_is_registered(self, mcp_with_tools):
-        """Verify the tool is properly registered with FastMCP."""
-        assert "get_open_interest" in mcp_with_tools._tool_manager._tools
+    async def test_batch_rows_pass_output_validation(self, mock_client, mcp_with_tools):
+        """Batch rows must stay plain dicts to satisfy the dict[str, dict] schema."""
+        async def mock_oi(symbol):
+            # reuse the parsed BTC row; model_copy skips validation
+            return BTC_OPEN_INTEREST.model_copy(update={"symbol": symbol})
 
-    @pytest.mark.asyncio
-    async def test_propagates_client_errors(self, mock_client, mcp_with_tools):
-        """Verify errors from client are propagated."""
-        from crypto_mcp.exchanges.binance import BinanceAPIError
+        mock_client.get_open_interest.side_effect = mock_oi
 
-        mock_client.get_open_interest.side_effect = BinanceAPIError(
-            "Invalid symbol", code=-1121
+        _, structured = await mcp_with_tools.call_tool(
+            "get_open_interest_batch", {"symbols": ["btcusdt", "ethusdt"]}
         )
 
-        tool_fn = mcp_with_tools._tool_manager._tools["get_open_interest"].fn
-
-        with pytest.raises(BinanceAPIError):
-            await tool_fn(symbol="INVALID")
+        assert structured["BTCUSDT"]["open_interest"] == "12345.678"
+        assert structured["ETHUSDT"]["symbol"] == "ETHUSDT"
@@ -1,35 +1,20 @@
 """Tests for 24h ticker MCP tools."""
 
+import functools
 from decimal import Decimal
-from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from mcp.server.fastmcp import FastMCP
 
 from crypto_mcp.models import TickerResponse
 from crypto_mcp.tools.ticker import register_ticker_tools
 
+TOOL_NAME = "get_ticker_24h"
 
-@pytest.fixture
-def mock_client():
-    """Create a mock exchange client."""
-    client = MagicMock()
-    client.get_ticker_24h = AsyncMock()
-    return client
 
-
-@pytest.fixture
-def mock_clients(mock_client):
-    """Create clients dict with mock client."""
-    return {"binance": mock_client, "bybit": mock_client}
-
-
-@pytest.fixture
-def mcp_with_tools(mock_clients):
-    """Create FastMCP instance with ticker tools registered."""
-    mcp = FastMCP("test-crypto")
-    register_ticker_tools(mcp, mock_clients)
-    return mcp
+@pytest.fixture(scope="module")
+def mcp_with_tools(mcp_factory):
+    """Return the shared FastMCP with these tools registered."""
+    return mcp_factory(register_ticker_tools)
 
 
 def make_ticker_response(symbol: str = "BTCUSDT") -> TickerResponse:
@@ -51,14 +36,18 @@ def make_ticker_response(symbol: str = "BTCUSDT") -> TickerResponse:
     )
 
 
+@pytest.fixture(scope="module")
+def ticker_factory():
+    """Return make_ticker_response memoized per symbol."""
+    return functools.lru_cache(maxsize=None)(make_ticker_response)
+
+
 class TestGetTicker24h:
     """Tests for get_ticker_24h tool."""
 
-    @pytest.mark.asyncio
-    async def test_single_symbol(self, mock_client, mcp_with_tools):
-        mock_client.get_ticker_24h.return_value = make_ticker_response("BTCUSDT")
+    async def test_single_symbol(self, mock_client, tool_fn, ticker_factory):
+        mock_client.get_ticker_24h.return_value = ticker_factory("BTCUSDT")
 
-        tool_fn = mcp_with_tools._tool_manager._tools["get_ticker_24h"].fn
         result = await tool_fn(symbol="btcusdt")
 
         mock_client.get_ticker_24h.assert_called_once_with("BTCUSDT")
@@ -68,21 +57,15 @@ class TestGetTicker24h:
         assert result["price_change"] == "1000.50"
         assert result["volume"] == "50000.00"
 
-    @pytest.mark.asyncio
-    async def test_all_symbols(self, mock_client, mcp_with_tools):
+    async def test_all_symbols(self, mock_client, tool_fn, ticker_factory):
         mock_client.get_ticker_24h.return_value = [
-            make_ticker_response("BTCUSDT"),
-            make_ticker_response("ETHUSDT"),
+            ticker_factory("BTCUSDT"),
+            ticker_factory("ETHUSDT"),
         ]
 
-        tool_fn = mcp_with_tools._tool_manager._tools["get_ticker_24h"].fn
         result = await tool_fn(symbol=None)
 
         mock_client.get_ticker_24h.assert_called_once_with(None)
 
         assert isinstance(result, list)
         assert len(result) == 2
-
-    @pytest.mark.asyncio
-    async def test_tool_is_registered(self, mcp_with_tools):
-        assert "get_ticker_24h" in mcp_with_tools._tool_manager._tools
@@ -0,0 +1,64 @@
+"""Behaviour shared by every symbol-based MCP tool, table-driven."""
+
+import pytest
+
+from crypto_mcp.exchanges.binance import BinanceAPIError
+from crypto_mcp.tools.exchange_info import register_exchange_info_tools
+from crypto_mcp.tools.funding_rate import register_funding_rate_tools
+from crypto_mcp.tools.klines import register_klines_tools
+from crypto_mcp.tools.long_short_ratio import register_long_short_ratio_tools
+from crypto_mcp.tools.mark_price import register_mark_price_tools
+from crypto_mcp.tools.open_interest import register_open_interest_tools
+from crypto_mcp.tools.open_interest_history import (
+    register_open_interest_history_tools,
+)
+from crypto_mcp.tools.ticker import register_ticker_tools
+
+# (register function, tool name, client method it awaits, required extra args)
+TOOLS = [
+    (register_exchange_info_tools, "get_exchange_info", "get_exchange_info", {}),
+    (register_funding_rate_tools, "get_funding_rate", "get_funding_rate", {}),
+    (register_klines_tools, "get_klines", "get_klines", {"interval": "1h"}),
+    (
+        register_long_short_ratio_tools,
+        "get_long_short_ratio",
+        "get_long_short_ratio",
+        {"period": "1h"},
+    ),
+    (register_mark_price_tools, "get_mark_price", "get_mark_price", {}),
+    (register_open_interest_tools, "get_open_interest", "get_open_interest", {}),
+    (
+        register_open_interest_history_tools,
+        "get_open_interest_history",
+        "get_open_interest_history",
+        {"period": "1h"},
+    ),
+    (register_ticker_tools, "get_ticker_24h", "get_ticker_24h", {}),
+]
+
+TOOL_IDS = [tool_name for _, tool_name, _, _ in TOOLS]
+TOOL_PARAMS = ("register_fn", "tool_name", "client_method", "extra_kwargs")
+
+
+class TestSymbolTools:
+    """Tests run against every symbol-based tool."""
+
+    @pytest.mark.parametrize(TOOL_PARAMS, TOOLS, ids=TOOL_IDS)
+    def test_tool_is_registered(
+        self, mcp_factory, register_fn, tool_name, client_method, extra_kwargs
+    ):
+        assert tool_name in mcp_factory(register_fn)._tool_manager._tools
+
+    @pytest.mark.parametrize(TOOL_PARAMS, TOOLS, ids=TOOL_IDS)
+    async def test_propagates_client_errors(
+        self, mcp_factory, mock_client, register_fn, tool_name, client_method, extra_kwargs
+    ):
+        """Errors raised by the exchange client reach the caller unchanged."""
+        error = BinanceAPIError("Invalid symbol", code=-1121)
+        getattr(mock_client, client_method).side_effect = error
+        tool_fn = mcp_factory(register_fn)._tool_manager._tools[tool_name].fn
+
+        with pytest.raises(BinanceAPIError) as exc_info:
+            await tool_fn(symbol="INVALID", **extra_kwargs)
+
+        assert exc_info.value is error
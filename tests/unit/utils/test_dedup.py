@@ -0,0 +1,134 @@
+"""Tests for the in-flight request deduplicator."""
+
+import asyncio
+
+import pytest
+
+from crypto_mcp.utils.dedup import RequestDeduplicator
+
+
+class TestRequestDeduplicator:
+    """Tests for RequestDeduplicator."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_same_key_runs_once(self):
+        """Concurrent calls for the same key should share one upstream call."""
+        dedup = RequestDeduplicator()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "result"
+
+        results = await asyncio.gather(*[dedup.run("BTCUSDT", fetch) for _ in range(5)])
+
+        assert calls == 1
+        assert results == ["result"] * 5
+
+    @pytest.mark.asyncio
+    async def test_different_keys_run_separately(self):
+        """Different keys should each make their own call."""
+        dedup = RequestDeduplicator()
+        called = []
+
+        def make_fetch(key):
+            async def fetch():
+                called.append(key)
+                await asyncio.sleep(0.01)
+                return key
+            return fetch
+
+        keys = ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+        results = await asyncio.gather(*[dedup.run(k, make_fetch(k)) for k in keys])
+
+        assert results == keys
+        assert sorted(called) == sorted(keys)
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_not_deduplicated(self):
+        """A call after the previous one completed should run again."""
+        dedup = RequestDeduplicator()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await dedup.run("BTCUSDT", fetch) == 1
+        assert await dedup.run("BTCUSDT", fetch) == 2
+
+    @pytest.mark.asyncio
+    async def test_error_propagates_to_all_waiters(self):
+        """All waiters should receive the same exception instance."""
+        dedup = RequestDeduplicator()
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("API Error")
+
+        results = await asyncio.gather(
+            *[dedup.run("BTCUSDT", failing) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        exc0 = results[0]
+        assert isinstance(exc0, ValueError)
+        assert all(r is exc0 for r in results[1:])
+        assert dedup.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_in_flight_cleared_after_completion(self):
+        """In-flight tracking should be empty once calls complete."""
+        dedup = RequestDeduplicator()
+
+        async def fetch():
+            assert dedup.in_flight == 1
+            return "ok"
+
+        await dedup.run("BTCUSDT", fetch)
+
+        assert dedup.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_entry_removed_before_waiters_resume(self):
+        """Waiters should observe no in-flight entry once they get the result."""
+        dedup = RequestDeduplicator()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return "ok"
+
+        async def call_and_check():
+            await dedup.run("BTCUSDT", fetch)
+            return dedup.in_flight
+
+        in_flight_seen = await asyncio.gather(*[call_and_check() for _ in range(3)])
+
+        assert in_flight_seen == [0, 0, 0]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_first_caller_does_not_cancel_request(self):
+        """Cancelling the caller that started the request should not affect peers."""
+        dedup = RequestDeduplicator()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return "ok"
+
+        first = asyncio.create_task(dedup.run("BTCUSDT", fetch))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(dedup.run("BTCUSDT", fetch))
+        await asyncio.sleep(0)
+
+        first.cancel()
+
+        assert await second == "ok"
+        assert first.cancelled()
+        assert calls == 1
+        assert dedup.in_flight == 0
@@ -1,17 +1,44 @@
 """Tests for the sliding window rate limiter."""
 
 import asyncio
-import time
 
 import pytest
 
 from crypto_mcp.utils.rate_limiter import SlidingWindowRateLimiter
 
+_real_sleep = asyncio.sleep
 
+
+class FakeClock:
+    """Monotonic clock that only moves when advanced."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Fake clock; asyncio.sleep advances it instead of waiting."""
+    clock = FakeClock()
+
+    async def sleep(seconds):
+        clock.advance(seconds)
+        await _real_sleep(0)
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    return clock
+
+
+@pytest.mark.asyncio(loop_scope="class")
 class TestSlidingWindowRateLimiter:
     """Tests for SlidingWindowRateLimiter."""
 
-    @pytest.mark.asyncio
     async def test_allows_requests_under_limit(self):
         """Requests under the limit should be allowed immediately."""
         limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=60)
@@ -23,10 +50,9 @@ class TestSlidingWindowRateLimiter:
         assert limiter.current_count == 5
         assert limiter.available_capacity == 5
 
-    @pytest.mark.asyncio
-    async def test_blocks_when_at_limit(self):
+    async def test_blocks_when_at_limit(self, clock):
         """Should block when limit is reached until window expires."""
-        limiter = SlidingWindowRateLimiter(max_requests=3, window_seconds=0.1)
+        limiter = SlidingWindowRateLimiter(max_requests=3, window_seconds=0.1, clock=clock)
 
         # fill up the limit
         for _ in range(3):
@@ -35,18 +61,15 @@ class TestSlidingWindowRateLimiter:
         assert limiter.current_count == 3
         assert limiter.available_capacity == 0
 
-        # next request should wait
-        start = time.monotonic()
-        await limiter.acquire()
-        elapsed = time.monotonic() - start
+        # next request should wait for the oldest to leave the window
+        wait_time = await limiter.acquire()
 
-        # should have waited approximately 0.1 seconds
-        assert elapsed >= 0.05  # allow some tolerance
+        assert wait_time == pytest.approx(0.1)
+        assert clock.now == pytest.approx(0.1)
 
-    @pytest.mark.asyncio
-    async def test_sliding_window_cleanup(self):
+    async def test_sliding_window_cleanup(self, clock):
         """Old requests should be cleaned up after window expires."""
-        limiter = SlidingWindowRateLimiter(max_requests=5, window_seconds=0.1)
+        limiter = SlidingWindowRateLimiter(max_requests=5, window_seconds=0.1, clock=clock)
 
         # make some requests
         for _ in range(3):
@@ -54,13 +77,33 @@ class TestSlidingWindowRateLimiter:
 
         assert limiter.current_count == 3
 
-        # wait for window to expire
-        await asyncio.sleep(0.15)
+        # let the window expire
+        clock.advance(0.15)
 
         assert limiter.current_count == 0
         assert limiter.available_capacity == 5
 
-    @pytest.mark.asyncio
+    async def test_request_expires_at_window_boundary(self, clock):
+        """A request exactly window_seconds old no longer counts."""
+        limiter = SlidingWindowRateLimiter(max_requests=1, window_seconds=1, clock=clock)
+
+        await limiter.acquire()
+        clock.advance(1)
+
+        assert limiter.current_count == 0
+        assert await limiter.acquire() == 0.0
+
+    async def test_request_counts_until_window_boundary(self, clock):
+        """A request just under window_seconds old still counts."""
+        limiter = SlidingWindowRateLimiter(max_requests=1, window_seconds=1, clock=clock)
+
+        await limiter.acquire()
+        clock.advance(0.999)
+
+        assert limiter.current_count == 1
+        assert await limiter.acquire() == pytest.approx(0.001)
+        assert clock.now == pytest.approx(1.0)
+
     async def test_current_usage_percentage(self):
         """current_usage should return correct percentage."""
         limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=60)
@@ -72,7 +115,6 @@ class TestSlidingWindowRateLimiter:
             await limiter.acquire()
         assert limiter.current_usage == 0.5
 
-    @pytest.mark.asyncio
     async def test_reset_clears_all_requests(self):
         """reset() should clear all tracked requests."""
         limiter = SlidingWindowRateLimiter(max_requests=10, window_seconds=60)
@@ -87,7 +129,6 @@ class TestSlidingWindowRateLimiter:
         assert limiter.current_count == 0
         assert limiter.available_capacity == 10
 
-    @pytest.mark.asyncio
     async def test_concurrent_requests(self):
         """Multiple concurrent requests should be handled correctly."""
         limiter = SlidingWindowRateLimiter(max_requests=5, window_seconds=60)
@@ -98,10 +139,9 @@ class TestSlidingWindowRateLimiter:
 
         assert limiter.current_count == 5
 
-    @pytest.mark.asyncio
-    async def test_returns_wait_time(self):
+    async def test_returns_wait_time(self, clock):
         """acquire() should return actual wait time."""
-        limiter = SlidingWindowRateLimiter(max_requests=2, window_seconds=0.1)
+        limiter = SlidingWindowRateLimiter(max_requests=2, window_seconds=0.1, clock=clock)
 
         # first two should not wait
         wait1 = await limiter.acquire()
@@ -109,30 +149,25 @@ class TestSlidingWindowRateLimiter:
         assert wait1 == 0.0
         assert wait2 == 0.0
 
-        # third should wait
+        # third should wait out the rest of the window
+        clock.advance(0.04)
         wait3 = await limiter.acquire()
-        assert wait3 > 0.0
+        assert wait3 == pytest.approx(0.06)
 
-    @pytest.mark.asyncio
-    async def test_high_throughput(self):
+    async def test_high_throughput(self, clock):
         """Should handle high throughput correctly."""
-        limiter = SlidingWindowRateLimiter(max_requests=100, window_seconds=1)
-
-        start = time.monotonic()
+        limiter = SlidingWindowRateLimiter(max_requests=100, window_seconds=1, clock=clock)
 
-        # make 100 requests (should be instant)
-        for _ in range(100):
-            await limiter.acquire()
-
-        first_batch = time.monotonic() - start
+        # 100 concurrent requests fit the window and never wait
+        waits = await asyncio.gather(*[limiter.acquire() for _ in range(100)])
 
-        # next 10 requests should have to wait
-        for _ in range(10):
-            await limiter.acquire()
+        assert waits == [0.0] * 100
+        assert clock.now == 0.0
 
-        total = time.monotonic() - start
+        # next 10 requests should have to wait for the window to slide
+        waits = await asyncio.gather(*[limiter.acquire() for _ in range(10)])
 
-        # first 100 should be fast
-        assert first_batch < 0.5
-        # additional requests should cause waiting
-        assert total > first_batch
+        assert waits[0] == pytest.approx(1.0)
+        assert waits[1:] == [0.0] * 9
+        assert clock.now == pytest.approx(1.0)
+        assert limiter.current_count == 10